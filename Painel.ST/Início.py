@@ -2,6 +2,8 @@ import streamlit as st
 
 import os
 
+from estatais.busca import buscar_empresas
+
 
 
 # 1. CONFIGURAÇÃO DA PÁGINA (Deve ser o primeiro comando)
@@ -130,6 +132,34 @@ st.markdown(page_bg_img, unsafe_allow_html=True)
 
 
 
+# Busca de empresas de todos os estados por nome (aproximada, por trigramas).
+# Com ``live`` a consulta é refeita a cada pausa na digitação, sem esperar o
+# Enter; por estar em um fragmento, só a busca é reexecutada, não a página.
+@st.fragment
+def busca_empresas():
+
+    consulta = st.text_input("🔎 Buscar empresa", placeholder="Nome ou sigla da estatal", key="busca_empresa", live=True)
+
+    if consulta.strip():
+
+        resultados = buscar_empresas(consulta, limite=8)
+
+        if resultados.empty:
+
+            st.caption("Nenhuma empresa encontrada.")
+
+        for emp_id, empresa in resultados.iterrows():
+
+            if st.button(f"{empresa['nome']} ({empresa['Estado']})", key=f"busca_{emp_id}", width="stretch"):
+
+                st.session_state["historico_estado"] = empresa["Estado"]
+
+                st.session_state["historico_empresa"] = int(emp_id)
+
+                st.switch_page("pages/07_Historico_por_empresa.py")
+
+
+
 # 4. SIDEBAR (Logomarcas)
 
 with st.sidebar:
@@ -162,6 +192,14 @@ with st.sidebar:
 
             st.image(logo_fap_path, width=300)
 
+    
+
+    # Busca de empresas por nome (fragmento ``busca_empresas``)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    busca_empresas()
+
 
 
 # 5. TÍTULO E INTRODUÇÃO
@@ -189,7 +227,7 @@ col1, col2 = st.columns(2)
 
 with col1:
 
-    if st.button("1. Quais são as estatais do DF?", use_container_width=True):
+    if st.button("1. Quais são as estatais do DF?", width="stretch"):
 
         # Chama o arquivo limpo no GitHub
 
@@ -197,32 +235,38 @@ with col1:
 
         
 
-    if st.button("2. Como é a governança das empresas?", use_container_width=True):
+    if st.button("2. Como é a governança das empresas?", width="stretch"):
 
         st.switch_page("pages/02_Governanca_das_empresas.py")
 
         
 
-    if st.button("3. Qual o resultado financeiro das estatais?", use_container_width=True):
+    if st.button("3. Qual o resultado financeiro das estatais?", width="stretch"):
 
         st.switch_page("pages/03_Resultado_financeiro_estatais.py")
 
+        
+
+    if st.button("7. Histórico por empresa", width="stretch"):
+
+        st.switch_page("pages/07_Historico_por_empresa.py")
+
 
 
 with col2:
 
-    if st.button("4. Qual o resultado para o Governo do DF?", use_container_width=True):
+    if st.button("4. Qual o resultado para o Governo do DF?", width="stretch"):
 
         st.switch_page("pages/04_Resultado_financeiro_governo_df.py")
 
         
 
-    if st.button("5. Comparativo com outros Estados", use_container_width=True):
+    if st.button("5. Comparativo com outros Estados", width="stretch"):
 
         st.switch_page("pages/05_Comparativo_outros_estados.py")
 
         
 
-    if st.button("6. Boletim das Estatais (Download)", use_container_width=True):
+    if st.button("6. Boletim das Estatais (Download)", width="stretch"):
 
         st.switch_page("pages/06_Boletim_Completo.py")
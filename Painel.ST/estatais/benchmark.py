@@ -0,0 +1,346 @@
+"""Benchmark da execução das páginas do painel, sem navegador.
+
+Cada cenário executa um script do painel (``Início.py`` ou uma das páginas)
+com o ``AppTest`` do Streamlit e, em seguida, uma sequência de interações
+(trocar de aba, mudar filtros, trocar o tipo de gráfico) que reexecutam o
+script como faria um usuário. Para cada cenário são medidos:
+
+- tempo frio: primeira execução com todos os caches vazios (base, índices,
+  cubo, figuras), como logo depois de subir o servidor;
+- tempo quente: mediana de ``--repeticoes`` execuções em sessões novas, com
+  os caches já preenchidos; cada interação é cronometrada da mesma forma;
+- pico de memória: maior volume alocado pelo Python (``tracemalloc``) na
+  execução fria e na quente com as interações, medido em uma passada à
+  parte para não distorcer os tempos;
+- cópias de DataFrame: chamadas a ``DataFrame.copy`` (explícitas ou feitas
+  pelo próprio pandas) na execução quente e em cada interação.
+
+O resultado é um JSON com as versões de Python, pandas e Streamlit, que
+serve de base para as próximas medições: com ``--comparar`` a execução
+atual é mostrada lado a lado com uma base gravada antes e, com
+``--tolerancia``, o comando termina com erro se algum tempo quente piorar
+mais do que o percentual dado.
+
+Uso na linha de comando (a partir de Painel.ST):
+
+    python -m estatais.benchmark [--repeticoes N] [--cenarios 03 05 ...]
+                                 [--salvar benchmarks/base.json]
+                                 [--comparar benchmarks/base.json [--tolerancia 20]]
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from estatais import dados
+from estatais.dados import PASTA_PAINEL
+
+# Versão do formato do JSON gravado
+VERSAO_FORMATO = 1
+
+# Base gravada por padrão com --salvar sem caminho
+ARQUIVO_BASE = os.path.join(PASTA_PAINEL, "benchmarks", "base.json")
+
+# Tempo máximo de cada execução de script (s)
+TEMPO_LIMITE = 300
+
+# Execuções quentes por cenário (a mediana é a medida)
+REPETICOES = 5
+
+
+def widget(tipo, valor, chave=None, rotulo=None):
+    """Interação que muda um widget, encontrado pela chave ou pelo rótulo.
+
+    ``valor`` pode ser uma função do widget atual, para valores que
+    dependem dos dados (por exemplo, os dois últimos anos selecionados).
+    """
+    def interagir(at):
+        if chave is not None:
+            alvo = getattr(at, tipo)(key=chave)
+        else:
+            alvo = next(w for w in getattr(at, tipo) if w.label == rotulo)
+        alvo.set_value(valor(alvo) if callable(valor) else valor)
+    return interagir
+
+
+def aba(chave, titulo):
+    """Interação que abre a aba ``titulo`` de um ``st.tabs`` com ``chave``."""
+    def interagir(at):
+        at.session_state[chave] = titulo
+    return interagir
+
+
+# Interações de cada script (pelo nome do arquivo sem extensão), em ordem:
+# cada uma parte do estado deixado pelas anteriores
+INTERACOES = {
+    "Início": [
+        ("busca por 'brb'", widget("text_input", "brb", chave="busca_empresa")),
+    ],
+    "02_Governanca_das_empresas": [
+        ("comparativo nacional: ano anterior", widget("selectbox", lambda w: w.value - 1, chave="gov_nacional_ano")),
+        ("comparativo nacional: combinações", widget("radio", "Combinações de estruturas", chave="gov_nacional_visao")),
+    ],
+    "03_Resultado_financeiro_estatais": [
+        ("distribuição anual: 2022", aba("aba_distribuicao_ano", "Ano de 2022")),
+        ("aba Evolução", aba("secao_resultado_estatais", "Evolução")),
+        ("aba Lucro × PL", aba("secao_resultado_estatais", "Lucro × Patrimônio Líquido")),
+        ("aba Rentabilidade", aba("secao_resultado_estatais", "Rentabilidade")),
+        ("aba Rentabilidade por setor", aba("secao_resultado_estatais", "Rentabilidade por setor")),
+    ],
+    "04_Resultado_financeiro_governo_df": [
+        ("aba Acumulado por empresa", aba("secao_resultado_governo", "Acumulado por empresa")),
+        ("aba Por setor", aba("secao_resultado_governo", "Por setor")),
+        ("aba Por dependência", aba("secao_resultado_governo", "Por dependência")),
+        ("aba Total anual", aba("secao_resultado_governo", "Total anual")),
+    ],
+    "05_Comparativo_outros_estados": [
+        ("filtro geral: dois últimos anos", widget("multiselect", lambda w: w.value[-2:], rotulo="Selecione os anos:")),
+        ("resultado: último ano", widget("multiselect", lambda w: w.value[-1:], chave="anos_resultado")),
+        ("resultado: Linhas por Estado", widget("radio", "Linhas por Estado", chave="tipo_grafico_resultado")),
+        ("resultado: Barras", widget("radio", "Barras", chave="tipo_grafico_resultado")),
+        ("setor: último ano", widget("multiselect", lambda w: w.value[-1:], chave="anos_resultado_setor")),
+        ("dependência: cinco estados", widget("multiselect", lambda w: w.value[:5], chave="estados_dep")),
+        ("pares: 8 empresas", widget("slider", 8, chave="pares_k")),
+        ("pares: todos os Estados", widget("checkbox", False, chave="pares_outros_estados")),
+    ],
+    "07_Historico_por_empresa": [
+        ("estado SP", widget("selectbox", "SP", chave="historico_estado")),
+        ("uma medida", widget("multiselect", lambda w: w.value[:1], chave="historico_medidas")),
+    ],
+}
+
+
+def scripts_do_painel():
+    """Caminhos de ``Início.py`` e das páginas, na ordem do menu."""
+    paginas = sorted(glob.glob(os.path.join(PASTA_PAINEL, "pages", "*.py")))
+    return [os.path.join(PASTA_PAINEL, "Início.py")] + paginas
+
+
+def nome_cenario(script):
+    return os.path.splitext(os.path.basename(script))[0]
+
+
+def limpar_caches():
+    """Esvazia os caches do Streamlit e do módulo de dados (execução fria).
+
+    O pool de ``estatais.tarefas`` é encerrado ao sair do cache.
+    """
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    dados._hash_arquivo.cache_clear()
+
+
+class ContadorCopias:
+    """Conta as chamadas a ``DataFrame.copy`` enquanto estiver ativo."""
+
+    def __init__(self):
+        self.total = 0
+        self._original = None
+
+    def __enter__(self):
+        original = self._original = pd.DataFrame.copy
+
+        def copy(df, *args, **kwargs):
+            self.total += 1
+            return original(df, *args, **kwargs)
+
+        pd.DataFrame.copy = copy
+        return self
+
+    def __exit__(self, *erro):
+        pd.DataFrame.copy = self._original
+        return False
+
+
+def _executar(at, erros):
+    # Uma execução cronometrada; exceções do script ficam registradas em ``erros``
+    inicio = time.perf_counter()
+    at.run()
+    segundos = time.perf_counter() - inicio
+    erros.extend(e.message for e in at.exception if e.message not in erros)
+    return segundos
+
+
+def nova_sessao(script):
+    """Sessão nova do ``AppTest`` para ``script``, ainda não executada."""
+    return AppTest.from_file(script, default_timeout=TEMPO_LIMITE)
+
+
+def medir_cenario(script, repeticoes=REPETICOES):
+    """Tempos, pico de memória e cópias de DataFrame de um script e suas interações."""
+    interacoes = INTERACOES.get(nome_cenario(script), [])
+    erros = []
+
+    # Execução fria
+    limpar_caches()
+    frio = _executar(nova_sessao(script), erros)
+
+    # Execuções quentes, cada uma em uma sessão nova, seguidas das interações
+    quentes = []
+    tempos_interacoes = {nome: [] for nome, _ in interacoes}
+    for _ in range(repeticoes):
+        at = nova_sessao(script)
+        quentes.append(_executar(at, erros))
+        for nome, interagir in interacoes:
+            interagir(at)
+            tempos_interacoes[nome].append(_executar(at, erros))
+
+    # Passada à parte com tracemalloc (mais lenta): memória e cópias
+    tracemalloc.start()
+    try:
+        limpar_caches()
+        _executar(nova_sessao(script), erros)
+        pico_frio = tracemalloc.get_traced_memory()[1]
+
+        tracemalloc.reset_peak()
+        at = nova_sessao(script)
+        with ContadorCopias() as copias:
+            _executar(at, erros)
+        copias_interacoes = {}
+        for nome, interagir in interacoes:
+            interagir(at)
+            with ContadorCopias() as contador:
+                _executar(at, erros)
+            copias_interacoes[nome] = contador.total
+        pico_quente = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "script": os.path.relpath(script, PASTA_PAINEL),
+        "frio_s": round(frio, 4),
+        "quente_s": round(statistics.median(quentes), 4),
+        "memoria_pico_frio_mb": round(pico_frio / 2**20, 2),
+        "memoria_pico_quente_mb": round(pico_quente / 2**20, 2),
+        "copias_dataframe": copias.total,
+        "interacoes": {
+            nome: {
+                "quente_s": round(statistics.median(tempos_interacoes[nome]), 4),
+                "copias_dataframe": copias_interacoes[nome],
+            }
+            for nome, _ in interacoes
+        },
+        "erros": erros,
+    }
+
+
+def executar(scripts, repeticoes=REPETICOES, progresso=None):
+    """Mede todos os ``scripts`` e devolve o resultado no formato da base."""
+    cenarios = {}
+    for script in scripts:
+        cenarios[nome_cenario(script)] = medir_cenario(script, repeticoes)
+        if progresso is not None:
+            progresso(nome_cenario(script), cenarios[nome_cenario(script)])
+    return {
+        "formato": VERSAO_FORMATO,
+        "momento": datetime.now().isoformat(timespec="seconds"),
+        "ambiente": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "streamlit": st.__version__,
+            "plataforma": platform.platform(),
+            "processadores": os.cpu_count(),
+        },
+        "repeticoes": repeticoes,
+        "cenarios": cenarios,
+    }
+
+
+def tabela_resultado(resultado, base=None):
+    """Uma linha por cenário e interação; com ``base``, a variação (%) de cada medida."""
+    medidas = ["frio_s", "quente_s", "memoria_pico_quente_mb", "copias_dataframe"]
+    linhas = []
+    for cenario, medido in resultado["cenarios"].items():
+        anterior = (base or {}).get("cenarios", {}).get(cenario, {})
+        itens = [((cenario, ""), medido, anterior)]
+        itens += [
+            ((cenario, nome), valores, anterior.get("interacoes", {}).get(nome, {}))
+            for nome, valores in medido["interacoes"].items()
+        ]
+        for (nome, interacao), valores, antes in itens:
+            linha = {"cenario": nome, "interacao": interacao}
+            for medida in medidas:
+                if medida not in valores:
+                    continue
+                linha[medida] = valores[medida]
+                if base is not None and antes.get(medida):
+                    linha[f"{medida} Δ%"] = round((valores[medida] / antes[medida] - 1) * 100, 1)
+            linhas.append(linha)
+    return pd.DataFrame(linhas)
+
+
+def regressoes(resultado, base, tolerancia):
+    """Cenários e interações cujo tempo quente piorou mais que ``tolerancia`` %."""
+    tabela = tabela_resultado(resultado, base)
+    if "quente_s Δ%" not in tabela.columns:
+        return tabela.iloc[0:0]
+    return tabela[tabela["quente_s Δ%"] > tolerancia]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark das páginas do painel com o AppTest do Streamlit.")
+    parser.add_argument("--repeticoes", type=int, default=REPETICOES, help="execuções quentes por cenário")
+    parser.add_argument("--cenarios", nargs="*", help="prefixos dos scripts a medir (padrão: todos)")
+    parser.add_argument("--salvar", nargs="?", const=ARQUIVO_BASE, help="grava o resultado em JSON")
+    parser.add_argument("--comparar", help="JSON de uma base anterior")
+    parser.add_argument("--tolerancia", type=float, help="piora máxima aceita no tempo quente (%%)")
+    args = parser.parse_args(argv)
+
+    # Avisos do Streamlit sobre a execução sem servidor (sem runtime, sem contexto)
+    logging.disable(logging.WARNING)
+
+    scripts = scripts_do_painel()
+    if args.cenarios:
+        scripts = [s for s in scripts if nome_cenario(s).startswith(tuple(args.cenarios))]
+
+    def progresso(nome, medido):
+        print(
+            f"{nome}: frio {medido['frio_s']:.3f} s, quente {medido['quente_s']:.3f} s, "
+            f"pico {medido['memoria_pico_quente_mb']:.1f} MB, {medido['copias_dataframe']} cópias"
+            + (f", {len(medido['erros'])} erro(s)" if medido["erros"] else ""),
+            file=sys.stderr,
+        )
+
+    resultado = executar(scripts, args.repeticoes, progresso)
+
+    base = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            base = json.load(f)
+    with pd.option_context("display.width", 200, "display.max_columns", None, "display.max_colwidth", 40):
+        print(tabela_resultado(resultado, base).to_string(index=False))
+
+    if args.salvar:
+        os.makedirs(os.path.dirname(os.path.abspath(args.salvar)), exist_ok=True)
+        with open(args.salvar, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"Resultado gravado em {args.salvar}", file=sys.stderr)
+
+    falhas = [nome for nome, medido in resultado["cenarios"].items() if medido["erros"]]
+    if falhas:
+        print(f"Scripts com erro: {', '.join(falhas)}", file=sys.stderr)
+        return 1
+    if base is not None and args.tolerancia is not None:
+        piores = regressoes(resultado, base, args.tolerancia)
+        if len(piores):
+            print(f"Tempos quentes acima da tolerância de {args.tolerancia}%:", file=sys.stderr)
+            print(piores.to_string(index=False), file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
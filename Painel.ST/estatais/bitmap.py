@@ -0,0 +1,120 @@
+"""Índices bitmap sobre as dimensões categóricas.
+
+Para cada valor distinto de cada dimensão (Estado, Ano, setor, dep, esp, sit,
+REGIAO e os indicadores de governança) guarda-se um bitset compactado
+(``np.packbits``) com um bit por linha. Uma combinação qualquer de filtros é
+resolvida com OR entre os valores de uma mesma dimensão e AND entre
+dimensões; contagens saem do popcount do bitset, sem tocar nos dados.
+"""
+
+import itertools
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from estatais.dados import carregar_dados, versao_base
+from estatais.snapshot import COLUNAS_GOVERNANCA
+
+# Dimensões indexadas na base de linhas
+DIMENSOES_BITMAP = ["Estado", "Ano", "setor", "dep", "esp", "sit", "REGIAO"] + COLUNAS_GOVERNANCA
+
+# Quantidade de bits 1 em cada byte
+_POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+def _valores_e_codigos(coluna):
+    # Valores distintos (na ordem do groupby) e o código de cada linha
+    if isinstance(coluna.dtype, pd.CategoricalDtype):
+        return list(coluna.cat.categories), coluna.cat.codes.to_numpy()
+    codigos, valores = pd.factorize(coluna, sort=True)
+    return valores.tolist(), codigos
+
+
+class IndiceBitmap:
+    """Bitsets por valor de cada dimensão de ``df``.
+
+    Os filtros seguem a convenção do cubo: um valor único ou uma lista por
+    dimensão, e ``None`` para "sem filtro".
+    """
+
+    def __init__(self, df, dimensoes):
+        self.df = df
+        self.linhas = len(df)
+        self.dimensoes = [d for d in dimensoes if d in df.columns]
+        self.bitmaps = {}
+        for dimensao in self.dimensoes:
+            valores, codigos = _valores_e_codigos(df[dimensao])
+            self.bitmaps[dimensao] = {
+                valor: np.packbits(codigos == codigo) for codigo, valor in enumerate(valores)
+            }
+        self._todos = np.packbits(np.ones(self.linhas, dtype=bool))
+        self._nenhum = np.zeros_like(self._todos)
+
+    def _bits_dimensao(self, dimensao, valor):
+        if dimensao not in self.bitmaps:
+            raise KeyError(f"'{dimensao}' não é uma dimensão indexada")
+        bitmaps = self.bitmaps[dimensao]
+        if not isinstance(valor, (list, tuple, set, frozenset, range, np.ndarray, pd.Index)):
+            return bitmaps.get(valor, self._nenhum)
+        bits = self._nenhum.copy()
+        for item in valor:
+            if item in bitmaps:
+                bits |= bitmaps[item]
+        return bits
+
+    def bits(self, **filtros):
+        """Bitset compactado das linhas que atendem a todos os filtros."""
+        bits = self._todos
+        for dimensao, valor in filtros.items():
+            if valor is not None:
+                bits = bits & self._bits_dimensao(dimensao, valor)
+        return bits
+
+    def contar(self, **filtros):
+        """Quantidade de linhas que atendem aos filtros (popcount)."""
+        return int(_POPCOUNT[self.bits(**filtros)].sum(dtype=np.int64))
+
+    def contar_por(self, por, **filtros):
+        """Contagem por valor de uma ou mais dimensões, dentro do filtro.
+
+        Equivale a ``df[filtro].groupby(por, observed=True).size()``:
+        combinações sem nenhuma linha não aparecem no resultado.
+        """
+        dimensoes = [por] if isinstance(por, str) else list(por)
+        bits = self.bits(**filtros)
+
+        chaves, contagens = [], []
+        grupos = [list(self.bitmaps[dimensao].items()) for dimensao in dimensoes]
+        for combinacao in itertools.product(*grupos):
+            bits_grupo = bits
+            for _, bits_valor in combinacao:
+                bits_grupo = bits_grupo & bits_valor
+            contagem = int(_POPCOUNT[bits_grupo].sum(dtype=np.int64))
+            if contagem:
+                chaves.append(tuple(valor for valor, _ in combinacao))
+                contagens.append(contagem)
+
+        if len(dimensoes) == 1:
+            indice = pd.Index([chave[0] for chave in chaves], name=dimensoes[0])
+        else:
+            indice = pd.MultiIndex.from_tuples(chaves, names=dimensoes)
+        return pd.Series(contagens, index=indice, dtype=np.int64)
+
+    def posicoes(self, **filtros):
+        """Posições (``iloc``) das linhas que atendem aos filtros, em ordem."""
+        return np.flatnonzero(np.unpackbits(self.bits(**filtros), count=self.linhas))
+
+    def filtrar(self, **filtros):
+        """Linhas de ``df`` que atendem aos filtros."""
+        return self.df.iloc[self.posicoes(**filtros)]
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _carregar_bitmap(versao):
+    return IndiceBitmap(carregar_dados(), DIMENSOES_BITMAP)
+
+
+def carregar_bitmap():
+    """Índice bitmap da base nacional na versão atual, compartilhado entre sessões."""
+    return _carregar_bitmap(versao_base())
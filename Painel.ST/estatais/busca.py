@@ -0,0 +1,103 @@
+"""Busca aproximada por nome de empresa com índice de trigramas.
+
+Os nomes da base têm acentos, abreviações ("SA", "S/A", "S.A.") e espaços
+irregulares, de modo que comparar substrings linha a linha a cada tecla é
+lento e deixa de encontrar grafias vizinhas. Aqui os nomes canônicos (ver
+``estatais.empresas``) são reduzidos a uma forma sem acentos, pontuação nem
+caixa, e cada trigrama dessa forma aponta para as empresas que o contêm
+(índice invertido). Uma consulta soma as listas dos seus trigramas com
+``np.bincount`` e ordena as empresas pela parte da consulta encontrada no
+nome, com a similaridade de Dice entre os dois como desempate.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from estatais.dados import versao_base
+from estatais.empresas import carregar_empresas
+
+# Parte mínima dos trigramas da consulta que o nome precisa conter
+COBERTURA_MINIMA = 0.5
+
+
+def dobrar(texto):
+    """Forma de busca de ``texto``: sem acentos, maiúsculas e palavras separadas por um espaço."""
+    texto = unicodedata.normalize("NFKD", str(texto))
+    texto = "".join(c for c in texto if not unicodedata.combining(c)).upper()
+    return " ".join(re.sub(r"[^0-9A-Z]+", " ", texto).split())
+
+
+def trigramas(texto):
+    """Trigramas de cada palavra de ``texto`` já dobrado (como no pg_trgm do PostgreSQL).
+
+    Cada palavra recebe dois espaços à esquerda e um à direita, de modo que
+    o começo das palavras pesa mais e palavras curtas ("DF", "SA") também
+    geram trigramas.
+    """
+    resultado = set()
+    for palavra in texto.split():
+        palavra = f"  {palavra} "
+        resultado.update(palavra[i:i + 3] for i in range(len(palavra) - 2))
+    return resultado
+
+
+class IndiceTrigramas:
+    """Índice invertido trigrama -> posições das empresas na tabela ``empresas``."""
+
+    def __init__(self, empresas):
+        self.empresas = empresas
+        listas = defaultdict(list)
+        tamanhos = np.zeros(len(empresas), dtype=np.int32)
+        for posicao, nome in enumerate(empresas["nome"]):
+            gramas = trigramas(dobrar(nome))
+            tamanhos[posicao] = len(gramas)
+            for grama in gramas:
+                listas[grama].append(posicao)
+        self.listas = {grama: np.array(posicoes, dtype=np.int32) for grama, posicoes in listas.items()}
+        self.tamanhos = tamanhos
+
+    def buscar(self, consulta, limite=10, estado=None):
+        """Empresas mais parecidas com ``consulta``, da mais para a menos parecida.
+
+        Devolve as linhas da tabela de empresas (índice ``emp_id``) com a
+        coluna ``pontuacao`` (similaridade de Dice, de 0 a 1); ``estado``
+        restringe a busca a uma UF.
+        """
+        gramas = trigramas(dobrar(consulta))
+        postings = [self.listas[grama] for grama in gramas if grama in self.listas]
+        if not postings:
+            return self.empresas.iloc[0:0].assign(pontuacao=pd.Series(dtype="float64"))
+
+        comuns = np.bincount(np.concatenate(postings), minlength=len(self.empresas))
+        cobertura = comuns / len(gramas)
+        dice = 2 * comuns / (len(gramas) + self.tamanhos)
+
+        candidatos = cobertura >= COBERTURA_MINIMA
+        if estado is not None:
+            candidatos &= (self.empresas["Estado"] == estado).to_numpy()
+        posicoes = np.flatnonzero(candidatos)
+
+        # Ordena por cobertura e, nos empates, por Dice (lexsort usa a última chave primeiro)
+        ordem = np.lexsort((-dice[posicoes], -cobertura[posicoes]))[:limite]
+        posicoes = posicoes[ordem]
+        return self.empresas.iloc[posicoes].assign(pontuacao=dice[posicoes])
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _carregar_busca(versao):
+    return IndiceTrigramas(carregar_empresas())
+
+
+def carregar_busca():
+    """Índice de busca por nome da versão atual da base, compartilhado entre sessões."""
+    return _carregar_busca(versao_base())
+
+
+def buscar_empresas(consulta, limite=10, estado=None):
+    """Atalho para ``carregar_busca().buscar``."""
+    return carregar_busca().buscar(consulta, limite, estado)
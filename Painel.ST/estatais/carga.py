@@ -0,0 +1,391 @@
+"""Teste de carga: várias sessões simultâneas navegando pelo painel.
+
+Cada sessão simulada é um ``AppTest`` (o mesmo cliente sem navegador do
+``estatais.benchmark``) rodando em uma thread própria, todas no mesmo
+processo: como em um servidor Streamlit, as sessões compartilham os caches
+(base, índices, cubo, figuras, grafos de tarefas) e disputam o mesmo
+interpretador. Cada sessão percorre o caminho ``NAVEGACAO`` (Início com uma
+busca, página 03 trocando de aba, página 05 mudando filtros), com uma pausa
+aleatória entre os passos para imitar o tempo de leitura.
+
+A carga sobe em degraus (``--sessoes 1 2 4 8``). Em cada degrau todas as
+sessões começam juntas e são medidos os percentis p50/p95/p99 do tempo de
+cada rerun, a vazão (reruns por segundo) e o crescimento da memória
+residente do processo por sessão; as sessões continuam vivas até a medida
+da memória, como continuariam abertas no navegador. Com ``--alvo-p95`` o
+relatório indica o maior degrau cujo p95 ficou dentro do alvo.
+
+O cliente roda no mesmo processo e também consome CPU (a árvore de
+elementos de cada rerun é montada na thread da sessão), então os tempos são
+um limite superior do que um navegador veria com o servidor sozinho na
+máquina. Processos separados não serviriam: cada um teria os seus próprios
+caches, como réplicas independentes do servidor.
+
+Uso na linha de comando (a partir de Painel.ST):
+
+    python -m estatais.carga [--sessoes 1 2 4 8] [--pausa 1.0] [--alvo-p95 2.0]
+                             [--salvar [benchmarks/carga.json]]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import app_test
+
+from estatais.benchmark import aba, limpar_caches, nova_sessao, widget
+from estatais.dados import PASTA_PAINEL
+
+# Versão do formato do JSON gravado
+VERSAO_FORMATO = 1
+
+# Resultado gravado por padrão com --salvar sem caminho
+ARQUIVO_CARGA = os.path.join(PASTA_PAINEL, "benchmarks", "carga.json")
+
+# Sessões simultâneas de cada degrau
+DEGRAUS = [1, 2, 4, 8]
+
+# Pausa média entre os passos de uma sessão (s); cada pausa varia de 50% a 150%
+PAUSA = 1.0
+
+SCRIPT_INICIAL = os.path.join(PASTA_PAINEL, "Início.py")
+
+
+def abrir_pagina(pagina):
+    """Interação que navega para ``pagina`` (caminho relativo a Painel.ST)."""
+    def interagir(at):
+        at.switch_page(pagina)
+    return interagir
+
+
+# Caminho percorrido por cada sessão: (passo, interação antes do rerun).
+# O primeiro passo é a abertura do painel, sem interação.
+NAVEGACAO = [
+    ("Início", None),
+    ("Início: busca por 'brb'", widget("text_input", "brb", chave="busca_empresa")),
+    ("03: abertura", abrir_pagina("pages/03_Resultado_financeiro_estatais.py")),
+    ("03: aba Evolução", aba("secao_resultado_estatais", "Evolução")),
+    ("03: aba Rentabilidade", aba("secao_resultado_estatais", "Rentabilidade")),
+    ("05: abertura", abrir_pagina("pages/05_Comparativo_outros_estados.py")),
+    ("05: dois últimos anos", widget("multiselect", lambda w: w.value[-2:], rotulo="Selecione os anos:")),
+    ("05: Linhas por Estado", widget("radio", "Linhas por Estado", chave="tipo_grafico_resultado")),
+    ("05: cinco estados por dependência", widget("multiselect", lambda w: w.value[:5], chave="estados_dep")),
+]
+
+
+@contextmanager
+def cache_de_scripts_compartilhado():
+    """Um só cache de scripts compilados para todas as sessões do ``AppTest``.
+
+    O servidor do Streamlit compila cada página uma vez e compartilha o
+    bytecode entre as sessões; o ``AppTest`` cria um cache novo a cada
+    execução. Com várias sessões em threads, as compilações simultâneas
+    disparam um erro interno do ``ast.parse`` no Python 3.11 ("AST
+    constructor recursion depth mismatch"), que o servidor não teria.
+    """
+    compartilhado = ScriptCache()
+    with mock.patch.object(app_test, "ScriptCache", lambda: compartilhado):
+        yield compartilhado
+
+
+class _RuntimeDaExecucao(Runtime):
+    """Recebe o runtime simulado que o ``AppTest`` instala a cada execução."""
+
+
+@contextmanager
+def runtime_compartilhado():
+    """Um só runtime simulado, instalado durante todo o teste de carga.
+
+    A cada execução o ``AppTest`` grava o seu runtime simulado em
+    ``Runtime._instance`` e o apaga ao terminar. Com sessões em threads, a
+    sessão que termina apaga o runtime de outra ainda em execução, e
+    ``st.image`` falha no meio da página com "Runtime hasn't been created!".
+    Aqui o ``AppTest`` grava em uma subclasse sem efeito e todas as sessões
+    usam o mesmo runtime, montado como o do ``AppTest``.
+    """
+    runtime = mock.MagicMock(spec=Runtime)
+    runtime.media_file_mgr = app_test.MediaFileManager(app_test.MemoryMediaFileStorage("/mock/media"))
+    runtime.dataframe_source_mgr = app_test.DataframeSourceManager()
+    runtime.cache_storage_manager = app_test.MemoryCacheStorageManager()
+    runtime.bidi_component_registry = app_test.BidiComponentManager()
+    runtime.bidi_component_registry.discover_and_register_components(start_file_watching=False)
+
+    anterior = Runtime._instance
+    Runtime._instance = runtime
+    try:
+        with mock.patch.object(app_test, "Runtime", _RuntimeDaExecucao):
+            yield runtime
+    finally:
+        Runtime._instance = anterior
+
+
+@contextmanager
+def excecoes_em_threads():
+    """Guarda as exceções não tratadas de qualquer thread enquanto ativo.
+
+    Devolve a lista (``"thread: Tipo: mensagem"``), preenchida ao longo do
+    bloco; o rastro continua indo para o stderr, como sem o gerenciador.
+    """
+    excecoes = []
+    original = threading.excepthook
+
+    def guardar(argumentos):
+        nome = argumentos.thread.name if argumentos.thread is not None else "?"
+        excecoes.append(f"{nome}: {argumentos.exc_type.__name__}: {argumentos.exc_value}")
+        original(argumentos)
+
+    threading.excepthook = guardar
+    try:
+        yield excecoes
+    finally:
+        threading.excepthook = original
+
+
+class InteracaoFalhou(RuntimeError):
+    """O widget de uma interação não estava na página: o caminho é inválido."""
+
+
+def memoria_residente():
+    """Memória residente do processo em bytes (``None`` se não der para medir).
+
+    No Linux é o valor atual, lido de ``/proc``; nos outros sistemas Unix é
+    o pico desde o início do processo.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS informa em bytes, os demais em kB
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+def navegar(pausa=0.0, sorteio=None, largada=None):
+    """Percorre ``NAVEGACAO`` em uma sessão nova.
+
+    Devolve a sessão (para mantê-la viva) e uma medida por passo, com o
+    tempo do rerun e a primeira exceção exibida pelo script, se houver.
+    Se uma interação não encontra o seu widget, as medidas seguintes não
+    teriam sentido: ``InteracaoFalhou`` interrompe o teste, com as exceções
+    exibidas pela página anterior. ``largada`` é uma ``threading.Barrier``
+    para as sessões começarem juntas.
+    """
+    sorteio = sorteio or random.Random()
+    at = nova_sessao(SCRIPT_INICIAL)
+    if largada is not None:
+        largada.wait()
+
+    passos = []
+    for passo, interagir in NAVEGACAO:
+        if interagir is not None:
+            try:
+                interagir(at)
+            except (KeyError, StopIteration) as erro:
+                exibidas = "; ".join(e.message for e in at.exception) or "nenhuma exceção exibida"
+                raise InteracaoFalhou(
+                    f"passo {passo!r}: widget não encontrado ({erro!r}) depois de "
+                    f"{passos[-1]['passo']!r} ({exibidas})"
+                ) from erro
+        inicio = time.perf_counter()
+        at.run()
+        segundos = time.perf_counter() - inicio
+        erros = [e.message for e in at.exception]
+        passos.append({"passo": passo, "segundos": segundos, "erro": erros[0] if erros else None})
+        if pausa:
+            time.sleep(pausa * sorteio.uniform(0.5, 1.5))
+    return at, passos
+
+
+def _percentis(tempos):
+    tempos = pd.Series(tempos, dtype="float64")
+    if tempos.empty:
+        return {"p50_s": None, "p95_s": None, "p99_s": None}
+    p50, p95, p99 = np.percentile(tempos, [50, 95, 99])
+    return {"p50_s": round(p50, 4), "p95_s": round(p95, 4), "p99_s": round(p99, 4)}
+
+
+def medir_degrau(sessoes, pausa=PAUSA, semente=0):
+    """Roda ``sessoes`` sessões simultâneas e resume latência, vazão e memória."""
+    gc.collect()
+    memoria_antes = memoria_residente()
+
+    largada = threading.Barrier(sessoes)
+    with excecoes_em_threads() as excecoes, ThreadPoolExecutor(
+        max_workers=sessoes, thread_name_prefix="carga-sessao"
+    ) as pool:
+        futuros = [
+            pool.submit(navegar, pausa, random.Random(semente + i), largada)
+            for i in range(sessoes)
+        ]
+        inicio = time.perf_counter()
+        resultados = [futuro.result() for futuro in futuros]
+        duracao = time.perf_counter() - inicio
+
+    # Sessões ainda vivas em ``resultados``: a memória inclui o estado de cada uma
+    memoria_depois = memoria_residente()
+    passos = pd.DataFrame([passo for _, medidos in resultados for passo in medidos])
+    del resultados
+    gc.collect()
+
+    crescimento = None
+    if memoria_antes is not None and memoria_depois is not None:
+        crescimento = round((memoria_depois - memoria_antes) / 2**20 / sessoes, 2)
+    return {
+        "sessoes": sessoes,
+        "reruns": len(passos),
+        # Exceções em threads auxiliares (fora do script) também contam
+        "erros": int(passos["erro"].notna().sum()) + len(excecoes),
+        **_percentis(passos["segundos"]),
+        "max_s": round(passos["segundos"].max(), 4),
+        "duracao_s": round(duracao, 3),
+        "vazao_reruns_s": round(len(passos) / duracao, 3),
+        "memoria_antes_mb": None if memoria_antes is None else round(memoria_antes / 2**20, 1),
+        "memoria_depois_mb": None if memoria_depois is None else round(memoria_depois / 2**20, 1),
+        "memoria_por_sessao_mb": crescimento,
+        "passos": {
+            passo: _percentis(tempos) for passo, tempos in passos.groupby("passo", sort=False)["segundos"]
+        },
+        "mensagens_erro": sorted(set(passos["erro"].dropna()) | set(excecoes)),
+    }
+
+
+def executar(degraus=DEGRAUS, pausa=PAUSA, frio=False, progresso=None):
+    """Mede todos os ``degraus`` e devolve o resultado no formato gravado.
+
+    Antes dos degraus uma sessão percorre o caminho sozinha, sem pausas,
+    para preencher os caches; com ``frio`` os caches são esvaziados e essa
+    sessão é pulada, de modo que o primeiro degrau inclui a carga da base.
+    """
+    with cache_de_scripts_compartilhado(), runtime_compartilhado():
+        return _executar_degraus(degraus, pausa, frio, progresso)
+
+
+def _executar_degraus(degraus, pausa, frio, progresso):
+    aquecimento = None
+    if frio:
+        limpar_caches()
+    else:
+        inicio = time.perf_counter()
+        navegar()
+        aquecimento = round(time.perf_counter() - inicio, 3)
+
+    resultados = []
+    for sessoes in degraus:
+        resultados.append(medir_degrau(sessoes, pausa, semente=len(resultados) * 1000))
+        if progresso is not None:
+            progresso(resultados[-1])
+    return {
+        "formato": VERSAO_FORMATO,
+        "momento": datetime.now().isoformat(timespec="seconds"),
+        "ambiente": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "streamlit": st.__version__,
+            "plataforma": platform.platform(),
+            "processadores": os.cpu_count(),
+        },
+        "pausa_s": pausa,
+        "navegacao": [passo for passo, _ in NAVEGACAO],
+        "aquecimento_s": aquecimento,
+        "degraus": resultados,
+    }
+
+
+def tabela_resultado(resultado):
+    """Uma linha por degrau com latência, vazão e memória."""
+    colunas = [
+        "sessoes", "reruns", "erros", "p50_s", "p95_s", "p99_s", "max_s",
+        "vazao_reruns_s", "memoria_antes_mb", "memoria_depois_mb", "memoria_por_sessao_mb",
+    ]
+    return pd.DataFrame(resultado["degraus"], columns=colunas)
+
+
+def maior_degrau_no_alvo(resultado, alvo_p95):
+    """Maior número de sessões com p95 até ``alvo_p95`` segundos e sem erros."""
+    dentro = [
+        degrau["sessoes"] for degrau in resultado["degraus"]
+        if not degrau["erros"] and degrau["p95_s"] <= alvo_p95
+    ]
+    return max(dentro) if dentro else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Teste de carga do painel com sessões simultâneas do AppTest.")
+    parser.add_argument("--sessoes", type=int, nargs="+", default=DEGRAUS, help="sessões simultâneas de cada degrau")
+    parser.add_argument("--pausa", type=float, default=PAUSA, help="pausa média entre os passos (s)")
+    parser.add_argument("--frio", action="store_true", help="começa com os caches vazios, sem aquecimento")
+    parser.add_argument("--alvo-p95", type=float, help="p95 máximo aceito por rerun (s)")
+    parser.add_argument("--salvar", nargs="?", const=ARQUIVO_CARGA, help="grava o resultado em JSON")
+    args = parser.parse_args(argv)
+
+    # Avisos do Streamlit sobre a execução sem servidor (sem runtime, sem contexto)
+    logging.disable(logging.WARNING)
+
+    def progresso(degrau):
+        print(
+            f"{degrau['sessoes']} sessão(ões): p95 {degrau['p95_s']:.3f} s, "
+            f"{degrau['vazao_reruns_s']:.2f} reruns/s"
+            + (f", {degrau['erros']} erro(s)" if degrau["erros"] else ""),
+            file=sys.stderr,
+        )
+
+    try:
+        resultado = executar(args.sessoes, args.pausa, args.frio, progresso)
+    except InteracaoFalhou as erro:
+        print(f"Teste de carga interrompido: {erro}", file=sys.stderr)
+        return 2
+
+    with pd.option_context("display.width", 200, "display.max_columns", None):
+        print(tabela_resultado(resultado).to_string(index=False))
+        print()
+        print("p95 por passo (s):")
+        print(pd.DataFrame({
+            degrau["sessoes"]: {passo: valores["p95_s"] for passo, valores in degrau["passos"].items()}
+            for degrau in resultado["degraus"]
+        }).rename_axis(columns="sessões").to_string())
+
+    if args.salvar:
+        os.makedirs(os.path.dirname(os.path.abspath(args.salvar)), exist_ok=True)
+        with open(args.salvar, "w", encoding="utf-8") as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"Resultado gravado em {args.salvar}", file=sys.stderr)
+
+    mensagens = sorted({m for degrau in resultado["degraus"] for m in degrau["mensagens_erro"]})
+    if mensagens:
+        print("Erros nas sessões:", file=sys.stderr)
+        for mensagem in mensagens:
+            print(f"  {mensagem}", file=sys.stderr)
+        return 1
+    if args.alvo_p95 is not None:
+        maior = maior_degrau_no_alvo(resultado, args.alvo_p95)
+        if maior is None:
+            print(f"Nenhum degrau com p95 até {args.alvo_p95} s.", file=sys.stderr)
+            return 1
+        print(f"Maior degrau com p95 até {args.alvo_p95} s: {maior} sessão(ões).", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""Classificadores vetorizados compartilhados pelas páginas.
+
+Substituem os ``apply``/``lambda`` linha a linha: cada função recebe colunas
+inteiras e devolve uma ``Series`` de rótulos alinhada ao índice de entrada.
+Valores ausentes caem na categoria "negativa", como nas regras originais.
+"""
+
+import numpy as np
+import pandas as pd
+
+from estatais.snapshot import (
+    COLUNA_CODIGO_GOVERNANCA,
+    COLUNAS_GOVERNANCA,
+    DEPENDENTE,
+    NAO_DEPENDENTE,
+    PESOS_GOVERNANCA,
+    codificar_governanca,
+)
+
+LUCRO = "Lucro"
+PREJUIZO = "Prejuízo"
+
+RENTABILIDADE_POSITIVA = "Rentabilidade Positiva"
+RENTABILIDADE_NEGATIVA = "Rentabilidade Negativa"
+
+COR_POSITIVA = "#007acc"
+COR_NEGATIVA = "#F46045"
+
+# Combinações de conselhos na ordem de exibição dos gráficos
+COMBINACOES_GOVERNANCA = [
+    "CA, CF, COAUD",
+    "CA, CF",
+    "CA, COAUD",
+    "CF, COAUD",
+    "CA",
+    "CF",
+    "COAUD",
+    "Nenhum",
+]
+
+# Rótulo de cada combinação indexado pelo código (0 a 7)
+_ROTULO_POR_CODIGO = np.array(
+    [
+        "Nenhum",
+        "COAUD",
+        "CF",
+        "CF, COAUD",
+        "CA",
+        "CA, COAUD",
+        "CA, CF",
+        "CA, CF, COAUD",
+    ],
+    dtype=object,
+)
+
+
+def _rotular(serie, condicao, verdadeiro, falso):
+    return pd.Series(
+        np.where(np.asarray(condicao, dtype=bool), verdadeiro, falso),
+        index=serie.index,
+        dtype=object,
+    )
+
+
+def status_resultado(lucros):
+    """"Lucro" quando o valor é positivo, "Prejuízo" caso contrário."""
+    return _rotular(lucros, lucros.gt(0), LUCRO, PREJUIZO)
+
+
+def status_rentabilidade(rentabilidade):
+    """Rentabilidade positiva (inclui zero) ou negativa."""
+    return _rotular(
+        rentabilidade,
+        rentabilidade.ge(0),
+        RENTABILIDADE_POSITIVA,
+        RENTABILIDADE_NEGATIVA,
+    )
+
+
+def rotulo_dependencia(dep):
+    """"Dependente" ou "Não Dependente" (não informado conta como não dependente)."""
+    return _rotular(dep, dep.astype(object).eq(DEPENDENTE), DEPENDENTE, NAO_DEPENDENTE)
+
+
+def cor_por_sinal(valores, zero_positivo=False):
+    """Cor de barras/marcadores pelo sinal do valor.
+
+    Com ``zero_positivo`` o zero recebe a cor positiva.
+    """
+    positivo = valores.ge(0) if zero_positivo else valores.gt(0)
+    return _rotular(valores, positivo, COR_POSITIVA, COR_NEGATIVA)
+
+
+# Matriz 8 x 3 que indica, para cada código, quais conselhos estão presentes
+_CONSELHOS_POR_CODIGO = np.array(
+    [[(codigo & peso) > 0 for peso in PESOS_GOVERNANCA.values()] for codigo in range(8)],
+    dtype=np.int64,
+)
+
+
+def codigo_governanca(df):
+    """Código de 0 a 7 com os conselhos presentes (CA=4, CF=2, COAUD=1).
+
+    Usa a coluna pré-calculada da base tipada quando ela existe.
+    """
+    if COLUNA_CODIGO_GOVERNANCA in df.columns:
+        return df[COLUNA_CODIGO_GOVERNANCA]
+    return codificar_governanca(df)
+
+
+def histograma_governanca(df, por=None):
+    """Contagem de linhas por código de governança, com um único ``bincount``.
+
+    Sem ``por`` devolve uma ``Series`` indexada pelos códigos 0 a 7; com
+    ``por`` devolve um ``DataFrame`` com um grupo por linha e um código por
+    coluna. Linhas sem grupo são ignoradas.
+    """
+    codigos = codigo_governanca(df).to_numpy(dtype=np.intp)
+    if por is None:
+        return pd.Series(np.bincount(codigos, minlength=8), index=range(8))
+
+    grupos, rotulos = pd.factorize(df[por], sort=True)
+    validos = grupos >= 0
+    contagem = np.bincount(
+        grupos[validos] * 8 + codigos[validos], minlength=len(rotulos) * 8
+    )
+    return pd.DataFrame(
+        contagem.reshape(len(rotulos), 8),
+        index=pd.Index(rotulos, name=por),
+        columns=range(8),
+    )
+
+
+def contar_conselhos(histograma):
+    """Empresas com cada conselho (colunas de ``COLUNAS_GOVERNANCA``) a partir do histograma."""
+    if isinstance(histograma, pd.Series):
+        return pd.Series(histograma.to_numpy() @ _CONSELHOS_POR_CODIGO, index=COLUNAS_GOVERNANCA)
+    return pd.DataFrame(
+        histograma.to_numpy() @ _CONSELHOS_POR_CODIGO,
+        index=histograma.index,
+        columns=COLUNAS_GOVERNANCA,
+    )
+
+
+def contar_combinacoes(histograma):
+    """Renomeia as colunas (ou o índice) do histograma para os rótulos das combinações."""
+    rotulos = dict(enumerate(_ROTULO_POR_CODIGO))
+    if isinstance(histograma, pd.Series):
+        return histograma.rename(index=rotulos).reindex(COMBINACOES_GOVERNANCA)
+    return histograma.rename(columns=rotulos)[COMBINACOES_GOVERNANCA]
+
+
+def combinacao_governanca(df):
+    """Rótulo da combinação de conselhos (ex.: "CA, CF") de cada linha."""
+    codigo = codigo_governanca(df)
+    return pd.Series(_ROTULO_POR_CODIGO[codigo.to_numpy()], index=df.index, dtype=object)
@@ -0,0 +1,111 @@
+"""Cubo de agregação pré-calculado sobre Estado × Ano × setor × dep × REGIAO.
+
+As páginas agrupavam a base inteira (``groupby(["Estado", "Ano", "setor"])``
+etc.) a cada rerun. O cubo guarda, uma única vez por versão da base, a
+quantidade de registros e a soma/contagem de cada medida numérica para todas
+as combinações observadas das dimensões; uma fatia qualquer passa a custar
+O(células) em vez de O(linhas).
+"""
+
+import pandas as pd
+import streamlit as st
+
+from estatais.bitmap import IndiceBitmap
+from estatais.dados import carregar_dados, versao_base
+from estatais.moeda import COLUNAS_MONETARIAS, em_centavos, em_reais
+
+# Dimensões do cubo
+DIMENSOES = ["Estado", "Ano", "setor", "dep", "REGIAO"]
+
+# Medidas somadas em cada célula; identificadores (emp_id, gov_codigo) e os
+# indicadores derivados (razões por linha) não têm soma com significado
+MEDIDAS = COLUNAS_MONETARIAS + ["qde_empregados", "maior_rem"]
+
+# Coluna com a quantidade de registros (empresas-ano) de cada célula
+REGISTROS = "registros"
+
+
+class Cubo:
+    """Somas e contagens por célula (combinação observada das dimensões).
+
+    ``somas`` e ``contagens`` têm uma linha por célula e uma coluna por
+    medida; ``contagens`` conta apenas os valores não nulos, de modo que
+    ``soma / contagem`` reproduz a média que o pandas calcularia nas linhas.
+
+    As medidas monetárias são somadas em centavos inteiros (ver
+    ``estatais.moeda``), de modo que os totais são exatos e não dependem da
+    ordem das parcelas; ``fatiar`` e ``resumir`` devolvem os valores em reais.
+    Só as colunas de ``MEDIDAS`` entram no cubo: os indicadores derivados
+    (``estatais.metricas``) são razões por linha e os identificadores não
+    são quantidades, de modo que a soma deles não tem significado.
+    """
+
+    def __init__(self, dimensoes, somas, contagens):
+        self.dimensoes = dimensoes
+        self.somas = somas
+        self.contagens = contagens
+        self.medidas = [coluna for coluna in somas.columns if coluna not in dimensoes + [REGISTROS]]
+        # Bitmaps das dimensões sobre as células: os filtros viram AND/OR de bitsets
+        self.indice = IndiceBitmap(somas, dimensoes)
+
+    @classmethod
+    def a_partir_de(cls, df, dimensoes=DIMENSOES, medidas=MEDIDAS):
+        """Monta o cubo a partir da base (uma passada de groupby)."""
+        dimensoes = [d for d in dimensoes if d in df.columns]
+        medidas = [m for m in medidas if m in df.columns and m not in dimensoes]
+        df = em_centavos(df)
+        grupos = df.groupby(dimensoes, observed=True, dropna=False, sort=True)
+
+        somas = grupos[medidas].sum(min_count=1)
+        somas.insert(0, REGISTROS, grupos.size())
+        contagens = grupos[medidas].count()
+
+        return cls(dimensoes, somas.reset_index(), contagens.reset_index())
+
+    def celulas(self, **filtros):
+        """Células que atendem aos filtros (valor único ou lista por dimensão).
+
+        Um filtro ``None`` é ignorado, o que permite repassar diretamente a
+        seleção de um multiselect vazio ("sem filtro").
+        """
+        return self.somas.iloc[self.indice.posicoes(**filtros)]
+
+    def valores(self, dimensao, **filtros):
+        """Valores distintos (ordenados) de uma dimensão dentro do filtro."""
+        return sorted(self.celulas(**filtros)[dimensao].dropna().unique())
+
+    def fatiar(self, por, medidas=None, **filtros):
+        """Somas agregadas por ``por`` dentro do filtro.
+
+        Retorna um DataFrame indexado por ``por`` com a coluna ``registros``
+        e as medidas pedidas (todas, se ``medidas`` for ``None``).
+        """
+        medidas = [REGISTROS] + list(medidas or self.medidas)
+        celulas = self.celulas(**filtros)
+        return em_reais(celulas.groupby(por, observed=True, dropna=False)[medidas].sum(min_count=1))
+
+    def contar(self, por, medidas=None, **filtros):
+        """Quantidade de valores não nulos de cada medida, por ``por``."""
+        medidas = list(medidas or self.medidas)
+        celulas = self.contagens.iloc[self.indice.posicoes(**filtros)]
+        return celulas.groupby(por, observed=True, dropna=False)[medidas].sum(min_count=1)
+
+    def resumir(self, por, medida, **filtros):
+        """Soma, média e contagem (valores não nulos) de uma medida."""
+        somas = self.fatiar(por, [medida], **filtros)[medida]
+        contagens = self.contar(por, [medida], **filtros)[medida]
+        return pd.DataFrame({
+            "sum": somas,
+            "mean": somas / contagens.where(contagens > 0),
+            "count": contagens,
+        })
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _montar_cubo(versao):
+    return Cubo.a_partir_de(carregar_dados())
+
+
+def carregar_cubo():
+    """Cubo da versão atual da base, compartilhado entre sessões."""
+    return _montar_cubo(versao_base())
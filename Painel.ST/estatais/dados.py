@@ -0,0 +1,114 @@
+"""Carregamento único e compartilhado da base nacional de estatais.
+
+As páginas do painel liam o CSV inteiro a cada rerun. Aqui a base é lida uma
+única vez por processo e reaproveitada por todas as sessões; o cache é
+invalidado sozinho quando o arquivo muda em disco (mtime/tamanho e hash).
+
+A leitura passa pelo snapshot tipado (ver ``estatais.snapshot``): se existir
+um .feather gerado a partir da mesma versão do CSV ele é lido por memory-map;
+caso contrário o CSV é lido, tipado e o snapshot é regravado para a próxima
+inicialização.
+"""
+
+import hashlib
+import os
+from functools import lru_cache
+
+import streamlit as st
+
+from estatais.snapshot import caminho_snapshot, ler_origem, ler_snapshot, salvar_snapshot, tipar_base
+
+# Nome do arquivo da base nacional
+NOME_ARQUIVO = "BD_Completo_Nacional_Formatado.csv"
+
+# Pasta Painel.ST (este pacote fica em Painel.ST/estatais)
+PASTA_PAINEL = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Locais onde a base é procurada, em ordem de preferência: o diretório de
+# trabalho (comportamento original das páginas), a raiz do repositório e a
+# cópia em Painel.ST/pages
+PASTAS_CANDIDATAS = (
+    os.getcwd(),
+    os.path.dirname(PASTA_PAINEL),
+    os.path.join(PASTA_PAINEL, "pages"),
+)
+
+
+def localizar_arquivo(nome=NOME_ARQUIVO):
+    """Retorna o caminho absoluto da primeira cópia encontrada de ``nome``."""
+    for pasta in PASTAS_CANDIDATAS:
+        caminho = os.path.join(pasta, nome)
+        if os.path.exists(caminho):
+            return os.path.abspath(caminho)
+    raise FileNotFoundError(f"Arquivo '{nome}' não encontrado em {PASTAS_CANDIDATAS}")
+
+
+@lru_cache(maxsize=8)
+def _hash_arquivo(caminho, mtime_ns, tamanho):
+    # mtime_ns e tamanho fazem parte da chave: o hash só é recalculado
+    # quando o arquivo é de fato tocado em disco
+    sha = hashlib.sha256()
+    with open(caminho, "rb") as f:
+        for bloco in iter(lambda: f.read(1 << 20), b""):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+
+def versao_arquivo(caminho):
+    """Identificador de conteúdo do arquivo (sha256), barato entre reruns."""
+    info = os.stat(caminho)
+    return _hash_arquivo(caminho, info.st_mtime_ns, info.st_size)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _ler_bytes(caminho, mtime_ns, tamanho):
+    with open(caminho, "rb") as f:
+        return f.read()
+
+
+def ler_arquivo(caminho):
+    """Conteúdo binário de ``caminho``, lido uma vez e compartilhado entre sessões.
+
+    O arquivo só é relido quando muda em disco (mtime/tamanho). Como o
+    gerenciador de mídia do Streamlit identifica os arquivos pelo conteúdo,
+    entregar sempre o mesmo objeto a um ``st.download_button`` mantém uma
+    única cópia em memória, qualquer que seja o número de sessões.
+    """
+    info = os.stat(caminho)
+    return _ler_bytes(caminho, info.st_mtime_ns, info.st_size)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _carregar_base(caminho, versao):
+    # ``versao`` só entra na chave do cache; uma versão nova do arquivo gera
+    # uma nova entrada e a antiga é descartada por max_entries
+    destino = caminho_snapshot(caminho)
+    base = ler_snapshot(destino, versao)
+    if base is None:
+        base = tipar_base(ler_origem(caminho))
+        salvar_snapshot(base, destino, versao)
+    return base
+
+
+def versao_base():
+    """Versão (hash do arquivo) da base atualmente em uso.
+
+    Serve de chave para os caches derivados da base (cubo, índices etc.),
+    que assim são reconstruídos junto com ela.
+    """
+    return versao_arquivo(localizar_arquivo())
+
+
+def carregar_dados():
+    """Retorna a base nacional tipada, compartilhada entre sessões e reruns.
+
+    Estado, setor, dep, esp, sit e REGIAO são categorias; gov_ca, gov_cf,
+    gov_aud, gov e result_NA são booleanos; maior_rem é numérico.
+
+    O DataFrame devolvido é o próprio objeto em cache, o mesmo para todas as
+    sessões: ele é somente leitura. Não inclua, remova ou substitua colunas
+    nem altere valores; para modificar, trabalhe sobre ``.copy()`` ou sobre
+    um recorte seguido de ``.copy()``.
+    """
+    caminho = localizar_arquivo()
+    return _carregar_base(caminho, versao_arquivo(caminho))
@@ -0,0 +1,219 @@
+"""Medição do tempo de cada seção das páginas.
+
+Os blocos de preparação de dados e de montagem de gráficos das páginas são
+envolvidos por ``medir`` (gerenciador de contexto ou decorador), que anota o
+tempo de relógio do bloco; dentro dele, ``registrar`` informa quantas linhas
+foram processadas e qual figura foi gerada. As medidas vão para um buffer
+circular em memória, compartilhado por todas as sessões (as ``MAX_MEDIDAS``
+mais recentes), e, se a variável de ambiente ``PAINEL_LOG_DESEMPENHO``
+apontar para um arquivo, também para um log JSONL, uma medida por linha.
+
+O painel com as medidas fica escondido: aparece na barra lateral quando
+uma página é aberta com ``?desempenho=1`` e continua ativo na sessão até
+``?desempenho=0``. Ele mostra também os acertos e falhas do cache de
+figuras (ver ``estatais.figuras``). Tempo e linhas são sempre anotados, a custo desprezível;
+o tamanho das figuras Plotly exige serializá-las de novo, então só é medido
+quando o painel está ativo na sessão ou o log está ligado.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import ContextDecorator
+from datetime import datetime
+from functools import partial
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from estatais.figuras import cache_figuras
+
+# Quantidade de medidas mantidas no buffer circular
+MAX_MEDIDAS = 500
+
+# Variável de ambiente com o caminho do log JSONL (vazia = sem log)
+VARIAVEL_LOG = "PAINEL_LOG_DESEMPENHO"
+
+# Parâmetro da URL que liga (1) ou desliga (0) o painel na sessão
+PARAMETRO_PAINEL = "desempenho"
+
+# Medidas mais recentes exibidas no painel
+MEDIDAS_EXIBIDAS = 50
+
+_CHAVE_SESSAO = "painel_desempenho"
+
+# Pilha das medidas abertas em cada thread (``registrar`` usa a do topo)
+_abertas = threading.local()
+_trava = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def _buffer():
+    return deque(maxlen=MAX_MEDIDAS)
+
+
+def caminho_log():
+    """Caminho do log JSONL, ou ``None`` se o log estiver desligado."""
+    return os.environ.get(VARIAVEL_LOG) or None
+
+
+def painel_ativo():
+    """Se o painel de desempenho foi ligado nesta sessão (``?desempenho=1``)."""
+    # Tarefas em threads do pool (ver estatais.tarefas) não têm sessão
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return False
+    valor = st.query_params.get(PARAMETRO_PAINEL)
+    if valor is not None:
+        st.session_state[_CHAVE_SESSAO] = valor.lower() not in ("", "0", "false", "nao", "não")
+    return st.session_state.get(_CHAVE_SESSAO, False)
+
+
+def tamanho_figura(figura):
+    """Bytes enviados ao navegador para ``figura`` (Plotly ou imagem já exportada)."""
+    if isinstance(figura, (bytes, bytearray, memoryview)):
+        return len(figura)
+    if hasattr(figura, "to_json"):
+        return len(figura.to_json().encode("utf-8"))
+    return None
+
+
+class Medida:
+    """Uma execução de uma seção: tempo, linhas processadas e bytes das figuras."""
+
+    def __init__(self, pagina, secao, detalhar):
+        self.pagina = pagina
+        self.secao = secao
+        self.detalhar = detalhar
+        self.linhas = None
+        self.bytes_figura = None
+        self.inicio = time.perf_counter()
+
+    def registrar(self, linhas=None, figura=None):
+        if linhas is not None:
+            self.linhas = int(linhas)
+        if figura is not None and self.detalhar:
+            tamanho = tamanho_figura(figura)
+            if tamanho is not None:
+                self.bytes_figura = (self.bytes_figura or 0) + tamanho
+
+    def como_registro(self, segundos, erro):
+        return {
+            "momento": datetime.now().isoformat(timespec="milliseconds"),
+            "pagina": self.pagina,
+            "secao": self.secao,
+            "segundos": round(segundos, 6),
+            "linhas": self.linhas,
+            "bytes_figura": self.bytes_figura,
+            "erro": erro,
+        }
+
+
+def _pilha():
+    if not hasattr(_abertas, "pilha"):
+        _abertas.pilha = []
+    return _abertas.pilha
+
+
+def _guardar(registro):
+    caminho = caminho_log()
+    with _trava:
+        _buffer().append(registro)
+        if caminho:
+            with open(caminho, "a", encoding="utf-8") as f:
+                f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+
+class medir(ContextDecorator):
+    """Mede o bloco (``with medir(...)``) ou a função decorada (``@medir(...)``).
+
+    Exceções não são engolidas: a medida é guardada com o nome da exceção
+    em ``erro`` (inclusive ``st.stop`` e reruns, que o Streamlit sinaliza
+    com exceções).
+    """
+
+    def __init__(self, pagina, secao):
+        self.pagina = pagina
+        self.secao = secao
+
+    def __enter__(self):
+        medida = Medida(self.pagina, self.secao, painel_ativo() or caminho_log() is not None)
+        _pilha().append(medida)
+        return medida
+
+    def __exit__(self, tipo, valor, rastro):
+        medida = _pilha().pop()
+        segundos = time.perf_counter() - medida.inicio
+        _guardar(medida.como_registro(segundos, tipo.__name__ if tipo is not None else None))
+        return False
+
+
+def registrar(linhas=None, figura=None):
+    """Anota linhas processadas e/ou uma figura gerada na medida aberta mais interna."""
+    pilha = _pilha()
+    if pilha:
+        pilha[-1].registrar(linhas, figura)
+
+
+def medidor(arquivo):
+    """``medir`` já ligado à página do script ``arquivo`` (use ``__file__``)."""
+    pagina = os.path.splitext(os.path.basename(arquivo))[0]
+    return partial(medir, pagina)
+
+
+def medidas():
+    """Cópia das medidas do buffer, da mais antiga para a mais recente."""
+    with _trava:
+        return list(_buffer())
+
+
+def exibir_painel():
+    """Painel de desempenho na barra lateral, se ligado nesta sessão.
+
+    Chamado no fim de cada página, depois das seções; seções em fragmentos
+    reexecutadas sozinhas só aparecem no próximo rerun completo.
+    """
+    if not painel_ativo():
+        return
+
+    tabela = pd.DataFrame(
+        medidas(),
+        columns=["momento", "pagina", "secao", "segundos", "linhas", "bytes_figura", "erro"],
+    )
+    figuras = cache_figuras().estatisticas()
+    consultas = figuras["acertos"] + figuras["falhas"]
+    with st.sidebar.expander("Desempenho das seções", expanded=True):
+        st.caption(
+            f"Cache de figuras: {figuras['acertos']} acertos e {figuras['falhas']} falhas"
+            + (f" ({figuras['acertos'] / consultas:.0%} de acertos)" if consultas else "")
+            + f", {figuras['itens']} de {figuras['max_itens']} figuras guardadas."
+        )
+
+        if tabela.empty:
+            st.caption("Nenhuma medida registrada ainda.")
+            return
+
+        # Resumo por seção, das mais lentas para as mais rápidas
+        resumo = (
+            tabela.groupby(["pagina", "secao"])
+            .agg(
+                execucoes=("segundos", "size"),
+                media_s=("segundos", "mean"),
+                p95_s=("segundos", lambda s: s.quantile(0.95)),
+                max_s=("segundos", "max"),
+                linhas=("linhas", "last"),
+                bytes_figura=("bytes_figura", "last"),
+            )
+            .sort_values("p95_s", ascending=False)
+            .reset_index()
+        )
+        st.caption(f"{len(tabela)} medidas no buffer (máximo de {MAX_MEDIDAS}), de todas as sessões.")
+        st.dataframe(resumo, hide_index=True, width="stretch")
+
+        st.caption("Medidas mais recentes")
+        st.dataframe(tabela.iloc[::-1].head(MEDIDAS_EXIBIDAS), hide_index=True, width="stretch")
+
+        if caminho_log():
+            st.caption(f"Log JSONL: {caminho_log()}")
@@ -0,0 +1,90 @@
+"""Tabela de empresas: identificador estável e nome canônico.
+
+Na base as empresas só aparecem pelo nome (``emp``), escrito de formas
+diferentes entre os anos ("ALAGOAS ATIVOS S/A" e "ALAGOAS ATIVOS S.A", por
+exemplo). Ao tipar a base cada linha recebe o identificador inteiro da sua
+empresa (``emp_id``, um hash de estado e nome normalizado, ver
+``estatais.snapshot.identificar_empresas``); aqui fica a tabela desses
+identificadores com o nome canônico de cada um, que é a grafia usada no ano
+mais recente.
+
+``HistoricoEmpresas`` guarda a base ordenada por empresa e ano e o início do
+trecho de cada ``emp_id``: o histórico de uma empresa é uma fatia contígua,
+obtida com uma busca binária nos identificadores, sem varrer a base.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from estatais.dados import carregar_dados, versao_base
+from estatais.snapshot import COLUNA_ID_EMPRESA, chave_empresa
+
+
+def tabela_empresas(df):
+    """Uma linha por ``emp_id``: estado, nome canônico, grafias e anos.
+
+    As linhas seguem a ordem de estado e nome normalizado, não a dos
+    identificadores (que são hashes).
+    """
+    recentes = df.sort_values("Ano", ascending=False, kind="stable")
+    grupos = recentes.groupby(COLUNA_ID_EMPRESA, sort=False)
+    tabela = pd.DataFrame({
+        "Estado": grupos["Estado"].first().astype(str),
+        "nome": grupos["emp"].first(),
+        "grafias": grupos["emp"].nunique(),
+        "primeiro_ano": grupos["Ano"].min(),
+        "ultimo_ano": grupos["Ano"].max(),
+    })
+    tabela.index.name = COLUNA_ID_EMPRESA
+    ordem = np.lexsort((chave_empresa(tabela["nome"]).to_numpy(dtype=object), tabela["Estado"].to_numpy()))
+    return tabela.iloc[ordem]
+
+
+class HistoricoEmpresas:
+    """Linhas de cada empresa em um trecho contíguo, em ordem de ano."""
+
+    def __init__(self, df):
+        ids = df[COLUNA_ID_EMPRESA].to_numpy()
+        ordem = np.lexsort((df["Ano"].to_numpy(), ids))
+        self.base = df.take(ordem)
+        # Identificadores em ordem crescente; as linhas de ids[i] ficam em inicio[i]:inicio[i + 1]
+        self.ids, inicio = np.unique(ids[ordem], return_index=True)
+        self.inicio = np.append(inicio, len(ordem))
+
+    def historico(self, emp_id):
+        """Linhas da empresa ``emp_id``, uma por ano (vazio se não existir)."""
+        posicao = np.searchsorted(self.ids, emp_id)
+        if posicao == len(self.ids) or self.ids[posicao] != emp_id:
+            return self.base.iloc[0:0]
+        return self.base.iloc[self.inicio[posicao]:self.inicio[posicao + 1]]
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _carregar_empresas(versao):
+    return tabela_empresas(carregar_dados())
+
+
+def carregar_empresas():
+    """Tabela de empresas da versão atual da base, compartilhada entre sessões."""
+    return _carregar_empresas(versao_base())
+
+
+def nome_empresa(ids):
+    """Nome canônico de cada identificador, alinhado ao índice de ``ids``."""
+    nomes = carregar_empresas()["nome"]
+    return pd.Series(
+        nomes.reindex(np.asarray(ids)).to_numpy(),
+        index=getattr(ids, "index", None),
+        name="emp",
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _carregar_historicos(versao):
+    return HistoricoEmpresas(carregar_dados())
+
+
+def carregar_historicos():
+    """Índice de históricos por empresa da versão atual da base."""
+    return _carregar_historicos(versao_base())
@@ -0,0 +1,211 @@
+"""Cache compartilhado de figuras já renderizadas.
+
+Os gráficos do comparativo entre estados dependem apenas dos filtros
+escolhidos (anos, estados e tipo de gráfico). Cada figura é guardada em um
+LRU limitado, compartilhado entre sessões, sob uma chave canônica desses
+filtros: voltar a uma seleção já vista, ou abrir a página com a seleção
+padrão, não redesenha nada.
+
+Figuras matplotlib são guardadas como bytes já exportados (PNG para a tela;
+PNG em alta resolução, SVG ou PDF para download, gerados só quando o botão é
+clicado) e descartadas logo depois, de modo que nenhuma figura sobrevive ao
+rerun. As figuras matplotlib são criadas com ``nova_figura``, fora do pyplot:
+cada uma tem o seu próprio canvas Agg e nenhuma passa pelo estado global do
+pyplot (figura/eixos "atuais", lista de figuras abertas), de modo que sessões
+diferentes podem desenhar em paralelo, cada uma na sua thread, sem travas.
+Figuras Plotly são guardadas como o próprio objeto ``go.Figure``, que
+deve ser tratado como somente leitura (reconstruí-lo a partir do JSON custa
+mais do que desenhá-lo de novo).
+"""
+
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+
+import matplotlib as mpl
+import numpy as np
+import streamlit as st
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from estatais.dados import versao_base
+
+# Número máximo de figuras mantidas em memória
+MAX_FIGURAS = 32
+
+# Resolução das figuras matplotlib exibidas na tela (a mesma do st.pyplot)
+DPI_TELA = 200
+
+# Resolução dos arquivos PNG oferecidos para download
+DPI_DOWNLOAD = 300
+
+# Formatos de download: extensão e tipo MIME
+FORMATOS_DOWNLOAD = {
+    "PNG": ("png", "image/png"),
+    "SVG": ("svg", "image/svg+xml"),
+    "PDF": ("pdf", "application/pdf"),
+}
+
+
+def _canonizar(valor):
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, (list, tuple, set, frozenset, range, np.ndarray)):
+        itens = {_canonizar(item) for item in valor}
+        return sorted(itens, key=lambda item: (type(item).__name__, item))
+    return valor
+
+
+def chave_figura(grafico, /, **filtros):
+    """Hash canônico de um gráfico: seu nome mais os filtros aplicados.
+
+    A ordem dos valores selecionados não importa: ``Ano=[2021, 2020]`` e
+    ``Ano=[2020, 2021]`` produzem a mesma chave.
+    """
+    canonico = {"grafico": grafico}
+    canonico.update({nome: _canonizar(valor) for nome, valor in filtros.items()})
+    texto = json.dumps(canonico, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+
+class CacheFiguras:
+    """LRU de figuras renderizadas, seguro para uso entre sessões (threads)."""
+
+    def __init__(self, max_itens=MAX_FIGURAS):
+        self.max_itens = max_itens
+        self.acertos = 0
+        self.falhas = 0
+        self._itens = OrderedDict()
+        self._trava = threading.Lock()
+
+    def obter(self, chave, construir):
+        """Devolve a figura de ``chave``, chamando ``construir()`` se faltar."""
+        with self._trava:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return self._itens[chave]
+            self.falhas += 1
+
+        # Renderiza fora da trava para não bloquear as demais sessões
+        valor = construir()
+
+        with self._trava:
+            self._itens[chave] = valor
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.max_itens:
+                self._itens.popitem(last=False)
+        return valor
+
+    def estatisticas(self):
+        """Contadores de acertos e falhas e ocupação atual (ver o painel de desempenho)."""
+        with self._trava:
+            return {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "itens": len(self._itens),
+                "max_itens": self.max_itens,
+            }
+
+    def limpar(self):
+        with self._trava:
+            self._itens.clear()
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _cache_figuras(versao):
+    return CacheFiguras()
+
+
+def cache_figuras():
+    """Cache de figuras da versão atual da base (descartado se a base mudar)."""
+    return _cache_figuras(versao_base())
+
+
+def nova_figura(figsize):
+    """Figura matplotlib com canvas Agg próprio, sem registro no pyplot.
+
+    Substitui ``plt.subplots``: a figura não entra na lista global do
+    pyplot e é liberada pelo coletor de lixo assim que deixa de ser usada.
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def barras_empilhadas(ax, tabela, largura=0.5):
+    """Barras empilhadas de cada coluna de ``tabela``, uma pilha por linha.
+
+    Reproduz ``tabela.plot(kind="bar", stacked=True, ax=ax, width=largura)``
+    sem passar pelo pyplot: valores positivos e negativos são empilhados
+    separadamente, as cores seguem o ciclo padrão e cada coluna vira um
+    item da legenda. Rótulos do eixo X ficam a cargo de quem chama.
+    """
+    cores = mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+    valores = tabela.fillna(0).to_numpy(dtype=np.float64)
+    posicoes = np.arange(len(tabela))
+    positivos = np.zeros(len(tabela))
+    negativos = np.zeros(len(tabela))
+    for i, coluna in enumerate(tabela.columns):
+        y = valores[:, i]
+        sinal = y >= 0
+        ax.bar(
+            posicoes, y, largura,
+            bottom=np.where(sinal, positivos, negativos),
+            color=cores[i % len(cores)],
+            label=str(coluna),
+        )
+        positivos = positivos + np.where(sinal, y, 0)
+        negativos = negativos + np.where(sinal, 0, y)
+    ax.set_xlim(-0.25 - largura / 2, len(tabela) - 0.75 + largura / 2)
+
+
+def exportar_matplotlib(fig, formato="png", dpi=DPI_TELA):
+    """Exporta uma figura matplotlib em bytes, com o mesmo recorte do st.pyplot."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=formato, dpi=dpi, bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def imagem_matplotlib(chave, desenhar, formato="png", dpi=DPI_TELA, cache=None):
+    """Bytes da figura ``chave`` no formato pedido, desenhando-a só se faltar.
+
+    ``desenhar`` devolve uma figura matplotlib nova (ver ``nova_figura``),
+    que é esvaziada assim que exportada.
+    """
+    if cache is None:
+        cache = cache_figuras()
+
+    def construir():
+        fig = desenhar()
+        try:
+            return exportar_matplotlib(fig, formato, dpi)
+        finally:
+            fig.clear()
+
+    return cache.obter(chave_figura(chave, formato=formato, dpi=dpi), construir)
+
+
+def botoes_download(chave, desenhar, nome_arquivo, rotulo="Baixar Gráfico"):
+    """Botões de download da figura em PNG, SVG e PDF.
+
+    Os arquivos só são gerados quando o botão é clicado e ficam no cache de
+    figuras sob ``chave``; ``nome_arquivo`` é o nome sem extensão.
+    """
+    # O clique é atendido fora do script: o cache é resolvido agora
+    cache = cache_figuras()
+    colunas = st.columns(len(FORMATOS_DOWNLOAD), width=480)
+    for coluna, (nome, (extensao, mime)) in zip(colunas, FORMATOS_DOWNLOAD.items()):
+        dpi = DPI_DOWNLOAD if extensao == "png" else DPI_TELA
+        with coluna:
+            st.download_button(
+                label=rotulo if extensao == "png" else nome,
+                data=lambda extensao=extensao, dpi=dpi: imagem_matplotlib(
+                    chave, desenhar, extensao, dpi, cache
+                ),
+                file_name=f"{nome_arquivo}.{extensao}",
+                mime=mime,
+                key=f"download_{chave}_{extensao}",
+            )
@@ -0,0 +1,112 @@
+"""Base ordenada por (Estado, Ano) para recortes sem máscaras booleanas.
+
+As páginas filtravam a base com ``df[(df["Estado"] == "DF") & (df["Ano"] == 2023)]``,
+o que aloca duas máscaras do tamanho da base inteira a cada recorte. Aqui a
+base é ordenada uma única vez por versão (ordenação estável: dentro de cada
+par Estado/Ano a ordem original das linhas é mantida) junto com uma chave
+inteira ``código do estado × anos + deslocamento do ano``; como na base
+original, os anos mais recentes vêm primeiro dentro de cada estado. Um recorte por
+estado e intervalo de anos é um trecho contíguo dessa ordem, localizado por
+busca binária (``np.searchsorted``) e devolvido como fatia ``iloc``, sem cópia.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from estatais.dados import carregar_dados, versao_base
+
+
+def _intervalos_anos(ano):
+    # Agrupa os anos pedidos em intervalos contíguos [inicio, fim], do mais recente
+    if isinstance(ano, range) and ano.step == 1:
+        return [(ano.start, ano.stop - 1)] if len(ano) else []
+    if not isinstance(ano, (list, tuple, set, frozenset, range, np.ndarray, pd.Index)):
+        return [(ano, ano)]
+
+    anos = sorted({int(a) for a in ano}, reverse=True)
+    intervalos = []
+    for a in anos:
+        if intervalos and a == intervalos[-1][0] - 1:
+            intervalos[-1] = (a, intervalos[-1][1])
+        else:
+            intervalos.append((a, a))
+    return intervalos
+
+
+class IndiceEstadoAno:
+    """Base ordenada por (Estado, Ano) e as chaves usadas na busca binária."""
+
+    def __init__(self, df):
+        anos = df["Ano"].to_numpy(dtype=np.int64)
+        self.ano_min = int(anos.min())
+        self.ano_max = int(anos.max())
+        self.amplitude = self.ano_max - self.ano_min + 1
+
+        estados = df["Estado"].astype("category")
+        self.estados = {estado: codigo for codigo, estado in enumerate(estados.cat.categories)}
+        codigos = estados.cat.codes.to_numpy(dtype=np.int64)
+
+        # Linhas sem estado (código -1) ficam no início e nunca são recortadas
+        chaves = codigos * self.amplitude + (self.ano_max - anos)
+        ordem = np.argsort(chaves, kind="stable")
+        self.chaves = chaves[ordem]
+        self.base = df.take(ordem)
+
+    def _limites(self, codigo, inicio, fim):
+        # Deslocamentos contados a partir do ano mais recente
+        primeiro = self.ano_max - min(fim, self.ano_max)
+        ultimo = self.ano_max - max(inicio, self.ano_min)
+        if primeiro > ultimo:
+            return 0, 0
+        base = codigo * self.amplitude
+        return (
+            int(np.searchsorted(self.chaves, base + primeiro, side="left")),
+            int(np.searchsorted(self.chaves, base + ultimo, side="right")),
+        )
+
+    def fatia(self, estado=None, ano=None):
+        """Linhas de ``estado`` em ``ano`` (valor único ou lista; ``None`` = todos).
+
+        Um estado e um intervalo contíguo de anos (ex.: ``range(2020, 2024)``)
+        resultam em uma fatia sem cópia da base ordenada; combinações com
+        mais de um trecho são reunidas com ``take``. O DataFrame devolvido
+        não deve ser alterado in-place (use ``.copy()`` antes de modificar).
+        """
+        if estado is None:
+            codigos = range(len(self.estados))
+        elif isinstance(estado, (list, tuple, set, frozenset, pd.Index)):
+            codigos = sorted(self.estados[e] for e in estado if e in self.estados)
+        else:
+            codigos = [self.estados[estado]] if estado in self.estados else []
+
+        intervalos = [(self.ano_min, self.ano_max)] if ano is None else _intervalos_anos(ano)
+
+        trechos = [
+            (inicio, fim)
+            for codigo in codigos
+            for ano_inicio, ano_fim in intervalos
+            for inicio, fim in [self._limites(codigo, ano_inicio, ano_fim)]
+            if fim > inicio
+        ]
+        if not trechos:
+            return self.base.iloc[0:0]
+        if len(trechos) == 1:
+            inicio, fim = trechos[0]
+            return self.base.iloc[inicio:fim]
+        return self.base.take(np.concatenate([np.arange(inicio, fim) for inicio, fim in trechos]))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _carregar_indice(versao):
+    return IndiceEstadoAno(carregar_dados())
+
+
+def carregar_indice():
+    """Índice (Estado, Ano) da versão atual da base, compartilhado entre sessões."""
+    return _carregar_indice(versao_base())
+
+
+def fatia(estado=None, ano=None):
+    """Recorte da base por estado e ano; atalho para ``carregar_indice().fatia``."""
+    return carregar_indice().fatia(estado, ano)
@@ -0,0 +1,43 @@
+"""Indicadores derivados de cada linha da base (empresa × ano).
+
+A rentabilidade (lucro / PL × 100) era recalculada em várias seções, cada
+uma com o seu filtro de PL. Aqui os indicadores são calculados uma única vez,
+de forma vetorizada, ao tipar a base (ver ``estatais.snapshot.tipar_base``),
+e gravados no snapshot como colunas float64. Todos seguem a mesma regra:
+quando o denominador é ausente, zero ou negativo o indicador fica ausente
+(NaN), em vez de infinito ou de um valor sem sentido (rentabilidade sobre PL
+negativo, payout sobre prejuízo, custo por empregado sem empregados).
+"""
+
+import numpy as np
+import pandas as pd
+
+# Indicador -> (numerador, denominador, fator)
+METRICAS = {
+    # Lucro ou prejuízo sobre o patrimônio líquido (%)
+    "rentabilidade": ("lucros", "PL", 100),
+    # Dividendos pagos sobre o lucro do ano (%)
+    "payout": ("Dividendos", "lucros", 100),
+    # Subvenção recebida do estado por empregado (R$)
+    "subvencao_por_empregado": ("Subvenção", "qde_empregados", 1),
+    # Despesa com pessoal por empregado (R$)
+    "custo_por_empregado": ("desp_pessoal", "qde_empregados", 1),
+}
+
+# Colunas acrescentadas à base por ``adicionar_metricas``
+COLUNAS_METRICAS = list(METRICAS)
+
+
+def razao(numerador, denominador, fator=1):
+    """``numerador / denominador × fator``, ausente onde o denominador não é positivo."""
+    numerador = pd.Series(numerador, dtype="float64")
+    denominador = pd.Series(denominador, dtype="float64")
+    return (numerador / denominador.where(denominador > 0)) * fator
+
+
+def adicionar_metricas(df):
+    """Acrescenta a ``df`` as colunas de ``METRICAS`` cujas colunas de origem existem."""
+    for coluna, (numerador, denominador, fator) in METRICAS.items():
+        if numerador in df.columns and denominador in df.columns:
+            df[coluna] = razao(df[numerador], df[denominador], fator).to_numpy(dtype=np.float64)
+    return df
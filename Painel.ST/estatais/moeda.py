@@ -0,0 +1,81 @@
+"""Valores monetários em centavos inteiros.
+
+Os valores da base têm no máximo duas casas decimais, mas são lidos em reais
+como float64: somas entre empresas e anos acumulam erro de arredondamento e
+o total depende da ordem das parcelas. Em centavos (int64) as somas são
+exatas e reproduzíveis; a volta para reais acontece só na exibição.
+
+Ao tipar a base (ver ``estatais.snapshot.tipar_base``), cada coluna
+monetária ganha ao lado uma coluna em centavos (Int64), gravada no
+snapshot: "lucros" e "lucros (centavos)". As colunas em reais continuam
+servindo para razões, filtros e gráficos linha a linha; as somas usam as
+colunas em centavos com o ``"sum"`` do próprio pandas, e ``para_reais`` só
+é aplicado ao resultado.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Colunas com valores em reais
+COLUNAS_MONETARIAS = [
+    "PL",
+    "lucros",
+    "Dividendos",
+    "Subvenção",
+    "Reforço de Capital",
+    "capital",
+    "desp_pessoal",
+    "desp_investimento",
+    "Resultado para o Estado Acionista",
+]
+
+# Sufixo das colunas em centavos gravadas na base
+SUFIXO_CENTAVOS = " (centavos)"
+
+
+def coluna_centavos(coluna):
+    """Nome da coluna em centavos correspondente a ``coluna`` (em reais)."""
+    return f"{coluna}{SUFIXO_CENTAVOS}"
+
+
+def para_centavos(valores):
+    """Converte reais (float) em centavos inteiros, preservando os ausentes (Int64)."""
+    return np.rint(pd.Series(valores, dtype="float64") * 100).astype("Int64")
+
+
+def para_reais(centavos):
+    """Converte centavos em reais (float64, ausentes como NaN)."""
+    if np.ndim(centavos) == 0:
+        return float(centavos) / 100
+    return (centavos.astype("Float64") / 100).astype("float64")
+
+
+def adicionar_centavos(df):
+    """Acrescenta a ``df`` a coluna em centavos de cada coluna monetária presente."""
+    for coluna in COLUNAS_MONETARIAS:
+        if coluna in df.columns:
+            df[coluna_centavos(coluna)] = para_centavos(df[coluna])
+    return df
+
+
+def em_centavos(df):
+    """Cópia de ``df`` com as colunas monetárias em centavos, sob os nomes originais.
+
+    Aproveita as colunas em centavos já presentes (ver ``adicionar_centavos``),
+    que saem do resultado; as que faltarem são convertidas.
+    """
+    presentes = [coluna for coluna in COLUNAS_MONETARIAS if coluna in df.columns]
+    centavos = {
+        coluna: df[coluna_centavos(coluna)] if coluna_centavos(coluna) in df.columns else para_centavos(df[coluna])
+        for coluna in presentes
+    }
+    return df.drop(columns=[c for c in map(coluna_centavos, presentes) if c in df.columns]).assign(**centavos)
+
+
+def em_reais(df):
+    """Cópia de ``df`` com as colunas monetárias em centavos de volta para reais."""
+    return df.assign(**{
+        coluna: para_reais(df[coluna])
+        for coluna in COLUNAS_MONETARIAS
+        if coluna in df.columns and pd.api.types.is_integer_dtype(df[coluna])
+    })
@@ -0,0 +1,119 @@
+"""Empresas semelhantes (pares) na base nacional.
+
+Cada linha da base (uma empresa em um ano) vira um vetor de atributos:
+setor e espécie em codificação one-hot e PL, quantidade de empregados,
+despesa com pessoal e capital em escala logarítmica com sinal, padronizados
+(média 0, desvio 1). A matriz é montada uma vez por versão da base, ordenada
+por ano, com as normas das linhas já calculadas; os pares de uma empresa são
+as ``k`` linhas mais próximas do mesmo ano, obtidas com uma única
+multiplicação matriz-vetor (``|x - y|² = |x|² + |y|² - 2 x·y``) e
+``np.argpartition``.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from estatais.dados import carregar_dados, versao_base
+from estatais.snapshot import COLUNA_ID_EMPRESA
+
+# Atributos usados para medir a semelhança entre empresas
+COLUNAS_PARES_CATEGORICAS = ["setor", "esp"]
+COLUNAS_PARES_NUMERICAS = ["PL", "qde_empregados", "desp_pessoal", "capital"]
+
+# Peso de cada atributo categórico: com peso 1, setor ou espécie diferentes
+# somam 2 à distância ao quadrado, o mesmo que ~1,4 desvio em um atributo numérico
+PESO_CATEGORICO = 1.0
+
+
+def _escala_log(valores):
+    # Log com sinal: aproxima empresas de portes muito diferentes sem perder o sinal do PL
+    return np.sign(valores) * np.log1p(np.abs(valores))
+
+
+def matriz_atributos(df):
+    """Matriz (linhas × atributos, float32) usada na busca de pares."""
+    partes = []
+    for coluna in COLUNAS_PARES_CATEGORICAS:
+        partes.append(PESO_CATEGORICO * pd.get_dummies(df[coluna], dtype="float64").to_numpy())
+
+    numericos = _escala_log(df[COLUNAS_PARES_NUMERICAS].to_numpy(dtype="float64", na_value=np.nan))
+    media = np.nanmean(numericos, axis=0)
+    desvio = np.nanstd(numericos, axis=0)
+    desvio[~(desvio > 0)] = 1.0
+    # Valores ausentes ficam na média (0 após a padronização)
+    partes.append(np.nan_to_num((numericos - media) / desvio, nan=0.0))
+
+    return np.hstack(partes).astype(np.float32)
+
+
+class IndicePares:
+    """Matriz de atributos da base, ordenada por ano, para busca dos vizinhos mais próximos."""
+
+    def __init__(self, df):
+        ordem = np.argsort(df["Ano"].to_numpy(), kind="stable")
+        self.base = df.take(ordem)
+        self.matriz = matriz_atributos(self.base)
+        self.normas = np.einsum("ij,ij->i", self.matriz, self.matriz)
+
+        # Linhas de cada ano em um trecho contíguo da matriz
+        anos, inicios = np.unique(self.base["Ano"].to_numpy(), return_index=True)
+        fins = np.append(inicios[1:], len(self.base))
+        self.anos = {int(ano): (int(inicio), int(fim)) for ano, inicio, fim in zip(anos, inicios, fins)}
+
+        # Anos com dados de cada empresa (os anos que a busca pode oferecer)
+        anos_empresa = self.base.groupby(COLUNA_ID_EMPRESA, sort=False)["Ano"].unique()
+        self._anos_empresa = {
+            int(emp_id): sorted((int(ano) for ano in anos), reverse=True)
+            for emp_id, anos in anos_empresa.items()
+        }
+
+    def anos_da_empresa(self, emp_id):
+        """Anos em que ``emp_id`` aparece na base, do mais recente ao mais antigo."""
+        return self._anos_empresa.get(int(emp_id), [])
+
+    def pares(self, emp_id, ano, k=5, excluir_estado=False):
+        """As ``k`` empresas mais parecidas com ``emp_id`` em ``ano``, da mais próxima à mais distante.
+
+        Devolve as linhas da base com a coluna ``distancia``; a primeira linha
+        é a própria empresa (distância 0). Com ``excluir_estado`` os pares
+        vêm só de outros estados. Se a empresa não tem dados no ano, o
+        resultado é vazio.
+        """
+        inicio, fim = self.anos.get(int(ano), (0, 0))
+        ids = self.base[COLUNA_ID_EMPRESA].to_numpy()[inicio:fim]
+        encontrada = np.flatnonzero(ids == emp_id)
+        if len(encontrada) == 0:
+            return self.base.iloc[0:0].assign(distancia=pd.Series(dtype="float64"))
+        alvo = inicio + int(encontrada[0])
+
+        x = self.matriz[alvo]
+        distancias = self.normas[inicio:fim] + self.normas[alvo] - 2 * (self.matriz[inicio:fim] @ x)
+        distancias = np.sqrt(np.maximum(distancias, 0))
+        distancias[alvo - inicio] = np.inf
+
+        candidatos = np.ones(fim - inicio, dtype=bool)
+        if excluir_estado:
+            estados = self.base["Estado"].to_numpy()[inicio:fim]
+            candidatos = estados != estados[alvo - inicio]
+        posicoes = np.flatnonzero(candidatos & np.isfinite(distancias))
+
+        k = min(k, len(posicoes))
+        if k:
+            proximos = np.argpartition(distancias[posicoes], k - 1)[:k]
+            posicoes = posicoes[proximos[np.argsort(distancias[posicoes][proximos], kind="stable")]]
+        else:
+            posicoes = posicoes[:0]
+
+        linhas = np.concatenate([[alvo], inicio + posicoes])
+        return self.base.iloc[linhas].assign(distancia=np.concatenate([[0.0], distancias[posicoes]]))
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _carregar_pares(versao):
+    return IndicePares(carregar_dados())
+
+
+def carregar_pares():
+    """Índice de pares da versão atual da base, compartilhado entre sessões."""
+    return _carregar_pares(versao_base())
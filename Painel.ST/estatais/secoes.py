@@ -0,0 +1,18 @@
+"""Renderização sob demanda das seções das páginas longas.
+
+Cada seção é uma função decorada com ``st.fragment`` e exibida em uma aba.
+Só a aba aberta é executada, de modo que o tempo até o primeiro gráfico não
+depende do tamanho da página, e interações dentro de uma seção reexecutam
+apenas aquela seção.
+"""
+
+import streamlit as st
+
+
+def exibir_secoes(secoes, key):
+    """Mostra ``secoes`` (pares título/função) em abas, executando só a aberta."""
+    abas = st.tabs([titulo for titulo, _ in secoes], key=key, on_change="rerun")
+    for (_, secao), aba in zip(secoes, abas):
+        if aba.open:
+            with aba:
+                secao()
@@ -0,0 +1,273 @@
+"""Snapshot colunar tipado (Arrow/Feather) da base nacional.
+
+A base original é um CSV/JSON com textos: valores monetários como
+" R$ 198,465.44 " e indicadores "SIM"/"NÃO"/"TRUE". Este módulo converte tudo
+uma única vez para tipos de verdade (categorias, booleanos e números), com
+uma cópia em centavos inteiros de cada coluna monetária (ver
+``estatais.moeda``), e grava o resultado em um arquivo Feather sem
+compressão, que pode ser lido por memory-map nas próximas inicializações.
+
+Uso na linha de comando (a partir de Painel.ST):
+
+    python -m estatais.snapshot [origem.csv|origem.json] [destino.feather]
+"""
+
+import argparse
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow é opcional: sem ele o painel lê o CSV
+    pa = None
+    feather = None
+
+from estatais.metricas import adicionar_metricas
+from estatais.moeda import adicionar_centavos
+
+# Dimensões com poucos valores distintos, guardadas como categorias
+COLUNAS_CATEGORICAS = ["Estado", "setor", "dep", "esp", "sit", "REGIAO"]
+
+# Indicadores de estruturas de governança (Conselho de Administração,
+# Conselho Fiscal e Comitê de Auditoria)
+COLUNAS_GOVERNANCA = ["gov_ca", "gov_cf", "gov_aud"]
+
+# Peso de cada estrutura no código de governança de 3 bits (CA=4, CF=2, COAUD=1)
+PESOS_GOVERNANCA = dict(zip(COLUNAS_GOVERNANCA, [4, 2, 1]))
+
+# Coluna pré-calculada com o código de governança (0 a 7) de cada linha
+COLUNA_CODIGO_GOVERNANCA = "gov_codigo"
+
+# Identificador inteiro da empresa, estável entre os anos e entre versões da base
+COLUNA_ID_EMPRESA = "emp_id"
+
+# Indicadores guardados como booleanos
+COLUNAS_BOOLEANAS = COLUNAS_GOVERNANCA + ["gov", "result_NA"]
+
+# Colunas monetárias armazenadas como texto formatado em reais
+COLUNAS_MOEDA = ["maior_rem"]
+
+# Textos interpretados como "verdadeiro" nos indicadores: "SIM" nas
+# estruturas de governança e "TRUE" em gov/result_NA. Como nas páginas
+# originais, grafias como "Possui" não contam como estrutura presente.
+VALORES_VERDADEIROS = ["SIM", "TRUE"]
+
+# Rótulos padronizados da dependência financeira
+DEPENDENTE = "Dependente"
+NAO_DEPENDENTE = "Não Dependente"
+NAO_INFORMADO = "Não Informado"
+
+# Chave de metadados com o hash do arquivo de origem
+CHAVE_VERSAO = b"estatais.versao_origem"
+
+# Versão do formato do snapshot; incrementar sempre que ``tipar_base`` mudar,
+# para que snapshots antigos sejam descartados e regerados
+VERSAO_FORMATO = 8
+
+
+def converter_moeda(serie):
+    """Converte textos como " R$ 198,465.44 " em float, de forma vetorizada."""
+    if pd.api.types.is_numeric_dtype(serie):
+        return serie.astype("float64")
+    limpo = serie.astype("string").str.replace(r"[R$\s,]", "", regex=True)
+    return pd.to_numeric(limpo, errors="coerce").astype("float64")
+
+
+def converter_booleano(serie):
+    """Converte indicadores textuais ("SIM"/"NÃO", "TRUE"/"FALSE") em bool.
+
+    Valores ausentes ou fora de ``VALORES_VERDADEIROS`` são ``False``.
+    """
+    if pd.api.types.is_bool_dtype(serie):
+        return serie.astype(bool)
+    texto = serie.astype("string").str.strip().str.upper()
+    return texto.isin(VALORES_VERDADEIROS).fillna(False).astype(bool)
+
+
+def padronizar_dependencia(serie):
+    """Unifica grafias de "dep" (maiúsculas/minúsculas, ausentes)."""
+    texto = serie.astype("string").str.strip().str.upper()
+    padronizada = pd.Series(NAO_INFORMADO, index=serie.index, dtype=object)
+    padronizada[(texto == DEPENDENTE.upper()).fillna(False)] = DEPENDENTE
+    padronizada[(texto == NAO_DEPENDENTE.upper()).fillna(False)] = NAO_DEPENDENTE
+    return padronizada
+
+
+def _marca_versao(versao_origem):
+    return f"{VERSAO_FORMATO}:{versao_origem}".encode()
+
+
+def codificar_governanca(df):
+    """Combina os indicadores de governança em um código de 3 bits (int8)."""
+    codigo = np.zeros(len(df), dtype=np.int8)
+    for coluna, peso in PESOS_GOVERNANCA.items():
+        if coluna in df.columns:
+            codigo |= df[coluna].to_numpy(dtype=bool) * np.int8(peso)
+    return pd.Series(codigo, index=df.index, name=COLUNA_CODIGO_GOVERNANCA)
+
+
+def chave_empresa(nomes):
+    """Forma normalizada dos nomes das empresas, para comparar grafias.
+
+    Remove acentos, pontuação e espaços e passa para maiúsculas: "Gás de
+    Alagoas S/A - ALGÁS" e "GAS DE ALAGOAS S.A - ALGAS" têm a mesma chave.
+    """
+    texto = nomes.astype("string").str.normalize("NFKD")
+    texto = texto.str.replace("[\u0300-\u036f]", "", regex=True)
+    return texto.str.upper().str.replace(r"[^0-9A-Z]", "", regex=True)
+
+
+def _hash_empresa(chave):
+    # 63 bits do blake2b: inteiro positivo que cabe em int64
+    resumo = hashlib.blake2b(chave.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(resumo, "big") >> 1
+
+
+def identificar_empresas(df):
+    """Atribui a cada linha o identificador (int64) da sua empresa.
+
+    Linhas do mesmo estado com a mesma chave de nome (``chave_empresa``) são
+    a mesma empresa, ainda que o nome varie entre os anos. O identificador é
+    um hash de estado e chave: não depende das demais empresas da base, de
+    modo que continua o mesmo quando empresas entram ou saem e pode ser
+    guardado entre versões (na sessão, em links).
+    """
+    chaves = df["Estado"].astype("string").fillna("") + "|" + chave_empresa(df["emp"]).fillna("")
+    codigos, unicas = pd.factorize(chaves)
+    ids = np.array([_hash_empresa(chave) for chave in unicas], dtype=np.int64)
+    if len(np.unique(ids)) < len(ids):
+        raise ValueError("colisão de identificadores de empresa")
+    return pd.Series(ids[codigos], index=df.index, name=COLUNA_ID_EMPRESA)
+
+
+def tipar_base(df):
+    """Aplica os tipos definitivos à base bruta lida do CSV ou do JSON."""
+    df = df.rename(columns=lambda coluna: coluna.strip())
+
+    for coluna in COLUNAS_MOEDA:
+        if coluna in df.columns:
+            df[coluna] = converter_moeda(df[coluna])
+
+    if "dep" in df.columns:
+        df["dep"] = padronizar_dependencia(df["dep"])
+
+    for coluna in COLUNAS_BOOLEANAS:
+        if coluna in df.columns:
+            df[coluna] = converter_booleano(df[coluna])
+
+    df[COLUNA_CODIGO_GOVERNANCA] = codificar_governanca(df)
+
+    if "emp" in df.columns:
+        df[COLUNA_ID_EMPRESA] = identificar_empresas(df)
+
+    adicionar_metricas(df)
+    adicionar_centavos(df)
+
+    for coluna in COLUNAS_CATEGORICAS:
+        if coluna in df.columns:
+            df[coluna] = df[coluna].astype("category")
+
+    return df
+
+
+def ler_origem(caminho):
+    """Lê a base bruta a partir do CSV ou do JSON formatado."""
+    if not caminho.lower().endswith(".json"):
+        return pd.read_csv(caminho)
+
+    # No JSON os valores ausentes aparecem como "" e os números de colunas
+    # incompletas como texto; recupera os mesmos tipos que o CSV produziria
+    df = pd.read_json(caminho, orient="records", dtype=False).replace("", np.nan)
+    for coluna in df.columns:
+        if df[coluna].dtype == object:
+            numerica = pd.to_numeric(df[coluna], errors="coerce")
+            if numerica.notna().sum() == df[coluna].notna().sum():
+                df[coluna] = numerica
+            else:
+                df[coluna] = df[coluna].astype("str").where(df[coluna].notna())
+    return df
+
+
+def caminho_snapshot(caminho_origem):
+    """Caminho padrão do snapshot: mesmo nome da origem, extensão .feather."""
+    return os.path.splitext(caminho_origem)[0] + ".feather"
+
+
+def salvar_snapshot(df, destino, versao_origem):
+    """Grava ``df`` como Feather sem compressão (permite memory-map).
+
+    Retorna ``False`` se o pyarrow não estiver disponível ou se a pasta de
+    destino não permitir escrita.
+    """
+    if pa is None:
+        return False
+
+    tabela = pa.Table.from_pandas(df, preserve_index=False)
+    metadados = dict(tabela.schema.metadata or {})
+    metadados[CHAVE_VERSAO] = _marca_versao(versao_origem)
+    tabela = tabela.replace_schema_metadata(metadados)
+
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    try:
+        feather.write_feather(tabela, temporario, compression="uncompressed")
+        os.replace(temporario, destino)
+    except OSError:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        return False
+    return True
+
+
+def ler_snapshot(caminho, versao_origem=None):
+    """Lê o snapshot por memory-map.
+
+    Com ``split_blocks`` cada coluna vira um bloco próprio do DataFrame: as
+    colunas numéricas sem valores ausentes (Ano, gov_codigo, emp_id...)
+    apontam direto para o arquivo mapeado, sem cópia. As demais (textos,
+    categorias, números com ausentes) precisam de conversão e são copiadas.
+
+    Retorna ``None`` se o arquivo não existir, se o pyarrow não estiver
+    disponível ou se o snapshot tiver sido gerado a partir de outra versão
+    da base de origem.
+    """
+    if pa is None or not os.path.exists(caminho):
+        return None
+
+    try:
+        tabela = feather.read_table(caminho, memory_map=True)
+    except (OSError, pa.ArrowInvalid):
+        return None
+
+    metadados = tabela.schema.metadata or {}
+    if versao_origem is not None and metadados.get(CHAVE_VERSAO) != _marca_versao(versao_origem):
+        return None
+
+    return tabela.to_pandas(split_blocks=True)
+
+
+def main(argv=None):
+    from estatais.dados import localizar_arquivo, versao_arquivo
+
+    parser = argparse.ArgumentParser(description="Gera o snapshot tipado da base nacional.")
+    parser.add_argument("origem", nargs="?", help="CSV ou JSON de origem (padrão: base do painel)")
+    parser.add_argument("destino", nargs="?", help="arquivo .feather de destino")
+    args = parser.parse_args(argv)
+
+    if pa is None:
+        parser.error("o pyarrow é necessário para gerar o snapshot")
+
+    origem = os.path.abspath(args.origem) if args.origem else localizar_arquivo()
+    destino = args.destino or caminho_snapshot(origem)
+
+    df = tipar_base(ler_origem(origem))
+    if not salvar_snapshot(df, destino, versao_arquivo(origem)):
+        parser.error(f"não foi possível gravar {destino}")
+    print(f"Snapshot gravado em {destino} ({len(df)} linhas, {os.path.getsize(destino)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Preparação concorrente das seções independentes de uma página.
+
+As seções longas separam o cálculo (recortes, agregações e montagem das
+figuras Plotly, sem nenhuma chamada ao Streamlit) da exibição. Cada cálculo
+vira uma tarefa nomeada de um ``GrafoTarefas``, executada em um pool de
+threads compartilhado; tarefas podem depender de outras e recebem os
+resultados delas como argumentos. A página agenda todas as tarefas logo no
+início e cada seção só espera pela sua, de modo que o tempo total se
+aproxima da seção mais lenta em vez da soma de todas.
+
+Uma tarefa só é enviada ao pool quando todas as suas dependências já
+terminaram; nenhuma thread do pool fica parada esperando outra tarefa.
+
+Os resultados dependem apenas da versão da base: o grafo de cada página é
+compartilhado entre sessões por até ``TEMPO_VIDA_GRAFO`` segundos, depois
+disso é descartado e a próxima carga recalcula as seções em paralelo.
+Os DataFrames e figuras devolvidos são os mesmos objetos para todas as
+sessões, sem cópia: são somente leitura, como nas figuras em cache (ver
+``estatais.figuras``), e quem precisar alterá-los deve usar ``.copy()``.
+"""
+
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+
+import streamlit as st
+
+from estatais.dados import versao_base
+
+# Threads do pool compartilhado por todas as páginas e sessões
+MAX_TRABALHADORES = 4
+
+# Segundos que os resultados de um grafo ficam guardados
+TEMPO_VIDA_GRAFO = 3600
+
+
+def _encerrar_pool(pool):
+    """Encerra o pool removido do cache, descartando as tarefas pendentes."""
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@st.cache_resource(show_spinner=False, on_release=_encerrar_pool)
+def _pool():
+    return ThreadPoolExecutor(max_workers=MAX_TRABALHADORES, thread_name_prefix="estatais-tarefa")
+
+
+class GrafoTarefas:
+    """Tarefas nomeadas com dependências, executadas no pool compartilhado."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self._futuros = {}
+        self._trava = threading.Lock()
+
+    def agendar(self, nome, funcao, dependencias=()):
+        """Agenda ``funcao(*resultados das dependencias)``, se ainda não agendada.
+
+        As dependências precisam ter sido agendadas antes; a função só vai
+        para o pool depois que todas terminarem. Uma tarefa que terminou com
+        erro (inclusive o de uma dependência) é agendada de novo na próxima
+        chamada.
+        """
+        with self._trava:
+            futuro = self._futuros.get(nome)
+            if futuro is not None and not (futuro.done() and futuro.exception() is not None):
+                return futuro
+            anteriores = [self._futuros[dependencia] for dependencia in dependencias]
+            futuro = self._futuros[nome] = Future()
+
+        if not anteriores:
+            self._enviar(futuro, funcao, anteriores)
+            return futuro
+
+        pendentes = [len(anteriores)]
+        trava = threading.Lock()
+
+        def dependencia_pronta(_):
+            with trava:
+                pendentes[0] -= 1
+                if pendentes[0]:
+                    return
+            self._enviar(futuro, funcao, anteriores)
+
+        for anterior in anteriores:
+            anterior.add_done_callback(dependencia_pronta)
+        return futuro
+
+    def _enviar(self, futuro, funcao, anteriores):
+        """Envia ``funcao`` ao pool com os resultados já prontos de ``anteriores``."""
+        for anterior in anteriores:
+            if anterior.exception() is not None:
+                futuro.set_exception(anterior.exception())
+                return
+        try:
+            execucao = self.pool.submit(funcao, *[anterior.result() for anterior in anteriores])
+        except RuntimeError as erro:
+            # Pool já encerrado (caches limpos): a tarefa será agendada de novo
+            futuro.set_exception(erro)
+            return
+        execucao.add_done_callback(lambda execucao: _transferir(execucao, futuro))
+
+    def resultado(self, nome):
+        """Resultado da tarefa ``nome``, esperando que termine se preciso.
+
+        O objeto devolvido é compartilhado entre sessões e não deve ser
+        alterado.
+        """
+        return self._futuros[nome].result()
+
+
+def _transferir(origem, destino):
+    """Copia o desfecho do futuro ``origem`` (já terminado) para ``destino``."""
+    if origem.cancelled():
+        destino.set_exception(CancelledError())
+    elif origem.exception() is not None:
+        destino.set_exception(origem.exception())
+    else:
+        destino.set_result(origem.result())
+
+
+@st.cache_resource(show_spinner=False, max_entries=8, ttl=TEMPO_VIDA_GRAFO)
+def _grafo_tarefas(pagina, versao):
+    return GrafoTarefas(_pool())
+
+
+def grafo_tarefas(pagina):
+    """Grafo de tarefas de ``pagina`` na versão atual da base."""
+    return _grafo_tarefas(pagina, versao_base())
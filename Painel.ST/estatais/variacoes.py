@@ -0,0 +1,156 @@
+"""Variações anuais pré-calculadas por empresa, setor, dependência e estado.
+
+Para cada nível de agregação a série anual de cada entidade é montada uma
+única vez por versão da base, em uma matriz ordenada por (entidade, ano).
+Variação absoluta e percentual, soma acumulada e taxa composta de
+crescimento (CAGR) saem de operações vetorizadas sobre essa matriz: o valor
+anterior é a linha de cima (deslocamento de uma linha) sempre que ela for da
+mesma entidade e do ano imediatamente anterior, e o início de cada entidade
+é propagado com ``np.maximum.accumulate``. Nenhuma página precisa de laços
+por entidade para mostrar tendências.
+
+As medidas monetárias são tratadas em centavos (ver ``estatais.moeda``):
+diferenças e acumulados são exatos e voltam para reais no final.
+"""
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from estatais.cubo import carregar_cubo
+from estatais.dados import carregar_dados, versao_base
+from estatais.moeda import COLUNAS_MONETARIAS, em_centavos
+from estatais.snapshot import COLUNA_ID_EMPRESA
+
+# Medidas acompanhadas ano a ano
+MEDIDAS_VARIACAO = COLUNAS_MONETARIAS + ["qde_empregados", "maior_rem"]
+
+# Nível de agregação -> colunas que identificam a entidade
+NIVEIS = {
+    "empresa": [COLUNA_ID_EMPRESA],
+    "estado": ["Estado"],
+    "setor": ["Estado", "setor"],
+    "dep": ["Estado", "dep"],
+}
+
+
+class TabelaVariacoes:
+    """Séries anuais de um nível, com variações, acumulados e CAGR.
+
+    ``valores``, ``variacao``, ``variacao_pct``, ``acumulado`` e ``cagr``
+    são DataFrames com o mesmo índice (colunas da entidade + ``Ano``,
+    ordenado) e uma coluna por medida. A variação percentual é calculada
+    sobre o valor absoluto do ano anterior, de modo que um déficit menor
+    aparece como variação positiva; o CAGR vai do primeiro ano da entidade
+    até cada ano e só existe quando os dois valores são positivos.
+    """
+
+    def __init__(self, chaves, somas, medidas):
+        somas = somas.sort_values(chaves + ["Ano"], kind="stable", ignore_index=True)
+        self.chaves = chaves
+        self.medidas = medidas
+
+        anos = somas["Ano"].to_numpy(dtype=np.int64)
+        valores = somas[medidas].to_numpy(dtype=np.float64, na_value=np.nan)
+        linhas = np.arange(len(somas))
+
+        # Início de cada entidade: linha em que alguma coluna da chave muda
+        novo = np.ones(len(somas), dtype=bool)
+        if len(somas):
+            iguais = np.ones(len(somas) - 1, dtype=bool)
+            for chave in chaves:
+                coluna = somas[chave].to_numpy()
+                iguais &= (coluna[1:] == coluna[:-1]) | (pd.isna(coluna[1:]) & pd.isna(coluna[:-1]))
+            novo[1:] = ~iguais
+        inicio = np.maximum.accumulate(np.where(novo, linhas, 0))
+
+        # Valor do ano anterior (linha de cima, se for a mesma entidade e o ano seguido)
+        consecutivo = np.zeros(len(somas), dtype=bool)
+        consecutivo[1:] = ~novo[1:] & (anos[1:] == anos[:-1] + 1)
+        anterior = np.full_like(valores, np.nan)
+        anterior[1:] = valores[:-1]
+        anterior[~consecutivo] = np.nan
+
+        variacao = valores - anterior
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variacao_pct = np.where(anterior != 0, variacao / np.abs(anterior) * 100, np.nan)
+
+        # Soma acumulada dentro da entidade (ausentes contam como zero)
+        soma = np.cumsum(np.nan_to_num(valores), axis=0)
+        acumulado = soma - (soma - np.nan_to_num(valores))[inicio]
+
+        # Taxa composta desde o primeiro ano da entidade
+        primeiro = valores[inicio]
+        periodos = (anos - anos[inicio]).astype(np.float64)[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cagr = np.where(
+                (periodos > 0) & (primeiro > 0) & (valores > 0),
+                (np.power(valores / primeiro, 1 / periodos) - 1) * 100,
+                np.nan,
+            )
+
+        indice = pd.MultiIndex.from_frame(somas[chaves + ["Ano"]])
+        monetarias = [medidas.index(m) for m in medidas if m in COLUNAS_MONETARIAS]
+
+        def tabela(matriz, centavos=True):
+            matriz = matriz.copy()
+            if centavos:
+                matriz[:, monetarias] /= 100
+            return pd.DataFrame(matriz, index=indice, columns=medidas)
+
+        self.valores = tabela(valores)
+        self.variacao = tabela(variacao)
+        self.variacao_pct = tabela(variacao_pct, centavos=False)
+        self.acumulado = tabela(acumulado)
+        self.cagr = tabela(cagr, centavos=False)
+
+    def serie(self, medida, *entidade):
+        """Série anual de uma entidade: valor, variações, acumulado e CAGR por ano."""
+        chave = entidade if len(self.chaves) > 1 else entidade[0]
+        partes = {
+            "valor": self.valores,
+            "variacao": self.variacao,
+            "variacao_pct": self.variacao_pct,
+            "acumulado": self.acumulado,
+            "cagr": self.cagr,
+        }
+        if chave not in self.valores.index.droplevel("Ano"):
+            return pd.DataFrame(columns=["Ano"] + list(partes))
+        return pd.DataFrame({
+            nome: tabela.loc[chave, medida] for nome, tabela in partes.items()
+        }).rename_axis("Ano").reset_index()
+
+
+def _somas_empresas(df, medidas):
+    # Uma linha por empresa e ano, com as medidas monetárias em centavos
+    return em_centavos(df)[[COLUNA_ID_EMPRESA, "Ano"] + medidas]
+
+
+def _somas_cubo(cubo, chaves, medidas):
+    # Somas do cubo (já em centavos) reagregadas por entidade e ano
+    return (
+        cubo.somas.dropna(subset=chaves)
+        .groupby(chaves + ["Ano"], observed=True)[medidas]
+        .sum(min_count=1)
+        .reset_index()
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _carregar_variacoes(versao):
+    df = carregar_dados()
+    cubo = carregar_cubo()
+    medidas = [m for m in MEDIDAS_VARIACAO if m in df.columns and m in cubo.medidas]
+    tabelas = {}
+    for nivel, chaves in NIVEIS.items():
+        if nivel == "empresa":
+            somas = _somas_empresas(df, medidas)
+        else:
+            somas = _somas_cubo(cubo, chaves, medidas)
+        tabelas[nivel] = TabelaVariacoes(chaves, somas, medidas)
+    return tabelas
+
+
+def carregar_variacoes(nivel):
+    """Tabela de variações de ``nivel`` ("empresa", "estado", "setor" ou "dep")."""
+    return _carregar_variacoes(versao_base())[nivel]
@@ -5,14 +5,18 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objs as go
 import base64
-import matplotlib.pyplot as plt
 import seaborn as sns
 
-# Caminho relativo ao arquivo CSV
-file_path = 'BD_Completo_Nacional_Formatado.csv'
+from estatais.bitmap import carregar_bitmap
+from estatais.desempenho import exibir_painel, medidor, registrar
+from estatais.figuras import exportar_matplotlib, nova_figura
+from estatais.indice import fatia
 
-# Carregando o arquivo CSV no Pandas DataFrame
-df = pd.read_csv(file_path)
+# Índice bitmap das dimensões da base (contagens sem varrer as linhas)
+bitmap = carregar_bitmap()
+
+# Tempo de cada seção desta página (ver estatais.desempenho)
+medir = medidor(__file__)
 
 # Configurações da página
 st.set_page_config(
@@ -125,58 +129,65 @@ A análise do comportamento do número de estatais no DF ao longo do tempo permi
 
 st.subheader("Empresas do Distrito Federal em 2023", divider="orange")
 
-# Filter the dataset for companies located in Distrito Federal (DF), and from the year 2023
-df_2023_df_companies = df[(df["Estado"] == "DF") & (df["Ano"] == 2023)].copy()
-
-# Select relevant columns: company name (emp), sit, setor, esp, dep
-df_2023_df_companies_list = df_2023_df_companies[
-    ["emp", "sit", "setor", "esp", "dep"]
-].sort_values(by="emp")
-
-# Rename columns
-df_2023_df_companies_list.columns = [
-    "Empresa",
-    "Situação",
-    "Setor",
-    "Natureza",
-    "Dependência",
-]
-
-# Reset index to make sure DataFrame starts fresh without showing old indices
-df_2023_df_companies_list.reset_index(drop=True, inplace=True)
-
-# Style the DataFrame for a modern look
-df_styled = df_2023_df_companies_list.style.set_properties(
-    **{
-        "background-color": "#fff",
-        "color": "#333",
-        "border-color": "#ccc",
-        "border-style": "solid",
-        "border-width": "1px",
-        "padding": "10px",
-        "text-align": "left",
-        "font-family": "Arial, sans-serif",
-        "font-size": "12px",  # Reduce the font size
-    }
-)
+@medir("empresas_df_2023")
+def secao_empresas_df_2023():
+    # Filter the dataset for companies located in Distrito Federal (DF), and from the year 2023
+    df_2023_df_companies = fatia(estado="DF", ano=2023).copy()
+
+    # Select relevant columns: company name (emp), sit, setor, esp, dep
+    df_2023_df_companies_list = df_2023_df_companies[
+        ["emp", "sit", "setor", "esp", "dep"]
+    ].sort_values(by="emp")
+
+    # Rename columns
+    df_2023_df_companies_list.columns = [
+        "Empresa",
+        "Situação",
+        "Setor",
+        "Natureza",
+        "Dependência",
+    ]
 
-# Set table styles for headers
-df_styled.set_table_styles(
-    [
-        {
-            "selector": "thead th",
-            "props": [
-                ("background-color", "#007acc"),
-                ("color", "white"),
-                ("font-size", "14px"),
-                ("text-align", "center"),
-            ],
+    # Reset index to make sure DataFrame starts fresh without showing old indices
+    df_2023_df_companies_list.reset_index(drop=True, inplace=True)
+
+    # Style the DataFrame for a modern look
+    df_styled = df_2023_df_companies_list.style.set_properties(
+        **{
+            "background-color": "#fff",
+            "color": "#333",
+            "border-color": "#ccc",
+            "border-style": "solid",
+            "border-width": "1px",
+            "padding": "10px",
+            "text-align": "left",
+            "font-family": "Arial, sans-serif",
+            "font-size": "12px",  # Reduce the font size
         }
-    ]
-)
+    )
+
+    # Set table styles for headers
+    df_styled.set_table_styles(
+        [
+            {
+                "selector": "thead th",
+                "props": [
+                    ("background-color", "#007acc"),
+                    ("color", "white"),
+                    ("font-size", "14px"),
+                    ("text-align", "center"),
+                ],
+            }
+        ]
+    )
 
-# Display the styled dataframe
-df_styled
+    # Display the styled dataframe
+    df_styled
+
+    registrar(linhas=len(df_2023_df_companies))
+
+
+secao_empresas_df_2023()
 
 
 st.subheader("Distribuição das Empresas Estatais do DF por Dependência Financeira", divider="orange")
@@ -198,82 +209,90 @@ Em síntese, a dependência financeira das estatais do DF deve ser analisada sob
 
 """)	
 
-# Filtrar o dataset para obter empresas localizadas no Distrito Federal (DF)
-df_df = df[df["Estado"] == "DF"]
-
-# Agrupar por 'Ano' e 'dep' (dependência) e contar o número de empresas
-df_grouped = df_df.groupby(["Ano", "dep"]).size().reset_index(name="company_count")
-
-# Criar um conjunto completo de combinações de ano e dependência
-anos = df_grouped["Ano"].unique()
-dependencias = ["Dependente", "Não Dependente"]
-
-# Criar um conjunto completo de combinações de ano e dependência
-complete_index = pd.MultiIndex.from_product([anos, dependencias], names=["Ano", "dep"])
-df_complete = (
-    df_grouped.set_index(["Ano", "dep"])
-    .reindex(complete_index, fill_value=0)
-    .reset_index()
-)
-
-# Calcular o total de empresas por ano
-totais_anuais = df_complete.groupby("Ano")["company_count"].sum()
-
-# Configuração da largura das barras
-largura_barra = 0.35
-fig, ax = plt.subplots(figsize=(10, 6))
-
-# Posições para as barras
-indice = np.arange(len(anos))
-
-# Mapear as cores para diferentes dependências
-cores = {"Dependente": "#F45046", "Não Dependente": "#007acc"}
-
-# Plotar as barras para cada status de dependência
-for i, dependencia in enumerate(dependencias):
-    subset = df_complete[df_complete["dep"] == dependencia]
-    barras = ax.bar(
-        indice + i * largura_barra,
-        subset["company_count"],
-        largura_barra,
-        label=dependencia,
-        color=cores[dependencia],
+@medir("dependencia_por_ano")
+def secao_dependencia_por_ano():
+    # Contar o número de empresas do Distrito Federal (DF) por 'Ano' e 'dep' (dependência)
+    df_grouped = bitmap.contar_por(["Ano", "dep"], Estado="DF").reset_index(name="company_count")
+
+    # Criar um conjunto completo de combinações de ano e dependência
+    anos = df_grouped["Ano"].unique()
+    dependencias = ["Dependente", "Não Dependente"]
+
+    # Criar um conjunto completo de combinações de ano e dependência
+    complete_index = pd.MultiIndex.from_product([anos, dependencias], names=["Ano", "dep"])
+    df_complete = (
+        df_grouped.set_index(["Ano", "dep"])
+        .reindex(complete_index, fill_value=0)
+        .reset_index()
     )
 
-    # Adicionar os valores e porcentagens nas barras
-    for j, barra in enumerate(barras):
-        altura = barra.get_height()
-        ano = subset.iloc[j]["Ano"]
-        total_ano = totais_anuais[ano]
-        porcentagem = (altura / total_ano) * 100 if total_ano > 0 else 0
-        ax.annotate(
-            f"{int(altura)}\n({porcentagem:.1f}%)",
-            xy=(barra.get_x() + barra.get_width() / 2, altura),
-            xytext=(0, 3),
-            textcoords="offset points",
-            ha="center",
-            va="bottom",
+    # Calcular o total de empresas por ano
+    totais_anuais = df_complete.groupby("Ano")["company_count"].sum()
+
+    # Configuração da largura das barras
+    largura_barra = 0.35
+    fig = nova_figura(figsize=(10, 6))
+    ax = fig.subplots()
+
+    # Posições para as barras
+    indice = np.arange(len(anos))
+
+    # Mapear as cores para diferentes dependências
+    cores = {"Dependente": "#F45046", "Não Dependente": "#007acc"}
+
+    # Plotar as barras para cada status de dependência
+    for i, dependencia in enumerate(dependencias):
+        subset = df_complete[df_complete["dep"] == dependencia]
+        barras = ax.bar(
+            indice + i * largura_barra,
+            subset["company_count"],
+            largura_barra,
+            label=dependencia,
+            color=cores[dependencia],
         )
 
-# Adicionar rótulos, título e legenda
-ax.set_xlabel("Ano")
-ax.set_ylabel("Número de Empresas")
-ax.set_title("")
-ax.set_xticks(indice + largura_barra / 2)
-ax.set_xticklabels(anos)
-ax.legend(title="Status de Dependência")
-
-# Remover as bordas do gráfico
-for spine in plt.gca().spines.values():
-    spine.set_visible(False)
-
-# Ajustar o layout
-plt.tight_layout()
-
-# Centralizar o gráfico com largura limitada
-col1, col2, col3 = st.columns([5, 1, 1])
-with col1:
-    st.pyplot(fig)
+        # Adicionar os valores e porcentagens nas barras
+        for j, barra in enumerate(barras):
+            altura = barra.get_height()
+            ano = subset.iloc[j]["Ano"]
+            total_ano = totais_anuais[ano]
+            porcentagem = (altura / total_ano) * 100 if total_ano > 0 else 0
+            ax.annotate(
+                f"{int(altura)}\n({porcentagem:.1f}%)",
+                xy=(barra.get_x() + barra.get_width() / 2, altura),
+                xytext=(0, 3),
+                textcoords="offset points",
+                ha="center",
+                va="bottom",
+            )
+
+    # Adicionar rótulos, título e legenda
+    ax.set_xlabel("Ano")
+    ax.set_ylabel("Número de Empresas")
+    ax.set_title("")
+    ax.set_xticks(indice + largura_barra / 2)
+    ax.set_xticklabels(anos)
+    ax.legend(title="Status de Dependência")
+
+    # Remover as bordas do gráfico
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+
+    # Ajustar o layout
+    fig.tight_layout()
+
+    # Centralizar o gráfico com largura limitada (exportado como o st.pyplot faria,
+    # mas sem passar pelo estado global do pyplot)
+    col1, col2, col3 = st.columns([5, 1, 1])
+    imagem = exportar_matplotlib(fig)
+    with col1:
+        st.image(imagem, width="stretch")
+    fig.clear()
+
+    registrar(linhas=totais_anuais.sum(), figura=imagem)
+
+
+secao_dependencia_por_ano()
 
 st.subheader("Análise da Quantidade de Empresas Estatais por Setor no Distrito Federal", divider="orange")
 
@@ -289,83 +308,86 @@ De forma geral, o gráfico destaca uma estrutura relativamente estável de estat
 
 """)	
 
-# Filtrar o dataset para obter empresas localizadas no Distrito Federal (DF)
-df_df = df[df["Estado"] == "DF"]
-
-# Agrupar por 'Ano' e 'setor' e contar o número de empresas
-df_grouped_setor = (
-    df_df.groupby(["Ano", "setor"]).size().reset_index(name="company_count")
-)
-
-# Criar um conjunto completo de combinações de ano e setor
-anos = df_grouped_setor["Ano"].unique()
-setores = df_grouped_setor["setor"].unique()
+@medir("setor_por_ano")
+def secao_setor_por_ano():
+    # Contar o número de empresas do Distrito Federal (DF) por 'Ano' e 'setor'
+    df_grouped_setor = bitmap.contar_por(["Ano", "setor"], Estado="DF").reset_index(name="company_count")
+
+    # Criar um conjunto completo de combinações de ano e setor
+    anos = df_grouped_setor["Ano"].unique()
+    setores = df_grouped_setor["setor"].unique()
+
+    # Criar um conjunto completo de combinações de ano e setor
+    complete_index = pd.MultiIndex.from_product([anos, setores], names=["Ano", "setor"])
+    df_complete_setor = (
+        df_grouped_setor.set_index(["Ano", "setor"])
+        .reindex(complete_index, fill_value=0)
+        .reset_index()
+    )
 
-# Criar um conjunto completo de combinações de ano e setor
-complete_index = pd.MultiIndex.from_product([anos, setores], names=["Ano", "setor"])
-df_complete_setor = (
-    df_grouped_setor.set_index(["Ano", "setor"])
-    .reindex(complete_index, fill_value=0)
-    .reset_index()
-)
+    # Criar um gráfico colorido com Plotly Express
+    fig = px.bar(
+        df_complete_setor, 
+        x="Ano", 
+        y="company_count", 
+        color="setor",
+        barmode="group",
+        title="",
+        labels={"company_count": "Número de Empresas", "Ano": "Ano", "setor": "Setor"},
+        height=600
+    )
 
-# Criar um gráfico colorido com Plotly Express
-fig = px.bar(
-    df_complete_setor, 
-    x="Ano", 
-    y="company_count", 
-    color="setor",
-    barmode="group",
-    title="",
-    labels={"company_count": "Número de Empresas", "Ano": "Ano", "setor": "Setor"},
-    height=600
-)
+    # Personalizar o layout
+    fig.update_layout(
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.3,
+            xanchor="center",
+            x=0.5,
+            font=dict(color="black", size=12),  # Texto da legenda em preto
+            bgcolor="white",  # Fundo da legenda em branco
+            bordercolor="lightgrey",  # Borda cinza claro para melhorar a definição visual
+            borderwidth=1  # Espessura da borda
+        ),
+        plot_bgcolor='white',
+        xaxis=dict(
+            tickmode='linear',
+            type='category',
+            tickfont=dict(color="black"),  # Cor dos rótulos do eixo X
+            title_font=dict(color="black")  # Cor do título do eixo X
+        ),
+        yaxis=dict(
+            tickfont=dict(color="black"),  # Cor dos rótulos do eixo Y
+            title_font=dict(color="black")  # Cor do título do eixo Y
+        ),
+        margin=dict(l=20, r=20, t=50, b=20),
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_family="Arial",
+            font_color="black"  # Alteração na cor da fonte do hover
+        )
+    )
 
-# Personalizar o layout
-fig.update_layout(
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=-0.3,
-        xanchor="center",
-        x=0.5,
-        font=dict(color="black", size=12),  # Texto da legenda em preto
-        bgcolor="white",  # Fundo da legenda em branco
-        bordercolor="lightgrey",  # Borda cinza claro para melhorar a definição visual
-        borderwidth=1  # Espessura da borda
-    ),
-    plot_bgcolor='white',
-    xaxis=dict(
-        tickmode='linear',
-        type='category',
-        tickfont=dict(color="black"),  # Cor dos rótulos do eixo X
-        title_font=dict(color="black")  # Cor do título do eixo X
-    ),
-    yaxis=dict(
-        tickfont=dict(color="black"),  # Cor dos rótulos do eixo Y
-        title_font=dict(color="black")  # Cor do título do eixo Y
-    ),
-    margin=dict(l=20, r=20, t=50, b=20),
-    hoverlabel=dict(
-        bgcolor="white",
-        font_size=12,
-        font_family="Arial",
-        font_color="black"  # Alteração na cor da fonte do hover
+    # Adicionar rótulos de valores nas barras
+    fig.update_traces(
+        texttemplate='%{y:.0f}', 
+        textposition='outside',
+        textfont=dict(color="black")  # Texto dos valores em preto
     )
-)
 
-# Adicionar rótulos de valores nas barras
-fig.update_traces(
-    texttemplate='%{y:.0f}', 
-    textposition='outside',
-    textfont=dict(color="black")  # Texto dos valores em preto
-)
+    # Exibir o gráfico no Streamlit
+    st.plotly_chart(fig, width="stretch")
+
+    registrar(linhas=df_grouped_setor["company_count"].sum(), figura=fig)
 
-# Exibir o gráfico no Streamlit
-st.plotly_chart(fig, use_container_width=True)
 
+secao_setor_por_ano()
 
 
+# Painel de desempenho (só com ?desempenho=1 na URL)
+exibir_painel()
 
 # Botão para voltar à página inicial
 if st.button("Voltar à Página Inicial"):
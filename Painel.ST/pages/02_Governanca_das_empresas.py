@@ -8,11 +8,24 @@ import base64
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-# Caminho relativo ao arquivo CSV
-file_path = 'BD_Completo_Nacional_Formatado.csv'
+from estatais.classificacao import (
+    COMBINACOES_GOVERNANCA,
+    combinacao_governanca,
+    contar_combinacoes,
+    contar_conselhos,
+    cor_por_sinal,
+    histograma_governanca,
+)
+from estatais.dados import carregar_dados
+from estatais.desempenho import exibir_painel, medidor, registrar
+from estatais.indice import fatia
+from estatais.snapshot import DEPENDENTE, NAO_DEPENDENTE
+
+# Base nacional carregada uma única vez e compartilhada entre sessões
+df = carregar_dados()
 
-# Carregando o arquivo CSV no Pandas DataFrame
-df = pd.read_csv(file_path)
+# Tempo de cada seção desta página (ver estatais.desempenho)
+medir = medidor(__file__)
 
 # Configurações da página
 st.set_page_config(
@@ -127,73 +140,84 @@ De maneira geral, o panorama apresentado pelo gráfico demonstra avanços signif
 
 """)	
 
-# Filtrar os dados para o Estado DF e ano de 2023
-df_filtrado = df[(df["Estado"] == "DF") & (df["Ano"] == 2023)]
-
-# Contar o número de empresas para cada tipo de estrutura de governança
-contagem_conselho_admin = df_filtrado["gov_ca"].str.upper().eq("SIM").sum()
-contagem_conselho_fiscal = df_filtrado["gov_cf"].str.upper().eq("SIM").sum()
-contagem_comite_auditoria = df_filtrado["gov_aud"].str.upper().eq("SIM").sum()
-
-# Calcular o número total de empresas
-total_empresas = len(df_filtrado)
-
-# Criar um DataFrame com os dados de contagem
-dados_contagem = pd.DataFrame(
-    {
-        "Estrutura de Governança": [
-            "Conselho de Administração",
-            "Conselho Fiscal",
-            "Comitê de Auditoria",
-        ],
-        "Número de Empresas": [
-            contagem_conselho_admin,
-            contagem_conselho_fiscal,
-            contagem_comite_auditoria,
-        ],
-    }
-)
+@medir("estruturas_governanca")
+def secao_estruturas_governanca():
+    # Filtrar os dados para o Estado DF e ano de 2023
+    df_filtrado = fatia(estado="DF", ano=2023)
+
+    # Contar o número de empresas para cada tipo de estrutura de governança
+    # a partir do histograma dos códigos de governança (um único bincount)
+    contagem_conselhos = contar_conselhos(histograma_governanca(df_filtrado))
+    contagem_conselho_admin = contagem_conselhos["gov_ca"]
+    contagem_conselho_fiscal = contagem_conselhos["gov_cf"]
+    contagem_comite_auditoria = contagem_conselhos["gov_aud"]
+
+    # Calcular o número total de empresas
+    total_empresas = len(df_filtrado)
+
+    # Criar um DataFrame com os dados de contagem
+    dados_contagem = pd.DataFrame(
+        {
+            "Estrutura de Governança": [
+                "Conselho de Administração",
+                "Conselho Fiscal",
+                "Comitê de Auditoria",
+            ],
+            "Número de Empresas": [
+                contagem_conselho_admin,
+                contagem_conselho_fiscal,
+                contagem_comite_auditoria,
+            ],
+        }
+    )
 
-# Calcular a porcentagem de empresas para cada tipo de estrutura
-dados_contagem["Porcentagem (%)"] = (
-    dados_contagem["Número de Empresas"] / total_empresas
-) * 100
-
-# Opção 1: Gráfico com Plotly (interativo)
-fig = px.bar(
-    dados_contagem, 
-    x="Estrutura de Governança", 
-    y="Número de Empresas",
-    text="Número de Empresas",
-    color="Estrutura de Governança",
-    color_discrete_map={
-        "Conselho de Administração": "#007acc",
-        "Conselho Fiscal": "#008846",
-        "Comitê de Auditoria": "#F45046"
-    }
-)
+    # Calcular a porcentagem de empresas para cada tipo de estrutura
+    dados_contagem["Porcentagem (%)"] = (
+        dados_contagem["Número de Empresas"] / total_empresas
+    ) * 100
+
+    # Opção 1: Gráfico com Plotly (interativo)
+    fig = px.bar(
+        dados_contagem, 
+        x="Estrutura de Governança", 
+        y="Número de Empresas",
+        text="Número de Empresas",
+        color="Estrutura de Governança",
+        color_discrete_map={
+            "Conselho de Administração": "#007acc",
+            "Conselho Fiscal": "#008846",
+            "Comitê de Auditoria": "#F45046"
+        }
+    )
 
-# Personalizar o layout do gráfico
-fig.update_layout(
-    title_text="",
-    xaxis_title="Estrutura de Governança",
-    yaxis_title="Número de Empresas",
-    showlegend=False,
-    plot_bgcolor="white",
-    font=dict(size=12, color="black"),
-    margin=dict(l=20, r=20, t=30, b=20),
-)
+    # Personalizar o layout do gráfico
+    fig.update_layout(
+        title_text="",
+        xaxis_title="Estrutura de Governança",
+        yaxis_title="Número de Empresas",
+        showlegend=False,
+        plot_bgcolor="white",
+        font=dict(size=12, color="black"),
+        margin=dict(l=20, r=20, t=30, b=20),
+    )
 
-# Adicionar as porcentagens aos textos das barras
-fig.update_traces(
-    texttemplate="%{y}<br>(%{customdata:.1f}%)",
-    textposition="outside",
-    textfont=dict(color="black", size=12),
-    customdata=dados_contagem["Porcentagem (%)"]
-)
+    # Adicionar as porcentagens aos textos das barras
+    fig.update_traces(
+        texttemplate="%{y}<br>(%{customdata:.1f}%)",
+        textposition="outside",
+        textfont=dict(color="black", size=12),
+        customdata=dados_contagem["Porcentagem (%)"]
+    )
+
+    # Mostrar o gráfico no Streamlit
+    st.plotly_chart(fig, width="stretch")
 
-# Mostrar o gráfico no Streamlit
-st.plotly_chart(fig, use_container_width=True)
+    registrar(linhas=len(df_filtrado), figura=fig)
+
+    return dados_contagem
+
+
+dados_contagem = secao_estruturas_governanca()
 
 # Opcional: Exibir os dados em uma tabela
 st.dataframe(
@@ -205,7 +229,7 @@ st.dataframe(
         )
     },
     hide_index=True,
-    use_container_width=True
+    width="stretch"
 )
 
 
@@ -224,117 +248,103 @@ O gráfico reflete a diversidade nas práticas de governança adotadas pelas est
 
 """)	
 
-# Filtrar os dados para o Estado DF e ano de 2023
-df_filtrado = df[(df["Estado"] == "DF") & (df["Ano"] == 2023)].copy()
-
-# Definir uma função para categorizar as combinações de governança usando abreviações
-def categorizar_combinacoes(row):
-    ca = row["gov_ca"].upper() == "SIM"
-    cf = row["gov_cf"].upper() == "SIM"
-    aud = row["gov_aud"].upper() == "SIM"
-
-    if ca and cf and aud:
-        return "CA, CF, COAUD"
-    elif ca and cf:
-        return "CA, CF"
-    elif ca and aud:
-        return "CA, COAUD"
-    elif cf and aud:
-        return "CF, COAUD"
-    elif ca:
-        return "CA"
-    elif cf:
-        return "CF"
-    elif aud:
-        return "COAUD"
-    else:
-        return "Nenhum"
+@medir("combinacoes_governanca")
+def secao_combinacoes_governanca():
+    # Filtrar os dados para o Estado DF e ano de 2023
+    df_filtrado = fatia(estado="DF", ano=2023).copy()
 
-# Aplicar função de categorização
-df_filtrado.loc[:, "Combinação"] = df_filtrado.apply(categorizar_combinacoes, axis=1)
+    # Categorizar as combinações de governança usando abreviações
+    df_filtrado.loc[:, "Combinação"] = combinacao_governanca(df_filtrado)
 
-# Contar números de empresas e agrupar por combinação, além de concatenar nomes das empresas
-dados_contagem = (
-    df_filtrado.groupby("Combinação")
-    .agg({"emp": lambda x: "<br>".join(x), "Combinação": "size"})
-    .rename(columns={"Combinação": "Número de Empresas", "emp": "Lista de Empresas"})
-    .reset_index()
-)
+    # Contar números de empresas e agrupar por combinação, além de concatenar nomes das empresas
+    dados_contagem = (
+        df_filtrado.groupby("Combinação")
+        .agg({"emp": lambda x: "<br>".join(x), "Combinação": "size"})
+        .rename(columns={"Combinação": "Número de Empresas", "emp": "Lista de Empresas"})
+        .reset_index()
+    )
 
-# Calcular a porcentagem de empresas para cada tipo de estrutura
-dados_contagem["Porcentagem (%)"] = (
-    dados_contagem["Número de Empresas"] / len(df_filtrado)
-) * 100
-
-# Ordenar as combinações por frequência (opcional)
-dados_contagem = dados_contagem.sort_values(by="Número de Empresas", ascending=False)
-
-# Criar gráfico interativo com plotly
-fig = px.bar(
-    dados_contagem,
-    x="Combinação",
-    y="Número de Empresas",
-    text="Número de Empresas",
-    labels={
-        "Combinação": "Combinação de Estrutura de Governança",
-        "Número de Empresas": "Número de Empresas",
-    },
-    hover_data={"Lista de Empresas": True, "Porcentagem (%)": ":.1f"},
-    color="Combinação",
-    color_discrete_sequence=px.colors.qualitative.Bold,
-    height=500
-)
+    # Calcular a porcentagem de empresas para cada tipo de estrutura
+    dados_contagem["Porcentagem (%)"] = (
+        dados_contagem["Número de Empresas"] / len(df_filtrado)
+    ) * 100
+
+    # Ordenar as combinações por frequência (opcional)
+    dados_contagem = dados_contagem.sort_values(by="Número de Empresas", ascending=False)
+
+    # Criar gráfico interativo com plotly
+    fig = px.bar(
+        dados_contagem,
+        x="Combinação",
+        y="Número de Empresas",
+        text="Número de Empresas",
+        labels={
+            "Combinação": "Combinação de Estrutura de Governança",
+            "Número de Empresas": "Número de Empresas",
+        },
+        hover_data={"Lista de Empresas": True, "Porcentagem (%)": ":.1f"},
+        color="Combinação",
+        color_discrete_sequence=px.colors.qualitative.Bold,
+        height=500
+    )
 
-# Atualizar template de hover para incluir empresas
-fig.update_traces(
-    hovertemplate=(
-        "<b>Combinação:</b> %{x}<br>"
-        "<b>Número de Empresas:</b> %{y}<br>"
-        "<b>Empresas:</b> <br>%{customdata[0]}<br>"
-        "<b>Porcentagem:</b> %{customdata[1]:.1f}%<extra></extra>"
-    ),
-    textposition="outside",
-    textfont=dict(color="black", size=12)
-)
+    # Atualizar template de hover para incluir empresas
+    fig.update_traces(
+        hovertemplate=(
+            "<b>Combinação:</b> %{x}<br>"
+            "<b>Número de Empresas:</b> %{y}<br>"
+            "<b>Empresas:</b> <br>%{customdata[0]}<br>"
+            "<b>Porcentagem:</b> %{customdata[1]:.1f}%<extra></extra>"
+        ),
+        textposition="outside",
+        textfont=dict(color="black", size=12)
+    )
 
-# Adicionar legenda explicativa
-fig.add_annotation(
-    x=0.5,
-    y=1.05,
-    xref="paper",
-    yref="paper",
-    text="Legenda: CA = Conselho de Administração, CF = Conselho Fiscal, COAUD = Comitê de Auditoria",
-    font=dict(size=11, color="black"),
-    showarrow=False,
-    align="center"
-)
+    # Adicionar legenda explicativa
+    fig.add_annotation(
+        x=0.5,
+        y=1.05,
+        xref="paper",
+        yref="paper",
+        text="Legenda: CA = Conselho de Administração, CF = Conselho Fiscal, COAUD = Comitê de Auditoria",
+        font=dict(size=11, color="black"),
+        showarrow=False,
+        align="center"
+    )
 
-# Personalizar layout
-fig.update_layout(
-    xaxis_title="Combinação de Estrutura de Governança",
-    yaxis_title="Número de Empresas",
-    showlegend=False,
-    plot_bgcolor="white",
-    paper_bgcolor="white",
-    margin=dict(t=60, b=20, l=20, r=20),
-    xaxis=dict(
-        tickfont=dict(color="black"),
-        title_font=dict(color="black")
-    ),
-    yaxis=dict(
-        tickfont=dict(color="black"),
-        title_font=dict(color="black")
-    ),
-    hoverlabel=dict(
-        bgcolor="white",
-        font_size=12,
-        font_family="Arial",
-        font_color="black"
+    # Personalizar layout
+    fig.update_layout(
+        xaxis_title="Combinação de Estrutura de Governança",
+        yaxis_title="Número de Empresas",
+        showlegend=False,
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        margin=dict(t=60, b=20, l=20, r=20),
+        xaxis=dict(
+            tickfont=dict(color="black"),
+            title_font=dict(color="black")
+        ),
+        yaxis=dict(
+            tickfont=dict(color="black"),
+            title_font=dict(color="black")
+        ),
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_family="Arial",
+            font_color="black"
+        )
     )
-)
 
-# Mostrar o gráfico no Streamlit
-st.plotly_chart(fig, use_container_width=True)
+    # Mostrar o gráfico no Streamlit
+    st.plotly_chart(fig, width="stretch")
+
+    registrar(linhas=len(df_filtrado), figura=fig)
+
+    return dados_contagem
+
+
+dados_contagem = secao_combinacoes_governanca()
 
 # Exibir tabela com detalhes para consulta (opcional - pode ser expandido/contraído)
 with st.expander("Ver detalhes das combinações de estruturas de governança"):
@@ -355,7 +365,7 @@ with st.expander("Ver detalhes das combinações de estruturas de governança"):
             )
         },
         hide_index=True,
-        use_container_width=True
+        width="stretch"
     )
 
     # Explicação detalhada das combinações
@@ -385,125 +395,127 @@ As vantagens da ampla adoção de Conselhos de Administração e Conselhos Fisca
 O panorama de governança apresentado reflete um bom nível de adesão às estruturas fundamentais, como os Conselhos de Administração e Fiscal, mas expõe lacunas no uso de ferramentas mais avançadas, como os Comitês de Auditoria. Para maximizar a eficiência e reduzir riscos, recomenda-se que as empresas dependentes priorizem a implementação de Comitês de Auditoria, reforçando sua capacidade de prestação de contas e assegurando a conformidade com as melhores práticas de governança corporativa. Esse fortalecimento é especialmente importante para empresas que recebem recursos do tesouro distrital, garantindo maior transparência e confiança da sociedade em sua gestão.
 """)	
 
-# Filtrar os dados para o Estado DF e ano de 2023
-df_filtrado = df[(df["Estado"] == "DF") & (df["Ano"] == 2023)]
+@medir("governanca_por_dependencia")
+def secao_governanca_por_dependencia():
+    # Filtrar os dados para o Estado DF e ano de 2023
+    df_filtrado = fatia(estado="DF", ano=2023)
+
+    # Histograma dos códigos de governança por status de dependência (um único bincount)
+    histograma_dep = histograma_governanca(df_filtrado, "dep")
+    conselhos_por_dep = contar_conselhos(histograma_dep)
+    empresas_por_dep = histograma_dep.sum(axis=1)
+
+    # Função para contar e calcular porcentagens de empresas em relação à estrutura de governança
+    def contar_e_calcular_porcentagens(dep_status, total_empresas):
+        if dep_status in conselhos_por_dep.index:
+            contagens = conselhos_por_dep.loc[dep_status]
+        else:
+            contagens = pd.Series(0, index=conselhos_por_dep.columns)
+        return tuple(
+            (contagem, contagem / total_empresas * 100) for contagem in contagens
+        )
 
-# Função para contar e calcular porcentagens de empresas em relação à estrutura de governança
-def contar_e_calcular_porcentagens(dep_status, total_empresas):
-    ca_count = (
-        df_filtrado[df_filtrado["dep"].str.upper() == dep_status]["gov_ca"]
-        .str.upper()
-        .eq("SIM")
-        .sum()
-    )
-    cf_count = (
-        df_filtrado[df_filtrado["dep"].str.upper() == dep_status]["gov_cf"]
-        .str.upper()
-        .eq("SIM")
-        .sum()
+    # Calcular somatórios e porcentagens para empresas dependentes e não dependentes
+    total_dependentes = int(empresas_por_dep.get(DEPENDENTE, 0))
+    total_nao_dependentes = int(empresas_por_dep.get(NAO_DEPENDENTE, 0))
+
+    dependentes_dados = contar_e_calcular_porcentagens(DEPENDENTE, total_dependentes)
+    nao_dependentes_dados = contar_e_calcular_porcentagens(
+        NAO_DEPENDENTE, total_nao_dependentes
     )
-    aud_count = (
-        df_filtrado[df_filtrado["dep"].str.upper() == dep_status]["gov_aud"]
-        .str.upper()
-        .eq("SIM")
-        .sum()
+
+    # Estruturar os dados para o Plotly
+    estruturas = ["Conselho de Administração", "Conselho Fiscal", "Comitê de Auditoria"]
+
+    # Criar DataFrame para o gráfico
+    dados_grafico = pd.DataFrame({
+        "Estrutura": estruturas * 2,
+        "Status de Dependência": ["Dependente"] * 3 + ["Não Dependente"] * 3,
+        "Porcentagem": [d[1] for d in dependentes_dados] + [d[1] for d in nao_dependentes_dados],
+        "Quantidade": [d[0] for d in dependentes_dados] + [d[0] for d in nao_dependentes_dados],
+        "Total Empresas": [total_dependentes] * 3 + [total_nao_dependentes] * 3
+    })
+
+    # Criar gráfico com Plotly
+    fig = px.bar(
+        dados_grafico,
+        x="Estrutura",
+        y="Porcentagem",
+        color="Status de Dependência",
+        barmode="group",
+        text="Quantidade",  # Mostrar a quantidade nas barras
+        color_discrete_map={
+            "Dependente": "#F45046",
+            "Não Dependente": "#007acc"
+        },
+        labels={
+            "Porcentagem": "Porcentagem de Empresas (%)",
+            "Estrutura": "Estrutura de Governança"
+        },
+        height=500
     )
-    return (
-        (ca_count, ca_count / total_empresas * 100),
-        (cf_count, cf_count / total_empresas * 100),
-        (aud_count, aud_count / total_empresas * 100),
+
+    # Adicionar legenda explicativa - com posição ajustada
+    fig.add_annotation(
+        x=0.5,
+        y=1.15,  # Aumentar este valor para mover a legenda para cima
+        xref="paper",
+        yref="paper",
+        text="Legenda: CA = Conselho de Administração, CF = Conselho Fiscal, COAUD = Comitê de Auditoria",
+        font=dict(size=11, color="black"),
+        showarrow=False,
+        align="center"
     )
 
-# Calcular somatórios e porcentagens para empresas dependentes e não dependentes
-total_dependentes = df_filtrado[df_filtrado["dep"].str.upper() == "DEPENDENTE"].shape[0]
-total_nao_dependentes = df_filtrado[
-    df_filtrado["dep"].str.upper() == "NÃO DEPENDENTE"
-].shape[0]
+    # Personalizar layout
+    fig.update_layout(
+        xaxis_title="Combinação de Estrutura de Governança",
+        yaxis_title="Número de Empresas",
+        showlegend=False,
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        margin=dict(t=80, b=20, l=20, r=20),  # Aumentar margem superior para dar espaço à legenda
+        xaxis=dict(
+            tickfont=dict(color="black"),
+            title_font=dict(color="black")
+        ),
+        yaxis=dict(
+            tickfont=dict(color="black"),
+            title_font=dict(color="black")
+        ),
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_family="Arial",
+            font_color="black"
+        ),
+        height=550  # Aumentar altura do gráfico para acomodar melhor a legenda
+    )
 
-dependentes_dados = contar_e_calcular_porcentagens("DEPENDENTE", total_dependentes)
-nao_dependentes_dados = contar_e_calcular_porcentagens(
-    "NÃO DEPENDENTE", total_nao_dependentes
-)
+    # Ajustar formato dos rótulos nas barras
+    fig.update_traces(
+        texttemplate="%{text}<br>(%{y:.1f}%)",
+        textposition="outside",
+        textfont=dict(color="black", size=12),
+        hovertemplate="<b>%{x}</b><br>Status: %{data.name}<br>Quantidade: %{text}<br>Porcentagem: %{y:.1f}%<br>Total de empresas: %{customdata}<extra></extra>",
+        customdata=dados_grafico["Total Empresas"]
+    )
 
-# Estruturar os dados para o Plotly
-estruturas = ["Conselho de Administração", "Conselho Fiscal", "Comitê de Auditoria"]
-
-# Criar DataFrame para o gráfico
-dados_grafico = pd.DataFrame({
-    "Estrutura": estruturas * 2,
-    "Status de Dependência": ["Dependente"] * 3 + ["Não Dependente"] * 3,
-    "Porcentagem": [d[1] for d in dependentes_dados] + [d[1] for d in nao_dependentes_dados],
-    "Quantidade": [d[0] for d in dependentes_dados] + [d[0] for d in nao_dependentes_dados],
-    "Total Empresas": [total_dependentes] * 3 + [total_nao_dependentes] * 3
-})
-
-# Criar gráfico com Plotly
-fig = px.bar(
-    dados_grafico,
-    x="Estrutura",
-    y="Porcentagem",
-    color="Status de Dependência",
-    barmode="group",
-    text="Quantidade",  # Mostrar a quantidade nas barras
-    color_discrete_map={
-        "Dependente": "#F45046",
-        "Não Dependente": "#007acc"
-    },
-    labels={
-        "Porcentagem": "Porcentagem de Empresas (%)",
-        "Estrutura": "Estrutura de Governança"
-    },
-    height=500
-)
+    # Exibir o gráfico no Streamlit
+    st.plotly_chart(fig, width="stretch")
 
-# Adicionar legenda explicativa - com posição ajustada
-fig.add_annotation(
-    x=0.5,
-    y=1.15,  # Aumentar este valor para mover a legenda para cima
-    xref="paper",
-    yref="paper",
-    text="Legenda: CA = Conselho de Administração, CF = Conselho Fiscal, COAUD = Comitê de Auditoria",
-    font=dict(size=11, color="black"),
-    showarrow=False,
-    align="center"
-)
+    registrar(linhas=len(df_filtrado), figura=fig)
 
-# Personalizar layout
-fig.update_layout(
-    xaxis_title="Combinação de Estrutura de Governança",
-    yaxis_title="Número de Empresas",
-    showlegend=False,
-    plot_bgcolor="white",
-    paper_bgcolor="white",
-    margin=dict(t=80, b=20, l=20, r=20),  # Aumentar margem superior para dar espaço à legenda
-    xaxis=dict(
-        tickfont=dict(color="black"),
-        title_font=dict(color="black")
-    ),
-    yaxis=dict(
-        tickfont=dict(color="black"),
-        title_font=dict(color="black")
-    ),
-    hoverlabel=dict(
-        bgcolor="white",
-        font_size=12,
-        font_family="Arial",
-        font_color="black"
-    ),
-    height=550  # Aumentar altura do gráfico para acomodar melhor a legenda
-)
+    return estruturas, dependentes_dados, nao_dependentes_dados, total_dependentes, total_nao_dependentes
 
-# Ajustar formato dos rótulos nas barras
-fig.update_traces(
-    texttemplate="%{text}<br>(%{y:.1f}%)",
-    textposition="outside",
-    textfont=dict(color="black", size=12),
-    hovertemplate="<b>%{x}</b><br>Status: %{data.name}<br>Quantidade: %{text}<br>Porcentagem: %{y:.1f}%<br>Total de empresas: %{customdata}<extra></extra>",
-    customdata=dados_grafico["Total Empresas"]
-)
 
-# Exibir o gráfico no Streamlit
-st.plotly_chart(fig, use_container_width=True)
+(
+    estruturas,
+    dependentes_dados,
+    nao_dependentes_dados,
+    total_dependentes,
+    total_nao_dependentes,
+) = secao_governanca_por_dependencia()
 
 # Opcional: Tabela com os detalhes
 with st.expander("Ver dados detalhados"):
@@ -521,7 +533,7 @@ with st.expander("Ver dados detalhados"):
     st.dataframe(
         tabela_dependencia,
         hide_index=True,
-        use_container_width=True
+        width="stretch"
     )
     
     # Resumo
@@ -558,180 +570,139 @@ Observação: Instituto BRB e BRB Administradora e Corretora de Seguros não apa
 
 """)
 
- # Filtrar os dados apropriados: deve ser de 2023, estado DF, PL positivo e não nulo e lucros não nulos
-df_2023 = df[
-    (df["Ano"] == 2023) & (df["Estado"] == "DF") & (df["PL"] > 0) & df["lucros"].notna()
-].copy()
+@medir("rentabilidade_por_combinacao")
+def secao_rentabilidade_por_combinacao():
+    # Filtrar os dados apropriados: deve ser de 2023, estado DF e com rentabilidade
+    # definida (PL positivo e lucros não nulos; ver estatais.metricas)
+    df_2023 = fatia(estado="DF", ano=2023)
+    df_2023 = df_2023[df_2023["rentabilidade"].notna()].copy()
+
+    # Categorizar as combinações de conselhos
+    df_2023["combinação"] = combinacao_governanca(df_2023)
+
+    # Agregar e preparar dados
+    df_agrupado = (
+        df_2023.groupby("combinação")
+        .agg(
+            media_rentabilidade=("rentabilidade", "mean"),
+            empresas=("emp", lambda x: "<br>".join(x)),
+            detalhamento_rentabilidade=(
+                "rentabilidade",
+                lambda x: "<br>".join([f"{y:.1f}%" for y in x])
+            ),
+            count=("emp", "count")  # Adicionar contagem de empresas
+        )
+        .reset_index()
+    )
 
-# Calcular a rentabilidade individual
-df_2023["rentabilidade"] = (df_2023["lucros"] / df_2023["PL"]) * 100
+    # Determinar a cor com base na rentabilidade média
+    df_agrupado["cor"] = cor_por_sinal(df_agrupado["media_rentabilidade"], zero_positivo=True)
+
+    # Relação de combinações
+    todas_combinacoes = COMBINACOES_GOVERNANCA
+
+    # Garantir que todas as combinações estejam presentes
+    combinacoes_presentes = df_agrupado["combinação"].unique()
+    combinacoes_faltantes = [c for c in todas_combinacoes if c not in combinacoes_presentes]
+
+    # Adicionar combinações faltantes
+    for comb in combinacoes_faltantes:
+        # Criar um DataFrame com a nova linha
+        nova_linha = pd.DataFrame({
+            "combinação": [comb],
+            "media_rentabilidade": [0],
+            "empresas": ["Nenhuma empresa nesta categoria"],
+            "detalhamento_rentabilidade": ["N/A"],
+            "count": [0],
+            "cor": ["#007acc"]  # cor padrão para barras sem dados
+        })
+    
+        # Concatenar com o DataFrame existente
+        df_agrupado = pd.concat([df_agrupado, nova_linha], ignore_index=True)
+    # Ordenar pelas combinações predefinidas
+    df_agrupado["ordem"] = df_agrupado["combinação"].map(
+        {comb: i for i, comb in enumerate(todas_combinacoes)}
+    ).fillna(999)
+    df_agrupado = df_agrupado.sort_values("ordem").drop("ordem", axis=1)
+
+    # Criação de gráfico interativo com Plotly
+    fig = px.bar(
+        df_agrupado,
+        x="combinação",
+        y="media_rentabilidade",
+        text="media_rentabilidade",
+        color="combinação",
+        color_discrete_map={row["combinação"]: row["cor"] for _, row in df_agrupado.iterrows()},
+        labels={
+            "media_rentabilidade": "Rentabilidade Média (%)",
+            "combinação": "Combinação de Estruturas de Governança",
+        },
+        custom_data=["empresas", "detalhamento_rentabilidade", "count"],
+        height=550
+    )
 
-# Função de categorização de combinações de conselhos
-def categorizar_combinacoes(row):
-    # Verificar e processar gov_ca
-    if pd.isna(row["gov_ca"]):
-        ca = False
-    else:
-        ca = str(row["gov_ca"]).strip().upper() == "SIM"
-        
-    # Verificar e processar gov_cf
-    if pd.isna(row["gov_cf"]):
-        cf = False
-    else:
-        cf = str(row["gov_cf"]).strip().upper() == "SIM"
-        
-    # Verificar e processar gov_aud
-    if pd.isna(row["gov_aud"]):
-        aud = False
-    else:
-        aud = str(row["gov_aud"]).strip().upper() == "SIM"
-
-    # Determinar a combinação
-    if ca and cf and aud:
-        return "CA, CF, COAUD"
-    elif ca and cf:
-        return "CA, CF"
-    elif ca and aud:
-        return "CA, COAUD"
-    elif cf and aud:
-        return "CF, COAUD"
-    elif ca:
-        return "CA"
-    elif cf:
-        return "CF"
-    elif aud:
-        return "COAUD"
-    else:
-        return "Nenhum"
-
-# Aplicar categorização de forma segura
-df_2023["combinação"] = df_2023.apply(categorizar_combinacoes, axis=1)
-
-# Agregar e preparar dados
-df_agrupado = (
-    df_2023.groupby("combinação")
-    .agg(
-        media_rentabilidade=("rentabilidade", "mean"),
-        empresas=("emp", lambda x: "<br>".join(x)),
-        detalhamento_rentabilidade=(
-            "rentabilidade",
-            lambda x: "<br>".join([f"{y:.1f}%" for y in x])
+    # Atualizar template de hover
+    fig.update_traces(
+        hovertemplate=(
+            "<b>Combinação:</b> %{x}<br>"
+            "<b>Rentabilidade Média:</b> %{y:.1f}%<br>"
+            "<b>Número de Empresas:</b> %{customdata[2]}<br>"
+            "<b>Empresas:</b> <br>%{customdata[0]}<br>"
+            "<b>Rentabilidades Individuais:</b> <br>%{customdata[1]}<extra></extra>"
         ),
-        count=("emp", "count")  # Adicionar contagem de empresas
+        texttemplate="%{y:.1f}%",  # Ajustar label de cada barra para porcentagem
+        textposition="outside",
+        textfont=dict(color="black", size=12)
     )
-    .reset_index()
-)
 
-# Determinar a cor com base na rentabilidade média
-df_agrupado["cor"] = df_agrupado["media_rentabilidade"].apply(
-    lambda x: "#F46045" if x < 0 else "#007acc"
-)
+    # Adicionar legenda explicativa
+    fig.add_annotation(
+        x=0.5,
+        y=1.10,
+        xref="paper",
+        yref="paper",
+        text="Legenda: CA = Conselho de Administração, CF = Conselho Fiscal, COAUD = Comitê de Auditoria",
+        font=dict(size=11, color="black"),
+        showarrow=False,
+        align="center"
+    )
 
-# Relação de combinações
-todas_combinacoes = [
-    "CA, CF, COAUD",
-    "CA, CF",
-    "CA, COAUD",
-    "CF, COAUD",
-    "CA",
-    "CF",
-    "COAUD",
-    "Nenhum",
-]
-
-# Garantir que todas as combinações estejam presentes
-combinacoes_presentes = df_agrupado["combinação"].unique()
-combinacoes_faltantes = [c for c in todas_combinacoes if c not in combinacoes_presentes]
-
-# Adicionar combinações faltantes
-for comb in combinacoes_faltantes:
-    # Criar um DataFrame com a nova linha
-    nova_linha = pd.DataFrame({
-        "combinação": [comb],
-        "media_rentabilidade": [0],
-        "empresas": ["Nenhuma empresa nesta categoria"],
-        "detalhamento_rentabilidade": ["N/A"],
-        "count": [0],
-        "cor": ["#007acc"]  # cor padrão para barras sem dados
-    })
-    
-    # Concatenar com o DataFrame existente
-    df_agrupado = pd.concat([df_agrupado, nova_linha], ignore_index=True)
-# Ordenar pelas combinações predefinidas
-df_agrupado["ordem"] = df_agrupado["combinação"].apply(lambda x: todas_combinacoes.index(x) if x in todas_combinacoes else 999)
-df_agrupado = df_agrupado.sort_values("ordem").drop("ordem", axis=1)
-
-# Criação de gráfico interativo com Plotly
-fig = px.bar(
-    df_agrupado,
-    x="combinação",
-    y="media_rentabilidade",
-    text="media_rentabilidade",
-    color="combinação",
-    color_discrete_map={row["combinação"]: row["cor"] for _, row in df_agrupado.iterrows()},
-    labels={
-        "media_rentabilidade": "Rentabilidade Média (%)",
-        "combinação": "Combinação de Estruturas de Governança",
-    },
-    custom_data=["empresas", "detalhamento_rentabilidade", "count"],
-    height=550
-)
+    # Ajustar layout final
+    fig.update_layout(
+        xaxis_title="Combinação de Estrutura de Governança",
+        yaxis_title="Rentabilidade Média (%)",
+        showlegend=False,
+        plot_bgcolor="white", 
+        paper_bgcolor="white",
+        margin=dict(t=70, b=20, l=20, r=20),
+        xaxis=dict(
+            tickfont=dict(color="black"),
+            title_font=dict(color="black")
+        ),
+        yaxis=dict(
+            tickfont=dict(color="black"),
+            title_font=dict(color="black"),
+            zeroline=True,
+            zerolinecolor="black",
+            zerolinewidth=0.5
+        ),
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_family="Arial",
+            font_color="black"
+        )
+    )
 
-# Atualizar template de hover
-fig.update_traces(
-    hovertemplate=(
-        "<b>Combinação:</b> %{x}<br>"
-        "<b>Rentabilidade Média:</b> %{y:.1f}%<br>"
-        "<b>Número de Empresas:</b> %{customdata[2]}<br>"
-        "<b>Empresas:</b> <br>%{customdata[0]}<br>"
-        "<b>Rentabilidades Individuais:</b> <br>%{customdata[1]}<extra></extra>"
-    ),
-    texttemplate="%{y:.1f}%",  # Ajustar label de cada barra para porcentagem
-    textposition="outside",
-    textfont=dict(color="black", size=12)
-)
+    # Exibir gráfico no Streamlit
+    st.plotly_chart(fig, width="stretch")
 
-# Adicionar legenda explicativa
-fig.add_annotation(
-    x=0.5,
-    y=1.10,
-    xref="paper",
-    yref="paper",
-    text="Legenda: CA = Conselho de Administração, CF = Conselho Fiscal, COAUD = Comitê de Auditoria",
-    font=dict(size=11, color="black"),
-    showarrow=False,
-    align="center"
-)
+    registrar(linhas=len(df_2023), figura=fig)
 
-# Ajustar layout final
-fig.update_layout(
-    xaxis_title="Combinação de Estrutura de Governança",
-    yaxis_title="Rentabilidade Média (%)",
-    showlegend=False,
-    plot_bgcolor="white", 
-    paper_bgcolor="white",
-    margin=dict(t=70, b=20, l=20, r=20),
-    xaxis=dict(
-        tickfont=dict(color="black"),
-        title_font=dict(color="black")
-    ),
-    yaxis=dict(
-        tickfont=dict(color="black"),
-        title_font=dict(color="black"),
-        zeroline=True,
-        zerolinecolor="black",
-        zerolinewidth=0.5
-    ),
-    hoverlabel=dict(
-        bgcolor="white",
-        font_size=12,
-        font_family="Arial",
-        font_color="black"
-    )
-)
+    return df_agrupado
 
-# Exibir gráfico no Streamlit
-st.plotly_chart(fig, use_container_width=True)
+
+df_agrupado = secao_rentabilidade_por_combinacao()
 
 # Tabela com dados detalhados
 with st.expander("Ver detalhes de rentabilidade por estrutura de governança"):
@@ -757,9 +728,152 @@ with st.expander("Ver detalhes de rentabilidade por estrutura de governança"):
             )
         },
         hide_index=True,
-        use_container_width=True
+        width="stretch"
     )
-    
+
+
+st.subheader("Comparativo Nacional da Governança Corporativa das Estatais", divider="orange")
+
+# Conteúdo específico desta página
+st.write("""
+
+O comparativo abaixo posiciona as estatais do Distrito Federal em relação às dos demais estados. Para o ano escolhido, é possível ver a parcela das empresas de cada estado que possui Conselho de Administração, Conselho Fiscal e Comitê de Auditoria, ou a distribuição das empresas entre as combinações dessas estruturas.
+
+""")
+
+# Rótulos das estruturas de governança nos gráficos
+NOMES_ESTRUTURAS = {
+    "gov_ca": "Conselho de Administração",
+    "gov_cf": "Conselho Fiscal",
+    "gov_aud": "Comitê de Auditoria",
+}
+
+
+# Comparativo entre estados; reexecuta sozinho quando os filtros mudam
+@st.fragment
+@medir("comparativo_nacional")
+def comparativo_nacional_governanca():
+    anos_disponiveis = sorted(df["Ano"].dropna().unique().astype(int), reverse=True)
+
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        ano = st.selectbox("Ano", anos_disponiveis, key="gov_nacional_ano")
+    with col2:
+        visao = st.radio(
+            "Visualizar",
+            ["Estruturas de governança", "Combinações de estruturas"],
+            horizontal=True,
+            key="gov_nacional_visao",
+        )
+
+    # Histograma dos códigos de governança por estado (um único bincount)
+    histograma_estados = histograma_governanca(fatia(ano=ano), "Estado")
+    total_por_estado = histograma_estados.sum(axis=1)
+
+    if visao == "Estruturas de governança":
+        contagens = contar_conselhos(histograma_estados).rename(columns=NOMES_ESTRUTURAS)
+        ordem_cores = {
+            "Conselho de Administração": "#007acc",
+            "Conselho Fiscal": "#008846",
+            "Comitê de Auditoria": "#F45046",
+        }
+        barmode = "group"
+    else:
+        contagens = contar_combinacoes(histograma_estados)
+        ordem_cores = dict(zip(COMBINACOES_GOVERNANCA, px.colors.qualitative.Bold))
+        barmode = "stack"
+
+    # Percentual de empresas de cada estado, do estado mais ao menos estruturado
+    percentuais = contagens.div(total_por_estado, axis=0) * 100
+    ordem_estados = (
+        contar_conselhos(histograma_estados).div(total_por_estado, axis=0)
+        .mean(axis=1)
+        .sort_values(ascending=False)
+        .index.astype(str)
+        .tolist()
+    )
+
+    dados_grafico = (
+        percentuais.reset_index()
+        .melt(id_vars="Estado", var_name="Estrutura", value_name="Porcentagem")
+        .merge(
+            contagens.reset_index().melt(
+                id_vars="Estado", var_name="Estrutura", value_name="Quantidade"
+            ),
+            on=["Estado", "Estrutura"],
+        )
+    )
+    dados_grafico["Estado"] = dados_grafico["Estado"].astype(str)
+    dados_grafico["Total Empresas"] = dados_grafico["Estado"].map(
+        total_por_estado.rename(index=str)
+    )
+
+    fig = px.bar(
+        dados_grafico,
+        x="Estado",
+        y="Porcentagem",
+        color="Estrutura",
+        barmode=barmode,
+        category_orders={"Estado": ordem_estados, "Estrutura": list(ordem_cores)},
+        color_discrete_map=ordem_cores,
+        custom_data=["Quantidade", "Total Empresas"],
+        labels={"Porcentagem": "Porcentagem de Empresas (%)", "Estrutura": ""},
+        height=550,
+    )
+
+    # Destacar o Distrito Federal no eixo
+    fig.update_xaxes(
+        tickvals=ordem_estados,
+        ticktext=[f"<b>{uf}</b>" if uf == "DF" else uf for uf in ordem_estados],
+        tickfont=dict(color="black"),
+        title_font=dict(color="black"),
+    )
+
+    fig.update_traces(
+        hovertemplate=(
+            "<b>%{x}</b><br>%{data.name}<br>"
+            "Quantidade: %{customdata[0]} de %{customdata[1]}<br>"
+            "Porcentagem: %{y:.1f}%<extra></extra>"
+        )
+    )
+
+    fig.update_layout(
+        xaxis_title="Estado",
+        yaxis_title="Porcentagem de Empresas (%)",
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5),
+        margin=dict(t=60, b=20, l=20, r=20),
+        yaxis=dict(
+            tickfont=dict(color="black"),
+            title_font=dict(color="black")
+        ),
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_family="Arial",
+            font_color="black"
+        )
+    )
+
+    st.plotly_chart(fig, width="stretch")
+
+    registrar(linhas=total_por_estado.sum(), figura=fig)
+
+    # Tabela com as contagens por estado
+    with st.expander("Ver dados por estado"):
+        tabela_estados = contagens.copy()
+        tabela_estados.insert(0, "Total de Empresas", total_por_estado)
+        tabela_estados = tabela_estados.reindex(ordem_estados)
+        tabela_estados.index.name = "Estado"
+        st.dataframe(tabela_estados.reset_index(), hide_index=True, width="stretch")
+
+
+comparativo_nacional_governanca()
+
+# Painel de desempenho (só com ?desempenho=1 na URL)
+exibir_painel()
+
 # Botão para voltar à página inicial
 if st.button("Voltar à Página Inicial"):
     st.switch_page("Início.py")
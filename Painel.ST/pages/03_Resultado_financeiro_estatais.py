@@ -8,11 +8,15 @@ import base64
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-# Caminho relativo ao arquivo CSV
-file_path = 'BD_Completo_Nacional_Formatado.csv'
-
-# Carregando o arquivo CSV no Pandas DataFrame
-df = pd.read_csv(file_path)
+from estatais.classificacao import (
+    rotulo_dependencia,
+    status_rentabilidade,
+    status_resultado,
+)
+from estatais.desempenho import exibir_painel, medidor, registrar
+from estatais.indice import fatia
+from estatais.moeda import coluna_centavos, para_reais
+from estatais.secoes import exibir_secoes
 
 # Configurações da página
 st.set_page_config(
@@ -109,178 +113,83 @@ O comportamento financeiro ao longo do período reforça a necessidade de aprimo
 
 """)	
 
-st.subheader("Distribuição anual das empresas em relação ao lucro ou prejuízo", divider="orange")
-
-st.subheader(":orange[**Ano de 2023**]")
-
-# Conteúdo específico desta página
-st.write("""
+# Comentário de cada ano analisado (anos novos da base aparecem sem texto até serem comentados)
+TEXTOS_ANO = {
+    2023: """
 
 O ano de 2023 apresentou uma leve piora em relação ao ano anterior, com 61,54% das estatais registrando lucro e 38,46% operando com prejuízo. Essa mudança sugere a existência de desafios persistentes, possivelmente relacionados a pressões macroeconômicas, aumento de custos operacionais e limitações no modelo de financiamento de empresas dependentes. 
 
 Setores tradicionalmente deficitários continuam a impactar negativamente os resultados agregados, reforçando a importância de uma abordagem mais estruturada para equilibrar sustentabilidade financeira e a prestação de serviços essenciais.
-""")	
-
-# Filtrar o dataset para obter empresas localizadas no Distrito Federal (DF) para o ano de 2023
-df_df = df[(df["Estado"] == "DF") & (df["Ano"] == 2023)].copy()
+""",
+    2022: """
 
-# Classificar as empresas como "Lucro" ou "Prejuízo"
-df_df["Resultado"] = df_df["lucros"].apply(lambda x: "Lucro" if x > 0 else "Prejuízo")
-
-# Calcular o total de empresas
-total_empresas = len(df_df)
-
-# Contar a quantidade de empresas com lucro e prejuízo
-df_resultado = df_df["Resultado"].value_counts().reset_index()
-df_resultado.columns = ["Resultado", "Quantidade"]
+Em 2022, houve uma recuperação significativa no desempenho financeiro das estatais, com 69,23% das empresas apresentando lucro e apenas 30,77% registrando prejuízo. Esse aumento na proporção de empresas lucrativas pode ser atribuído a uma recuperação econômica mais ampla, combinada com esforços para melhorar a eficiência operacional e a governança das estatais. 
 
-# Calcular percentuais
-df_resultado["Percentual"] = (df_resultado["Quantidade"] / total_empresas * 100).round(2)
+O desempenho positivo de setores estratégicos, como financeiro e energia, foi crucial para esse resultado. Este período reflete o impacto de políticas públicas e ajustes internos que permitiram maior estabilidade financeira.
 
-# Adicionar coluna de empresas para exibir no hover
-resultado_empresas = df_df.groupby("Resultado")["emp"].apply(list).reset_index()
-df_merge = pd.merge(df_resultado, resultado_empresas, on="Resultado")
-df_merge["Empresas"] = df_merge["emp"].apply(lambda x: "<br>- " + "<br>- ".join(x))
+""",
+    2021: """
 
-# Definir cores
-colors = {"Lucro": "#007acc", "Prejuízo": "#F45046"}
+O ano de 2021 trouxe uma inversão preocupante no panorama, com 57,69% das estatais apresentando prejuízo, enquanto apenas 42,31% registraram lucro. Essa mudança pode estar relacionada aos impactos prolongados da pandemia e à recuperação econômica ainda lenta em setores-chave. Empresas dependentes de subsídios governamentais, como transporte público e assistência técnica agropecuária, enfrentaram maior pressão financeira. 
 
-# Plotar gráfico de pizza interativo com Plotly
-fig = px.pie(
-    df_resultado,
-    values="Quantidade",
-    names="Resultado",
-    color="Resultado",
-    color_discrete_map=colors,
-    title="Distribuição de Empresas Estatais do DF em 2023",
-    hover_data=["Percentual"],
-    labels={"Resultado": "Resultado Financeiro", "Quantidade": "Número de Empresas"},
-)
+Este ano destacou a importância de estratégias de mitigação de riscos e revisão de modelos operacionais para melhorar a sustentabilidade das operações.
 
-# Personalizar o layout
-fig.update_traces(
-    textposition="inside", 
-    textinfo="percent+label",
-    textfont_size=14,
-    textfont_color="white",
-    pull=[0, 0.1],  # Destaca a fatia "Prejuízo"
-    marker=dict(line=dict(color="white", width=2)),
-    hovertemplate="<b>%{label}</b><br>Quantidade: %{value}<br>Percentual: %{customdata[0]:.2f}%"
-)
+""",
+    2020: """
 
-# Melhorar a aparência do gráfico
-fig.update_layout(
-    title={
-        "text": "<b>Resultado Financeiro das Estatais do DF em 2023</b>",
-        "y": 0.95,
-        "x": 0.5,
-        "xanchor": "center",
-        "yanchor": "top",
-        "font": {"size": 20}
-    },
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=-0.2,
-        xanchor="center",
-        x=0.5
-    ),
-    font=dict(size=14),
-    margin=dict(t=80, b=80),
-    height=500,
-)
+No ano de 2020, 63,64% das empresas registraram lucro, enquanto 36,36% operaram com prejuízo. Esse resultado reflete um equilíbrio financeiro, com a maioria das estatais apresentando resultados positivos, mesmo diante do impacto inicial da pandemia de COVID-19. Esse cenário pode ser explicado pelo desempenho robusto de setores como financeiro e imobiliário, que se destacaram pela resiliência em meio às incertezas econômicas. 
 
-# Exibir o gráfico no Streamlit
-st.plotly_chart(fig, use_container_width=True)
+Entretanto, os resultados deficitários de uma parcela das empresas sugerem a necessidade de atenção em setores mais vulneráveis, como transporte e saneamento.
 
-# Mostrar detalhes das empresas em cada categoria
-col1, col2 = st.columns(2)
+""",
+}
 
-with col1:
-    empresas_lucro = df_df[df_df["Resultado"] == "Lucro"]["emp"].tolist()
-    if empresas_lucro:
-        st.info(f"**Empresas com Lucro ({len(empresas_lucro)}):**")
-        for empresa in sorted(empresas_lucro):
-            st.write(f"- {empresa}")
-    else:
-        st.info("Nenhuma empresa com lucro encontrada.")
-
-with col2:
-    empresas_prejuizo = df_df[df_df["Resultado"] == "Prejuízo"]["emp"].tolist()
-    if empresas_prejuizo:
-        st.error(f"**Empresas com Prejuízo ({len(empresas_prejuizo)}):**")
-        for empresa in sorted(empresas_prejuizo):
-            st.write(f"- {empresa}")
-    else:
-        st.error("Nenhuma empresa com prejuízo encontrada.")
+# Tempo de cada seção desta página (ver estatais.desempenho)
+medir = medidor(__file__)
 
-# Mostrar tabela com valores detalhados (opcional)
-with st.expander("Ver dados detalhados de lucro/prejuízo", expanded=False):
-    # Criar um dataframe com as estatísticas para exibição
-    df_detalhe = df_df[["emp", "lucros"]].sort_values(by="lucros", ascending=False).copy()
-    df_detalhe.columns = ["Empresa", "Resultado Financeiro (R$)"]
-    
-    # Exibir a tabela formatada
-    st.dataframe(
-        df_detalhe,
-        column_config={
-            "Resultado Financeiro (R$)": st.column_config.NumberColumn(
-                "Resultado Financeiro (R$)",
-                format="R$ %.2f"
-            )
-        },
-        hide_index=True,
-        use_container_width=True
-    )
+# Definir cores
+colors = {"Lucro": "#007acc", "Prejuízo": "#F45046"}
 
-st.subheader(":orange[**Ano de 2022**]")
+@medir("classificacao_resultados")
+def secao_classificacao_resultados():
+    # Classificar todas as empresas do DF como "Lucro" ou "Prejuízo" em uma única passada
+    df_resultado_df = fatia(estado="DF")[["Ano", "emp", "lucros"]].copy()
+    df_resultado_df["Resultado"] = status_resultado(df_resultado_df["lucros"])
 
-# Conteúdo específico desta página
-st.write("""
+    # Separar as empresas de cada ano disponível na base, do mais recente para o mais antigo
+    empresas_por_ano = {int(ano): grupo for ano, grupo in df_resultado_df.groupby("Ano")}
+    anos = sorted(empresas_por_ano, reverse=True)
 
-Em 2022, houve uma recuperação significativa no desempenho financeiro das estatais, com 69,23% das empresas apresentando lucro e apenas 30,77% registrando prejuízo. Esse aumento na proporção de empresas lucrativas pode ser atribuído a uma recuperação econômica mais ampla, combinada com esforços para melhorar a eficiência operacional e a governança das estatais. 
+    return df_resultado_df, empresas_por_ano, anos
 
-O desempenho positivo de setores estratégicos, como financeiro e energia, foi crucial para esse resultado. Este período reflete o impacto de políticas públicas e ajustes internos que permitiram maior estabilidade financeira.
 
-""")	
+df_resultado_df, empresas_por_ano, anos = secao_classificacao_resultados()
 
-# Filtrar o dataset para obter empresas localizadas no Distrito Federal (DF) para o ano de 2022
-df_2022 = df[(df["Estado"] == "DF") & (df["Ano"] == 2022)].copy()
 
-# Verificar se há dados para processar
-if len(df_2022) == 0:
-    st.warning("Não há dados de empresas para o DF no ano de 2022.")
-else:
-    # Classificar as empresas como "Lucro" ou "Prejuízo"
-    df_2022["Resultado"] = df_2022["lucros"].apply(
-        lambda x: "Lucro" if x > 0 else "Prejuízo"
-    )
-    
+# Pizza de lucro/prejuízo, listas de empresas e detalhamento de um ano
+def exibir_distribuicao_ano(ano, df_ano):
     # Calcular o total de empresas
-    total_empresas = len(df_2022)
-    
+    total_empresas = len(df_ano)
+
     # Contar a quantidade de empresas com lucro e prejuízo
-    df_resultado_2022 = df_2022["Resultado"].value_counts().reset_index()
-    df_resultado_2022.columns = ["Resultado", "Quantidade"]
-    
+    df_resultado = df_ano["Resultado"].value_counts().reset_index()
+    df_resultado.columns = ["Resultado", "Quantidade"]
+
     # Calcular percentuais
-    df_resultado_2022["Percentual"] = (df_resultado_2022["Quantidade"] / total_empresas * 100).round(2)
-    
-    # Definir cores
-    colors = {"Lucro": "#007acc", "Prejuízo": "#F45046"}
-    
+    df_resultado["Percentual"] = (df_resultado["Quantidade"] / total_empresas * 100).round(2)
+
     # Plotar gráfico de pizza interativo com Plotly
     fig = px.pie(
-        df_resultado_2022,
+        df_resultado,
         values="Quantidade",
         names="Resultado",
         color="Resultado",
         color_discrete_map=colors,
-        title="Distribuição de Empresas Estatais do DF em 2022",
+        title=f"Distribuição de Empresas Estatais do DF em {ano}",
         hover_data=["Percentual"],
         labels={"Resultado": "Resultado Financeiro", "Quantidade": "Número de Empresas"},
     )
-    
+
     # Personalizar o layout
     fig.update_traces(
         textposition="inside", 
@@ -291,15 +200,15 @@ else:
         marker=dict(line=dict(color="white", width=2)),
         hovertemplate="<b>%{label}</b><br>Quantidade: %{value}<br>Percentual: %{customdata[0]:.2f}%"
     )
-    
+
     # Melhorar a aparência do gráfico
     fig.update_layout(
         title={
-            "text": "<b>Resultado Financeiro das Estatais do DF em 2022</b>",
+            "text": f"<b>Resultado Financeiro das Estatais do DF em {ano}</b>",
             "y": 0.95,
             "x": 0.5,
             "xanchor": "center",
-            "yanchor": "top",  # Corrigindo a aspas de fechamento faltante
+            "yanchor": "top",
             "font": {"size": 20}
         },
         legend=dict(
@@ -313,373 +222,174 @@ else:
         margin=dict(t=80, b=80),
         height=500,
     )
-    
+
     # Exibir o gráfico no Streamlit
-    st.plotly_chart(fig, use_container_width=True)
-    
+    st.plotly_chart(fig, width="stretch")
+
+    registrar(linhas=len(df_ano), figura=fig)
+
     # Mostrar detalhes das empresas em cada categoria
     col1, col2 = st.columns(2)
-    
+
     with col1:
-        empresas_lucro = df_2022[df_2022["Resultado"] == "Lucro"]["emp"].tolist()
+        empresas_lucro = df_ano.loc[df_ano["Resultado"] == "Lucro", "emp"].tolist()
         if empresas_lucro:
             st.info(f"**Empresas com Lucro ({len(empresas_lucro)}):**")
             for empresa in sorted(empresas_lucro):
                 st.write(f"- {empresa}")
         else:
             st.info("Nenhuma empresa com lucro encontrada.")
-    
+
     with col2:
-        empresas_prejuizo = df_2022[df_2022["Resultado"] == "Prejuízo"]["emp"].tolist()
+        empresas_prejuizo = df_ano.loc[df_ano["Resultado"] == "Prejuízo", "emp"].tolist()
         if empresas_prejuizo:
             st.error(f"**Empresas com Prejuízo ({len(empresas_prejuizo)}):**")
             for empresa in sorted(empresas_prejuizo):
                 st.write(f"- {empresa}")
         else:
             st.error("Nenhuma empresa com prejuízo encontrada.")
-    
-    # Mostrar tabela com valores detalhados (opcional)
-    with st.expander("Ver dados detalhados de lucro/prejuízo", expanded=False):
-        # Criar um dataframe com as estatísticas para exibição
-        df_detalhe = df_2022[["emp", "lucros"]].sort_values(by="lucros", ascending=False).copy()
-        df_detalhe.columns = ["Empresa", "Resultado Financeiro (R$)"]
-        
-        # Exibir a tabela formatada
-        st.dataframe(
-            df_detalhe,
-            column_config={
-                "Resultado Financeiro (R$)": st.column_config.NumberColumn(
-                    "Resultado Financeiro (R$)",
-                    format="R$ %.2f"
-                )
-            },
-            hide_index=True,
-            use_container_width=True
-        )
-
-st.subheader(":orange[**Ano de 2021**]")
-
-# Conteúdo específico desta página
-st.write("""
-
-O ano de 2021 trouxe uma inversão preocupante no panorama, com 57,69% das estatais apresentando prejuízo, enquanto apenas 42,31% registraram lucro. Essa mudança pode estar relacionada aos impactos prolongados da pandemia e à recuperação econômica ainda lenta em setores-chave. Empresas dependentes de subsídios governamentais, como transporte público e assistência técnica agropecuária, enfrentaram maior pressão financeira. 
 
-Este ano destacou a importância de estratégias de mitigação de riscos e revisão de modelos operacionais para melhorar a sustentabilidade das operações.
+    # Mostrar tabela com valores detalhados (opcional), montada só quando aberta
+    detalhes = st.expander(
+        "Ver dados detalhados de lucro/prejuízo",
+        expanded=False,
+        key=f"detalhe_resultado_{ano}",
+        on_change="rerun",
+    )
+    if detalhes.open:
+        with detalhes:
+            # Criar um dataframe com as estatísticas para exibição
+            df_detalhe = df_ano[["emp", "lucros"]].sort_values(by="lucros", ascending=False)
+            df_detalhe.columns = ["Empresa", "Resultado Financeiro (R$)"]
+
+            # Exibir a tabela formatada
+            st.dataframe(
+                df_detalhe,
+                column_config={
+                    "Resultado Financeiro (R$)": st.column_config.NumberColumn(
+                        "Resultado Financeiro (R$)",
+                        format="R$ %.2f"
+                    )
+                },
+                hide_index=True,
+                width="stretch"
+            )
 
-""")	
 
-# Filtrar o dataset para obter empresas localizadas no Distrito Federal (DF) para o ano de 2021
-df_2021 = df[(df["Estado"] == "DF") & (df["Ano"] == 2021)].copy()
+# Seção: distribuição anual das empresas entre lucro e prejuízo
+@st.fragment
+@medir("distribuicao_anual")
+def secao_distribuicao_anual():
+    st.subheader("Distribuição anual das empresas em relação ao lucro ou prejuízo", divider="orange")
 
-# Verificar se há dados para processar
-if len(df_2021) == 0:
-    st.warning("Não há dados de empresas para o DF no ano de 2021.")
-else:
-    # Classificar as empresas como "Lucro" ou "Prejuízo"
-    df_2021["Resultado"] = df_2021["lucros"].apply(
-        lambda x: "Lucro" if x > 0 else "Prejuízo"
+    if not anos:
+        st.warning("Não há dados de empresas para o DF.")
+    else:
+        # Uma aba por ano; só o ano selecionado é calculado e desenhado a cada execução
+        abas_ano = st.tabs(
+            [f"Ano de {ano}" for ano in anos],
+            key="aba_distribuicao_ano",
+            on_change="rerun",
+        )
+        for ano, aba in zip(anos, abas_ano):
+            if not aba.open:
+                continue
+            with aba:
+                st.subheader(f":orange[**Ano de {ano}**]")
+
+                # Conteúdo específico desta página
+                if ano in TEXTOS_ANO:
+                    st.write(TEXTOS_ANO[ano])
+
+                exibir_distribuicao_ano(ano, empresas_por_ano[ano])
+
+
+# Seção: evolução dos resultados ao longo dos anos
+@st.fragment
+@medir("evolucao")
+def secao_evolucao():
+    # Após todos os gráficos, adicionar uma análise comparativa entre os anos
+    periodo = f"{min(anos)}-{max(anos)}" if anos else ""
+    st.subheader(f"Evolução dos Resultados Financeiros ({periodo})", divider="orange")
+
+    # Resumir a evolução ao longo dos anos a partir da mesma classificação
+    df_evolucao = (
+        df_resultado_df.assign(
+            lucro=df_resultado_df["lucros"] > 0,
+            prejuizo=df_resultado_df["lucros"] <= 0,
+        )
+        .groupby("Ano")
+        .agg(
+            **{
+                "Empresas com Lucro": ("lucro", "sum"),
+                "Empresas com Prejuízo": ("prejuizo", "sum"),
+                "Total": ("lucro", "size"),
+            }
+        )
+        .reset_index()
     )
-    
-    # Calcular o total de empresas
-    total_empresas = len(df_2021)
-    
-    # Contar a quantidade de empresas com lucro e prejuízo
-    df_resultado_2021 = df_2021["Resultado"].value_counts().reset_index()
-    df_resultado_2021.columns = ["Resultado", "Quantidade"]
-    
-    # Calcular percentuais
-    df_resultado_2021["Percentual"] = (df_resultado_2021["Quantidade"] / total_empresas * 100).round(2)
-    
-    # Definir cores
-    colors = {"Lucro": "#007acc", "Prejuízo": "#F45046"}
-    
-    # Plotar gráfico de pizza interativo com Plotly
-    fig = px.pie(
-        df_resultado_2021,
-        values="Quantidade",
-        names="Resultado",
-        color="Resultado",
-        color_discrete_map=colors,
-        title="Distribuição de Empresas Estatais do DF em 2021",
-        hover_data=["Percentual"],
-        labels={"Resultado": "Resultado Financeiro", "Quantidade": "Número de Empresas"},
+    df_evolucao["Ano"] = df_evolucao["Ano"].astype(int)
+    df_evolucao["% Lucro"] = (df_evolucao["Empresas com Lucro"] / df_evolucao["Total"] * 100).round(2)
+    df_evolucao["% Prejuízo"] = (df_evolucao["Empresas com Prejuízo"] / df_evolucao["Total"] * 100).round(2)
+    df_evolucao = df_evolucao.drop(columns="Total")
+
+    # Criar gráfico de linhas para mostrar a evolução
+    fig_evolucao = px.line(
+        df_evolucao,
+        x="Ano",
+        y=["% Lucro", "% Prejuízo"],
+        title=f"Evolução Percentual das Empresas com Lucro e Prejuízo ({periodo})",
+        labels={"value": "Percentual (%)", "variable": "Resultado"},
+        color_discrete_map={"% Lucro": "#007acc", "% Prejuízo": "#F45046"},
+        markers=True
     )
-    
+
     # Personalizar o layout
-    fig.update_traces(
-        textposition="inside", 
-        textinfo="percent+label",
-        textfont_size=14,
-        textfont_color="white",
-        pull=[0, 0.1],  # Destaca a fatia "Prejuízo"
-        marker=dict(line=dict(color="white", width=2)),
-        hovertemplate="<b>%{label}</b><br>Quantidade: %{value}<br>Percentual: %{customdata[0]:.2f}%"
-    )
-    
-    # Melhorar a aparência do gráfico
-    fig.update_layout(
-        title={
-            "text": "<b>Resultado Financeiro das Estatais do DF em 2021</b>",
-            "y": 0.95,
-            "x": 0.5,
-            "xanchor": "center",
-            "yanchor": "top",
-            "font": {"size": 20}
-        },
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.2,
-            xanchor="center",
-            x=0.5
-        ),
+    fig_evolucao.update_layout(
+        xaxis=dict(dtick=1),  # Mostrar todos os anos
+        yaxis=dict(range=[0, 100]),
+        legend_title_text="",
+        hovermode="x unified",
         font=dict(size=14),
-        margin=dict(t=80, b=80),
-        height=500,
+        height=450
     )
-    
-    # Exibir o gráfico no Streamlit
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Mostrar detalhes das empresas em cada categoria
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        empresas_lucro = df_2021[df_2021["Resultado"] == "Lucro"]["emp"].tolist()
-        if empresas_lucro:
-            st.info(f"**Empresas com Lucro ({len(empresas_lucro)}):**")
-            for empresa in sorted(empresas_lucro):
-                st.write(f"- {empresa}")
-        else:
-            st.info("Nenhuma empresa com lucro encontrada.")
-    
-    with col2:
-        empresas_prejuizo = df_2021[df_2021["Resultado"] == "Prejuízo"]["emp"].tolist()
-        if empresas_prejuizo:
-            st.error(f"**Empresas com Prejuízo ({len(empresas_prejuizo)}):**")
-            for empresa in sorted(empresas_prejuizo):
-                st.write(f"- {empresa}")
-        else:
-            st.error("Nenhuma empresa com prejuízo encontrada.")
-    
-    # Mostrar tabela com valores detalhados (opcional)
-    with st.expander("Ver dados detalhados de lucro/prejuízo", expanded=False):
-        # Criar um dataframe com as estatísticas para exibição
-        df_detalhe = df_2021[["emp", "lucros"]].sort_values(by="lucros", ascending=False).copy()
-        df_detalhe.columns = ["Empresa", "Resultado Financeiro (R$)"]
-        
-        # Exibir a tabela formatada
-        st.dataframe(
-            df_detalhe,
-            column_config={
-                "Resultado Financeiro (R$)": st.column_config.NumberColumn(
-                    "Resultado Financeiro (R$)",
-                    format="R$ %.2f"
-                )
-            },
-            hide_index=True,
-            use_container_width=True
-        )
-
-st.subheader(":orange[**Ano de 2020**]")
 
-# Conteúdo específico desta página
-st.write("""
+    # Exibir o gráfico de evolução
+    st.plotly_chart(fig_evolucao, width="stretch")
 
-No ano de 2020, 63,64% das empresas registraram lucro, enquanto 36,36% operaram com prejuízo. Esse resultado reflete um equilíbrio financeiro, com a maioria das estatais apresentando resultados positivos, mesmo diante do impacto inicial da pandemia de COVID-19. Esse cenário pode ser explicado pelo desempenho robusto de setores como financeiro e imobiliário, que se destacaram pela resiliência em meio às incertezas econômicas. 
-
-Entretanto, os resultados deficitários de uma parcela das empresas sugerem a necessidade de atenção em setores mais vulneráveis, como transporte e saneamento.
+    registrar(linhas=len(df_resultado_df), figura=fig_evolucao)
 
-""")	
+    # Mostrar tabela resumo
+    st.markdown("### Resumo dos Resultados por Ano")
 
-# Filtrar o dataset para obter empresas localizadas no Distrito Federal (DF) para o ano de 2020
-df_2020 = df[(df["Estado"] == "DF") & (df["Ano"] == 2020)].copy()
+    # Formatando o dataframe para exibição
+    df_exibir = df_evolucao.copy()
+    df_exibir["% Lucro"] = df_exibir["% Lucro"].map(lambda x: f"{x:.2f}%")
+    df_exibir["% Prejuízo"] = df_exibir["% Prejuízo"].map(lambda x: f"{x:.2f}%")
 
-# Verificar se há dados para processar
-if len(df_2020) == 0:
-    st.warning("Não há dados de empresas para o DF no ano de 2020.")
-else:
-    # Classificar as empresas como "Lucro" ou "Prejuízo"
-    df_2020["Resultado"] = df_2020["lucros"].apply(
-        lambda x: "Lucro" if x > 0 else "Prejuízo"
-    )
-    
-    # Calcular o total de empresas
-    total_empresas = len(df_2020)
-    
-    # Contar a quantidade de empresas com lucro e prejuízo
-    df_resultado_2020 = df_2020["Resultado"].value_counts().reset_index()
-    df_resultado_2020.columns = ["Resultado", "Quantidade"]
-    
-    # Calcular percentuais
-    df_resultado_2020["Percentual"] = (df_resultado_2020["Quantidade"] / total_empresas * 100).round(2)
-    
-    # Definir cores
-    colors = {"Lucro": "#007acc", "Prejuízo": "#F45046"}
-    
-    # Plotar gráfico de pizza interativo com Plotly
-    fig = px.pie(
-        df_resultado_2020,
-        values="Quantidade",
-        names="Resultado",
-        color="Resultado",
-        color_discrete_map=colors,
-        title="Distribuição de Empresas Estatais do DF em 2020",
-        hover_data=["Percentual"],
-        labels={"Resultado": "Resultado Financeiro", "Quantidade": "Número de Empresas"},
-    )
-    
-    # Personalizar o layout
-    fig.update_traces(
-        textposition="inside", 
-        textinfo="percent+label",
-        textfont_size=14,
-        textfont_color="white",
-        pull=[0, 0.1],  # Destaca a fatia "Prejuízo"
-        marker=dict(line=dict(color="white", width=2)),
-        hovertemplate="<b>%{label}</b><br>Quantidade: %{value}<br>Percentual: %{customdata[0]:.2f}%"
-    )
-    
-    # Melhorar a aparência do gráfico
-    fig.update_layout(
-        title={
-            "text": "<b>Resultado Financeiro das Estatais do DF em 2020</b>",
-            "y": 0.95,
-            "x": 0.5,
-            "xanchor": "center",
-            "yanchor": "top",
-            "font": {"size": 20}
+    # Exibir tabela formatada
+    st.dataframe(
+        df_exibir,
+        column_config={
+            "Ano": st.column_config.NumberColumn("Ano"),
+            "Empresas com Lucro": st.column_config.NumberColumn("Empresas com Lucro"),
+            "Empresas com Prejuízo": st.column_config.NumberColumn("Empresas com Prejuízo"),
+            "% Lucro": st.column_config.TextColumn("% Lucro"),
+            "% Prejuízo": st.column_config.TextColumn("% Prejuízo")
         },
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=-0.2,
-            xanchor="center",
-            x=0.5
-        ),
-        font=dict(size=14),
-        margin=dict(t=80, b=80),
-        height=500,
+        hide_index=True,
+        width="stretch"
     )
-    
-    # Exibir o gráfico no Streamlit
-    st.plotly_chart(fig, use_container_width=True)
-    
-    # Mostrar detalhes das empresas em cada categoria
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        empresas_lucro = df_2020[df_2020["Resultado"] == "Lucro"]["emp"].tolist()
-        if empresas_lucro:
-            st.info(f"**Empresas com Lucro ({len(empresas_lucro)}):**")
-            for empresa in sorted(empresas_lucro):
-                st.write(f"- {empresa}")
-        else:
-            st.info("Nenhuma empresa com lucro encontrada.")
-    
-    with col2:
-        empresas_prejuizo = df_2020[df_2020["Resultado"] == "Prejuízo"]["emp"].tolist()
-        if empresas_prejuizo:
-            st.error(f"**Empresas com Prejuízo ({len(empresas_prejuizo)}):**")
-            for empresa in sorted(empresas_prejuizo):
-                st.write(f"- {empresa}")
-        else:
-            st.error("Nenhuma empresa com prejuízo encontrada.")
-    
-    # Mostrar tabela com valores detalhados (opcional)
-    with st.expander("Ver dados detalhados de lucro/prejuízo", expanded=False):
-        # Criar um dataframe com as estatísticas para exibição
-        df_detalhe = df_2020[["emp", "lucros"]].sort_values(by="lucros", ascending=False).copy()
-        df_detalhe.columns = ["Empresa", "Resultado Financeiro (R$)"]
-        
-        # Exibir a tabela formatada
-        st.dataframe(
-            df_detalhe,
-            column_config={
-                "Resultado Financeiro (R$)": st.column_config.NumberColumn(
-                    "Resultado Financeiro (R$)",
-                    format="R$ %.2f"
-                )
-            },
-            hide_index=True,
-            use_container_width=True
-        )
-
-# Após todos os gráficos, adicionar uma análise comparativa entre os anos
-st.subheader("Evolução dos Resultados Financeiros (2020-2023)", divider="orange")
-
-# Criar um dataframe resumindo a evolução ao longo dos anos
-anos = [2020, 2021, 2022, 2023]
-dados_anos = []
-
-for ano in anos:
-    df_ano = df[(df["Estado"] == "DF") & (df["Ano"] == ano)].copy()
-    if len(df_ano) > 0:
-        lucro_count = len(df_ano[df_ano["lucros"] > 0])
-        prejuizo_count = len(df_ano[df_ano["lucros"] <= 0])
-        total = len(df_ano)
-        dados_anos.append({
-            "Ano": ano,
-            "Empresas com Lucro": lucro_count,
-            "Empresas com Prejuízo": prejuizo_count,
-            "% Lucro": round((lucro_count/total*100), 2),  # Usando a função round() em vez do método
-            "% Prejuízo": round((prejuizo_count/total*100), 2)  # Usando a função round() em vez do método
-        })
-
-# Criar dataframe para visualização
-df_evolucao = pd.DataFrame(dados_anos)
-
-# Criar gráfico de linhas para mostrar a evolução
-fig_evolucao = px.line(
-    df_evolucao,
-    x="Ano",
-    y=["% Lucro", "% Prejuízo"],
-    title="Evolução Percentual das Empresas com Lucro e Prejuízo (2020-2023)",
-    labels={"value": "Percentual (%)", "variable": "Resultado"},
-    color_discrete_map={"% Lucro": "#007acc", "% Prejuízo": "#F45046"},
-    markers=True
-)
-
-# Personalizar o layout
-fig_evolucao.update_layout(
-    xaxis=dict(dtick=1),  # Mostrar todos os anos
-    yaxis=dict(range=[0, 100]),
-    legend_title_text="",
-    hovermode="x unified",
-    font=dict(size=14),
-    height=450
-)
 
-# Exibir o gráfico de evolução
-st.plotly_chart(fig_evolucao, use_container_width=True)
-
-# Mostrar tabela resumo
-st.markdown("### Resumo dos Resultados por Ano")
-
-# Formatando o dataframe para exibição
-df_exibir = df_evolucao.copy()
-df_exibir["% Lucro"] = df_exibir["% Lucro"].map(lambda x: f"{x:.2f}%")
-df_exibir["% Prejuízo"] = df_exibir["% Prejuízo"].map(lambda x: f"{x:.2f}%")
-
-# Exibir tabela formatada
-st.dataframe(
-    df_exibir,
-    column_config={
-        "Ano": st.column_config.NumberColumn("Ano"),
-        "Empresas com Lucro": st.column_config.NumberColumn("Empresas com Lucro"),
-        "Empresas com Prejuízo": st.column_config.NumberColumn("Empresas com Prejuízo"),
-        "% Lucro": st.column_config.TextColumn("% Lucro"),
-        "% Prejuízo": st.column_config.TextColumn("% Prejuízo")
-    },
-    hide_index=True,
-    use_container_width=True
-)
 
+# Seção: relação entre lucro ou prejuízo e patrimônio líquido
+@st.fragment
+@medir("lucro_patrimonio")
+def secao_lucro_patrimonio():
+    st.subheader("Relação entre Lucro ou Prejuízo e o Patrimônio Líquido em 2023", divider="orange")
 
-st.subheader("Relação entre Lucro ou Prejuízo e o Patrimônio Líquido em 2023", divider="orange")
-
-# Conteúdo específico desta página
-st.write("""
+    # Conteúdo específico desta página
+    st.write("""
 
 O gráfico abaixo demonstra a relação entre o lucro ou prejuízo das empresas estatais do Distrito Federal e seus respectivos patrimônios líquidos em 2023. Essa análise é essencial para avaliar a eficiência das empresas em gerar resultados financeiros positivos a partir de seus recursos patrimoniais. Empresas com maior patrimônio líquido tendem a ter maior capacidade de alavancagem operacional e financeira, o que deveria, em teoria, traduzir-se em lucros consistentes. No entanto, os resultados apresentados revelam uma diversidade significativa de desempenhos, com algumas empresas altamente lucrativas e outras registrando prejuízos, independentemente do tamanho de seus patrimônios.
 
@@ -691,194 +401,196 @@ A análise reforça a importância de uma governança corporativa sólida e de e
 
 """)	
 
-# Filtrar o dataset e garantir a ordem correta dos dados
-df_filteorange = df[(df["Estado"] == "DF") & (df["Ano"] == 2023)].copy()
-
-# Verificar a consistência removendo nulos e resetando o índice
-df_filteorange_clean = df_filteorange.dropna(subset=["lucros", "PL"]).reset_index(drop=True)
-
-# Adicionar colunas para formatação e exibição
-df_filteorange_clean["Status"] = df_filteorange_clean["lucros"].apply(
-    lambda lucro: "Lucro" if lucro > 0 else "Prejuízo"
-)
-
-# Adicionar informação de dependência para o hover
-df_filteorange_clean["Dependência"] = df_filteorange_clean["dep"].apply(
-    lambda x: "Dependente" if str(x).upper() == "DEPENDENTE" else "Não Dependente"
-)
-
-# Criar o gráfico de dispersão interativo
-fig = px.scatter(
-    df_filteorange_clean,
-    x="PL",
-    y="lucros",
-    color="Status",
-    size=df_filteorange_clean["PL"].abs() / df_filteorange_clean["PL"].abs().max() * 50 + 10,  
-    labels={
-        "PL": "Patrimônio Líquido (R$)",
-        "lucros": "Lucro/Prejuízo (R$)",
-        "Status": "Resultado",
-        "size": "Tamanho"
-    },
-    color_discrete_map={
-        "Lucro": "#007acc",
-        "Prejuízo": "#F45046",
-    },
-    hover_name="emp",
-    hover_data={
-        "Status": True,
-        "PL": ":,.2f",
-        "lucros": ":,.2f",
-        "Dependência": True,
-    },
-    title="Relação entre Patrimônio Líquido e Resultado Financeiro das Estatais do DF (2023)"
-)
-
-# Configurar hovertemplate para garantir formatação correta
-fig.update_traces(
-    hovertemplate=(
-        "<b>%{hovertext}</b><br>"
-        "Status: %{customdata[0]}<br>"
-        "Dependência: %{customdata[3]}<br>"
-        "Patrimônio Líquido: R$ %{customdata[1]:,.2f}<br>"
-        "Resultado: R$ %{customdata[2]:,.2f}<extra></extra>"
-    ),
-    marker=dict(
-        line=dict(width=1, color="DarkSlateGray")
-    ),
-)
+    # Filtrar o dataset e garantir a ordem correta dos dados
+    df_filteorange = fatia(estado="DF", ano=2023).copy()
+
+    # Verificar a consistência removendo nulos e resetando o índice
+    df_filteorange_clean = df_filteorange.dropna(subset=["lucros", "PL"]).reset_index(drop=True)
+
+    # Adicionar colunas para formatação e exibição
+    df_filteorange_clean["Status"] = status_resultado(df_filteorange_clean["lucros"])
+
+    # Adicionar informação de dependência para o hover
+    df_filteorange_clean["Dependência"] = rotulo_dependencia(df_filteorange_clean["dep"])
+
+    # Criar o gráfico de dispersão interativo
+    fig = px.scatter(
+        df_filteorange_clean,
+        x="PL",
+        y="lucros",
+        color="Status",
+        size=df_filteorange_clean["PL"].abs() / df_filteorange_clean["PL"].abs().max() * 50 + 10,  
+        labels={
+            "PL": "Patrimônio Líquido (R$)",
+            "lucros": "Lucro/Prejuízo (R$)",
+            "Status": "Resultado",
+            "size": "Tamanho"
+        },
+        color_discrete_map={
+            "Lucro": "#007acc",
+            "Prejuízo": "#F45046",
+        },
+        hover_name="emp",
+        hover_data={
+            "Status": True,
+            "PL": ":,.2f",
+            "lucros": ":,.2f",
+            "Dependência": True,
+        },
+        title="Relação entre Patrimônio Líquido e Resultado Financeiro das Estatais do DF (2023)"
+    )
 
-# Atualizar layout com melhorias nos textos e legenda
-fig.update_layout(
-    xaxis=dict(
-        title=dict(
-            text="Patrimônio Líquido (R$)",
-            font=dict(size=16, color="black")
+    # Configurar hovertemplate para garantir formatação correta
+    fig.update_traces(
+        hovertemplate=(
+            "<b>%{hovertext}</b><br>"
+            "Status: %{customdata[0]}<br>"
+            "Dependência: %{customdata[3]}<br>"
+            "Patrimônio Líquido: R$ %{customdata[1]:,.2f}<br>"
+            "Resultado: R$ %{customdata[2]:,.2f}<extra></extra>"
         ),
-        tickfont=dict(size=14, color="black"),
-        gridcolor="lightgray"
-    ),
-    yaxis=dict(
-        title=dict(
-            text="Lucro/Prejuízo (R$)",
-            font=dict(size=16, color="black")
+        marker=dict(
+            line=dict(width=1, color="DarkSlateGray")
         ),
-        tickfont=dict(size=14, color="black"),
-        gridcolor="lightgray"
-    ),
-  
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=-0.25,  # Aumentar a distância para evitar sobreposição
-        xanchor="center",
-        x=0.5,
-        font=dict(size=14, color="black"),
-        itemsizing="constant",  # Manter tamanho constante dos itens da legenda
-        itemwidth=50,  # Largura dos itens da legenda
-        borderwidth=1,  # Adicionar borda à legenda
-        bordercolor="lightgray",
-        bgcolor="rgba(255, 255, 255, 0.9)"  # Fundo levemente transparente
-    ),
-    plot_bgcolor="white",
-    paper_bgcolor="white",
-    height=650,  # Aumentar a altura para acomodar melhor a legenda
-    margin=dict(t=80, b=120, l=80, r=40),  # Aumentar margem inferior para a legenda
-    hoverlabel=dict(
-        bgcolor="white",
-        font_size=14,
-        font_family="Arial",
-        font_color="black"
-    ),
-    showlegend=True,
-)
+    )
 
-# Adicionar linha de referência no eixo Y=0
-fig.add_hline(
-    y=0, 
-    line_dash="dash", 
-    line_color="gray", 
-    annotation_text="Linha de Referência (Zero)", 
-    annotation_position="bottom right",
-    annotation_font=dict(size=12, color="black")
-)
+    # Atualizar layout com melhorias nos textos e legenda
+    fig.update_layout(
+        xaxis=dict(
+            title=dict(
+                text="Patrimônio Líquido (R$)",
+                font=dict(size=16, color="black")
+            ),
+            tickfont=dict(size=14, color="black"),
+            gridcolor="lightgray"
+        ),
+        yaxis=dict(
+            title=dict(
+                text="Lucro/Prejuízo (R$)",
+                font=dict(size=16, color="black")
+            ),
+            tickfont=dict(size=14, color="black"),
+            gridcolor="lightgray"
+        ),
 
-# Adicionar linha de referência no eixo X=0
-fig.add_vline(
-    x=0, 
-    line_dash="dash", 
-    line_color="gray", 
-    annotation_text="PL Zero", 
-    annotation_position="top right",
-    annotation_font=dict(size=12, color="black")
-)
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.25,  # Aumentar a distância para evitar sobreposição
+            xanchor="center",
+            x=0.5,
+            font=dict(size=14, color="black"),
+            itemsizing="constant",  # Manter tamanho constante dos itens da legenda
+            itemwidth=50,  # Largura dos itens da legenda
+            borderwidth=1,  # Adicionar borda à legenda
+            bordercolor="lightgray",
+            bgcolor="rgba(255, 255, 255, 0.9)"  # Fundo levemente transparente
+        ),
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        height=650,  # Aumentar a altura para acomodar melhor a legenda
+        margin=dict(t=80, b=120, l=80, r=40),  # Aumentar margem inferior para a legenda
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=14,
+            font_family="Arial",
+            font_color="black"
+        ),
+        showlegend=True,
+    )
 
-# Exibir o gráfico no Streamlit
-st.plotly_chart(fig, use_container_width=True)
+    # Adicionar linha de referência no eixo Y=0
+    fig.add_hline(
+        y=0, 
+        line_dash="dash", 
+        line_color="gray", 
+        annotation_text="Linha de Referência (Zero)", 
+        annotation_position="bottom right",
+        annotation_font=dict(size=12, color="black")
+    )
 
-# Adicionar informações complementares
-with st.expander("Ver detalhes dos dados"):
-    # Criar tabela com informações organizadas
-    tabela_detalhe = df_filteorange_clean[["emp", "PL", "lucros", "Status", "Dependência"]].sort_values(
-        by="PL", ascending=False
-    ).copy()
-    
-    tabela_detalhe.columns = [
-        "Empresa", 
-        "Patrimônio Líquido (R$)", 
-        "Resultado Financeiro (R$)", 
-        "Status",
-        "Dependência"
-    ]
-    
-    # Exibir tabela formatada
-    st.dataframe(
-        tabela_detalhe,
-        column_config={
-            "Patrimônio Líquido (R$)": st.column_config.NumberColumn(
-                "Patrimônio Líquido (R$)",
-                format="R$ %.2f"
-            ),
-            "Resultado Financeiro (R$)": st.column_config.NumberColumn(
-                "Resultado Financeiro (R$)",
-                format="R$ %.2f"
-            ),
-        },
-        hide_index=True,
-        use_container_width=True
+    # Adicionar linha de referência no eixo X=0
+    fig.add_vline(
+        x=0, 
+        line_dash="dash", 
+        line_color="gray", 
+        annotation_text="PL Zero", 
+        annotation_position="top right",
+        annotation_font=dict(size=12, color="black")
     )
-    
-    # Resumo estatístico
-    st.markdown("### Resumo estatístico")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.metric(
-            "Média de Patrimônio Líquido", 
-            f"R$ {df_filteorange_clean['PL'].mean():,.2f}"
-        )
-        st.metric(
-            "Empresa com maior PL", 
-            df_filteorange_clean.loc[df_filteorange_clean['PL'].idxmax(), 'emp'],
-            f"R$ {df_filteorange_clean['PL'].max():,.2f}"
-        )
-    
-    with col2:
-        st.metric(
-            "Média de Lucro/Prejuízo", 
-            f"R$ {df_filteorange_clean['lucros'].mean():,.2f}"
-        )
-        st.metric(
-            "Empresa mais lucrativa", 
-            df_filteorange_clean.loc[df_filteorange_clean['lucros'].idxmax(), 'emp'],
-            f"R$ {df_filteorange_clean['lucros'].max():,.2f}"
+
+    # Exibir o gráfico no Streamlit
+    st.plotly_chart(fig, width="stretch")
+
+    registrar(linhas=len(df_filteorange_clean), figura=fig)
+
+    # Adicionar informações complementares
+    with st.expander("Ver detalhes dos dados"):
+        # Criar tabela com informações organizadas
+        tabela_detalhe = df_filteorange_clean[["emp", "PL", "lucros", "Status", "Dependência"]].sort_values(
+            by="PL", ascending=False
+        ).copy()
+
+        tabela_detalhe.columns = [
+            "Empresa", 
+            "Patrimônio Líquido (R$)", 
+            "Resultado Financeiro (R$)", 
+            "Status",
+            "Dependência"
+        ]
+
+        # Exibir tabela formatada
+        st.dataframe(
+            tabela_detalhe,
+            column_config={
+                "Patrimônio Líquido (R$)": st.column_config.NumberColumn(
+                    "Patrimônio Líquido (R$)",
+                    format="R$ %.2f"
+                ),
+                "Resultado Financeiro (R$)": st.column_config.NumberColumn(
+                    "Resultado Financeiro (R$)",
+                    format="R$ %.2f"
+                ),
+            },
+            hide_index=True,
+            width="stretch"
         )
 
+        # Resumo estatístico
+        st.markdown("### Resumo estatístico")
+        col1, col2 = st.columns(2)
 
-st.subheader("Rentabilidade das empresas em 2023 - (Lucro ou Prejuízo / Patrimônio Líquido)", divider="orange")
+        with col1:
+            st.metric(
+                "Média de Patrimônio Líquido", 
+                f"R$ {df_filteorange_clean['PL'].mean():,.2f}"
+            )
+            st.metric(
+                "Empresa com maior PL", 
+                df_filteorange_clean.loc[df_filteorange_clean['PL'].idxmax(), 'emp'],
+                f"R$ {df_filteorange_clean['PL'].max():,.2f}"
+            )
+
+        with col2:
+            st.metric(
+                "Média de Lucro/Prejuízo", 
+                f"R$ {df_filteorange_clean['lucros'].mean():,.2f}"
+            )
+            st.metric(
+                "Empresa mais lucrativa", 
+                df_filteorange_clean.loc[df_filteorange_clean['lucros'].idxmax(), 'emp'],
+                f"R$ {df_filteorange_clean['lucros'].max():,.2f}"
+            )
 
-# Conteúdo específico desta página
-st.write("""
+
+# Seção: rentabilidade das empresas
+@st.fragment
+@medir("rentabilidade")
+def secao_rentabilidade():
+    st.subheader("Rentabilidade das empresas em 2023 - (Lucro ou Prejuízo / Patrimônio Líquido)", divider="orange")
+
+    # Conteúdo específico desta página
+    st.write("""
 
 O gráfico abaixo evidencia a rentabilidade das empresas estatais do Distrito Federal em 2023, medida pela relação entre lucro ou prejuízo e patrimônio líquido. Empresas como CEB Participações, CEB Lajeado e CAESB destacaram-se com as maiores rentabilidades, demonstrando eficiência na utilização de seus ativos para gerar retornos financeiros positivos. Esses resultados refletem estratégias de gestão sólidas, otimização de processos operacionais e modelos de negócios ajustados à demanda do mercado. O destaque do setor energético e do saneamento reforça o impacto de serviços essenciais com forte capacidade de geração de receitas, mesmo em um cenário econômico desafiador.
 
@@ -906,194 +618,194 @@ SAB - Sociedade de Abastecimento de Brasília
 
 """)	
 
-# Filtrar o dataframe para incluir apenas o Estado DF e Ano 2023
-df_filteorange = df[(df["Estado"] == "DF") & (df["Ano"] == 2023)].copy()
+    # Filtrar o dataframe para incluir apenas o Estado DF e Ano 2023
+    df_filteorange = fatia(estado="DF", ano=2023).copy()
 
-# Remover linhas com valores NaN nas colunas necessárias e PL negativo
-df_filteorange = df_filteorange.dropna(subset=["lucros", "PL"])
-df_filteorange = df_filteorange[df_filteorange["PL"] > 0]  # Remover empresas com PL negativo ou zero
+    # Manter apenas empresas com rentabilidade definida (lucros e PL positivo;
+    # ver estatais.metricas)
+    df_filteorange = df_filteorange.dropna(subset=["rentabilidade"])
+    df_filteorange["Rentabilidade (%)"] = df_filteorange["rentabilidade"]
 
-# Calcular Rentabilidade (%)
-df_filteorange["Rentabilidade (%)"] = (df_filteorange["lucros"] / df_filteorange["PL"]) * 100
+    # Adicionar uma coluna para indicar se é lucro ou prejuízo
+    df_filteorange["Status"] = status_rentabilidade(df_filteorange["Rentabilidade (%)"])
 
-# Adicionar uma coluna para indicar se é lucro ou prejuízo
-df_filteorange["Status"] = df_filteorange["Rentabilidade (%)"].apply(
-    lambda x: "Rentabilidade Positiva" if x >= 0 else "Rentabilidade Negativa"
-)
+    # Ordenar o dataframe pela rentabilidade
+    df_filteorange.sort_values(by="Rentabilidade (%)", ascending=True, inplace=True)
 
-# Ordenar o dataframe pela rentabilidade
-df_filteorange.sort_values(by="Rentabilidade (%)", ascending=True, inplace=True)
+    # Adicionar informação de dependência para o hover
+    df_filteorange["Dependência"] = rotulo_dependencia(df_filteorange["dep"])
 
-# Adicionar informação de dependência para o hover
-df_filteorange["Dependência"] = df_filteorange["dep"].apply(
-    lambda x: "Dependente" if str(x).upper() == "DEPENDENTE" else "Não Dependente"
-)
+    # Criação do gráfico de barras
+    fig = px.bar(
+        df_filteorange,
+        x="Rentabilidade (%)",
+        y="emp",
+        orientation="h",
+        color="Status",
+        color_discrete_map={
+            "Rentabilidade Positiva": "#007acc", 
+            "Rentabilidade Negativa": "#F45046"
+        },
+        hover_data={
+            "Rentabilidade (%)": ":.2f", 
+            "lucros": ":,.2f", 
+            "PL": ":,.2f",
+            "Dependência": True,
+            "Status": False
+        },
+        labels={
+            "emp": "Empresa", 
+            "Rentabilidade (%)": "Rentabilidade (%)",
+            "lucros": "Lucro/Prejuízo (R$)",
+            "PL": "Patrimônio Líquido (R$)"
+        },
+        title="Rentabilidade das Empresas Estatais do DF em 2023",
+        text="Rentabilidade (%)"  # Adicionar valor da rentabilidade em cada barra
+    )
 
-# Criação do gráfico de barras
-fig = px.bar(
-    df_filteorange,
-    x="Rentabilidade (%)",
-    y="emp",
-    orientation="h",
-    color="Status",
-    color_discrete_map={
-        "Rentabilidade Positiva": "#007acc", 
-        "Rentabilidade Negativa": "#F45046"
-    },
-    hover_data={
-        "Rentabilidade (%)": ":.2f", 
-        "lucros": ":,.2f", 
-        "PL": ":,.2f",
-        "Dependência": True,
-        "Status": False
-    },
-    labels={
-        "emp": "Empresa", 
-        "Rentabilidade (%)": "Rentabilidade (%)",
-        "lucros": "Lucro/Prejuízo (R$)",
-        "PL": "Patrimônio Líquido (R$)"
-    },
-    title="Rentabilidade das Empresas Estatais do DF em 2023",
-    text="Rentabilidade (%)"  # Adicionar valor da rentabilidade em cada barra
-)
+    # Personalizar o texto nas barras
+    fig.update_traces(
+        texttemplate="%{x:.1f}%",
+        textposition="outside",
+        textfont=dict(size=12, color="black"),
+        cliponaxis=False,  # Permitir que o texto seja exibido fora do eixo
+    )
 
-# Personalizar o texto nas barras
-fig.update_traces(
-    texttemplate="%{x:.1f}%",
-    textposition="outside",
-    textfont=dict(size=12, color="black"),
-    cliponaxis=False,  # Permitir que o texto seja exibido fora do eixo
-)
+    # Formatando o hovertemplate para exibir valores de forma mais amigável
+    fig.update_traces(
+        hovertemplate=(
+            "<b>%{y}</b><br>"
+            "Rentabilidade: %{x:.2f}%<br>"
+            "Lucro/Prejuízo: R$ %{customdata[0]:,.2f}<br>"
+            "Patrimônio Líquido: R$ %{customdata[1]:,.2f}<br>"
+            "Dependência: %{customdata[2]}<extra></extra>"
+        )
+    )
 
-# Formatando o hovertemplate para exibir valores de forma mais amigável
-fig.update_traces(
-    hovertemplate=(
-        "<b>%{y}</b><br>"
-        "Rentabilidade: %{x:.2f}%<br>"
-        "Lucro/Prejuízo: R$ %{customdata[0]:,.2f}<br>"
-        "Patrimônio Líquido: R$ %{customdata[1]:,.2f}<br>"
-        "Dependência: %{customdata[2]}<extra></extra>"
+    # Linha de referência em 0%
+    fig.add_vline(
+        x=0, 
+        line_dash="dash", 
+        line_color="gray",
+        annotation_text="Linha de Rentabilidade Zero",
+        annotation_position="top"
     )
-)
 
-# Linha de referência em 0%
-fig.add_vline(
-    x=0, 
-    line_dash="dash", 
-    line_color="gray",
-    annotation_text="Linha de Rentabilidade Zero",
-    annotation_position="top"
-)
+    # Melhorar o layout do gráfico
+    fig.update_layout(
+        height=650,  # Altura adaptativa com base no número de empresas
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        title={
+            "text": "<b>Rentabilidade das Empresas Estatais do DF em 2023</b>",
+            "y": 0.98,
+            "x": 0.5,
+            "xanchor": "center",
+            "yanchor": "top",
+            "font": {"size": 20, "color": "black"}
+        },
+        xaxis=dict(
+            title=dict(text="Rentabilidade (%)", font=dict(size=14, color="black")),
+            tickfont=dict(size=12, color="black"),
+            gridcolor="lightgray",
+            zerolinecolor="black",
+            zerolinewidth=1.5
+        ),
+        yaxis=dict(
+            title=dict(text="Empresa", font=dict(size=14, color="black")),
+            tickfont=dict(size=12, color="black"),
+            gridcolor="white"
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.15,
+            xanchor="center",
+            x=0.5,
+            font=dict(size=12, color="black"),
+            borderwidth=1,
+            bordercolor="lightgray"
+        ),
+        margin=dict(l=50, r=50, t=80, b=80)
+    )
 
-# Melhorar o layout do gráfico
-fig.update_layout(
-    height=650,  # Altura adaptativa com base no número de empresas
-    plot_bgcolor="white",
-    paper_bgcolor="white",
-    title={
-        "text": "<b>Rentabilidade das Empresas Estatais do DF em 2023</b>",
-        "y": 0.98,
-        "x": 0.5,
-        "xanchor": "center",
-        "yanchor": "top",
-        "font": {"size": 20, "color": "black"}
-    },
-    xaxis=dict(
-        title=dict(text="Rentabilidade (%)", font=dict(size=14, color="black")),
-        tickfont=dict(size=12, color="black"),
-        gridcolor="lightgray",
-        zerolinecolor="black",
-        zerolinewidth=1.5
-    ),
-    yaxis=dict(
-        title=dict(text="Empresa", font=dict(size=14, color="black")),
-        tickfont=dict(size=12, color="black"),
-        gridcolor="white"
-    ),
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=-0.15,
-        xanchor="center",
-        x=0.5,
-        font=dict(size=12, color="black"),
-        borderwidth=1,
-        bordercolor="lightgray"
-    ),
-    margin=dict(l=50, r=50, t=80, b=80)
-)
+    # Exibir o gráfico no Streamlit
+    st.plotly_chart(fig, width="stretch")
+
+    registrar(linhas=len(df_filteorange), figura=fig)
+
+    # Adicionar informações complementares
+    with st.expander("📊 Ver detalhes da rentabilidade"):
+        # Calcular estatísticas
+        media_rentabilidade = df_filteorange["Rentabilidade (%)"].mean()
+        rentabilidade_positiva = df_filteorange[df_filteorange["Rentabilidade (%)"] > 0]["Rentabilidade (%)"].mean()
+        rentabilidade_negativa = df_filteorange[df_filteorange["Rentabilidade (%)"] < 0]["Rentabilidade (%)"].mean()
+
+        # Exibir estatísticas
+        st.markdown("### Estatísticas de rentabilidade")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric(
+                "Média geral de rentabilidade", 
+                f"{media_rentabilidade:.2f}%",
+                delta=None
+            )
 
-# Exibir o gráfico no Streamlit
-st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            st.metric(
+                "Média das rentabilidades positivas", 
+                f"{rentabilidade_positiva:.2f}%",
+                delta="positivo", 
+                delta_color="normal"
+            )
 
-# Adicionar informações complementares
-with st.expander("📊 Ver detalhes da rentabilidade"):
-    # Calcular estatísticas
-    media_rentabilidade = df_filteorange["Rentabilidade (%)"].mean()
-    rentabilidade_positiva = df_filteorange[df_filteorange["Rentabilidade (%)"] > 0]["Rentabilidade (%)"].mean()
-    rentabilidade_negativa = df_filteorange[df_filteorange["Rentabilidade (%)"] < 0]["Rentabilidade (%)"].mean()
-    
-    # Exibir estatísticas
-    st.markdown("### Estatísticas de rentabilidade")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric(
-            "Média geral de rentabilidade", 
-            f"{media_rentabilidade:.2f}%",
-            delta=None
-        )
-    
-    with col2:
-        st.metric(
-            "Média das rentabilidades positivas", 
-            f"{rentabilidade_positiva:.2f}%",
-            delta="positivo", 
-            delta_color="normal"
-        )
-    
-    with col3:
-        st.metric(
-            "Média das rentabilidades negativas", 
-            f"{rentabilidade_negativa:.2f}%",
-            delta="negativo", 
-            delta_color="inverse"
-        )
-    
-    # Tabela detalhada
-    st.markdown("### Dados detalhados")
-    tabela = df_filteorange[["emp", "Rentabilidade (%)", "lucros", "PL", "Status", "Dependência"]].copy()
-    tabela.columns = ["Empresa", "Rentabilidade (%)", "Lucro/Prejuízo (R$)", "Patrimônio Líquido (R$)", "Status", "Dependência"]
-    
-    # Ordenar por rentabilidade (maior para menor)
-    tabela = tabela.sort_values(by="Rentabilidade (%)", ascending=False)
-    
-    # Exibir tabela formatada
-    st.dataframe(
-        tabela,
-        column_config={
-            "Rentabilidade (%)": st.column_config.NumberColumn(
-                "Rentabilidade (%)", 
-                format="%.2f%%"
-            ),
-            "Lucro/Prejuízo (R$)": st.column_config.NumberColumn(
-                "Lucro/Prejuízo (R$)",
-                format="R$ %.2f"
-            ),
-            "Patrimônio Líquido (R$)": st.column_config.NumberColumn(
-                "Patrimônio Líquido (R$)",
-                format="R$ %.2f"
+        with col3:
+            st.metric(
+                "Média das rentabilidades negativas", 
+                f"{rentabilidade_negativa:.2f}%",
+                delta="negativo", 
+                delta_color="inverse"
             )
-        },
-        hide_index=True,
-        use_container_width=True
-    )
 
+        # Tabela detalhada
+        st.markdown("### Dados detalhados")
+        tabela = df_filteorange[["emp", "Rentabilidade (%)", "lucros", "PL", "Status", "Dependência"]].copy()
+        tabela.columns = ["Empresa", "Rentabilidade (%)", "Lucro/Prejuízo (R$)", "Patrimônio Líquido (R$)", "Status", "Dependência"]
 
-st.subheader("Rentabilidade média das empresas por setor em 2023 (Lucro ou Prejuízo / Patrimônio Líquido)", divider="orange")
+        # Ordenar por rentabilidade (maior para menor)
+        tabela = tabela.sort_values(by="Rentabilidade (%)", ascending=False)
+
+        # Exibir tabela formatada
+        st.dataframe(
+            tabela,
+            column_config={
+                "Rentabilidade (%)": st.column_config.NumberColumn(
+                    "Rentabilidade (%)", 
+                    format="%.2f%%"
+                ),
+                "Lucro/Prejuízo (R$)": st.column_config.NumberColumn(
+                    "Lucro/Prejuízo (R$)",
+                    format="R$ %.2f"
+                ),
+                "Patrimônio Líquido (R$)": st.column_config.NumberColumn(
+                    "Patrimônio Líquido (R$)",
+                    format="R$ %.2f"
+                )
+            },
+            hide_index=True,
+            width="stretch"
+        )
 
-# Conteúdo específico desta página
-st.write("""
+
+# Seção: rentabilidade média por setor
+@st.fragment
+@medir("rentabilidade_setor")
+def secao_rentabilidade_setor():
+    st.subheader("Rentabilidade média das empresas por setor em 2023 (Lucro ou Prejuízo / Patrimônio Líquido)", divider="orange")
+
+    # Conteúdo específico desta página
+    st.write("""
 
 O gráfico abaixo, de rentabilidade média das empresas estatais do Distrito Federal em 2023, por setor, reflete a eficiência na utilização do patrimônio líquido para gerar resultados financeiros positivos ou negativos. Os setores de saneamento, energia e financeiro destacaram-se positivamente, apresentando os melhores índices de rentabilidade média. O setor de saneamento, liderado pela CAESB, alcançou o topo do ranking, evidenciando a robustez da gestão operacional e a relevância estratégica de serviços essenciais bem estruturados. Já os setores de energia e financeiro, com destaque para o grupo CEB e o BRB, respectivamente, demonstraram grande capacidade de geração de receita em contextos econômicos desafiadores, reforçando a maturidade na gestão dos ativos e a diversificação dos modelos de negócio.
 
@@ -1115,234 +827,250 @@ SAB - Sociedade de Abastecimento de Brasília
 
 """)	
 
-# Filtrar o dataframe para incluir apenas o Estado DF e Ano 2023
-df_filteorange = df[(df["Estado"] == "DF") & (df["Ano"] == 2023)].copy()
-
-# Remover linhas com valores NaN nas colunas necessárias e desconsiderar PL negativo
-df_filteorange = df_filteorange.dropna(subset=["lucros", "PL", "setor"])
-df_filteorange = df_filteorange[df_filteorange["PL"] > 0]  # Excluir empresas com PL negativo
-
-# Calcular Rentabilidade (%)
-df_filteorange["Rentabilidade (%)"] = (df_filteorange["lucros"] / df_filteorange["PL"]) * 100
-
-# Agrupar por setor e calcular a média de rentabilidade e compilar a lista de empresas
-df_grouped = (
-    df_filteorange.groupby("setor")
-    .agg(
-        Rentabilidade_medio=("Rentabilidade (%)", "mean"),
-        Lucros_total=("lucros", "sum"),
-        PL_total=("PL", "sum"),
-        empresas=("emp", lambda x: list(x)),
-        num_empresas=("emp", "count")
+    # Filtrar o dataframe para incluir apenas o Estado DF e Ano 2023
+    df_filteorange = fatia(estado="DF", ano=2023).copy()
+
+    # Manter apenas empresas com setor e rentabilidade definida (lucros e PL
+    # positivo; ver estatais.metricas)
+    df_filteorange = df_filteorange.dropna(subset=["rentabilidade", "setor"])
+    df_filteorange["Rentabilidade (%)"] = df_filteorange["rentabilidade"]
+
+    # Agrupar por setor e calcular a média de rentabilidade e compilar a lista de empresas
+    df_grouped = (
+        df_filteorange.groupby("setor", observed=True)
+        .agg(
+            Rentabilidade_medio=("Rentabilidade (%)", "mean"),
+            Lucros_total=(coluna_centavos("lucros"), "sum"),
+            PL_total=(coluna_centavos("PL"), "sum"),
+            empresas=("emp", lambda x: list(x)),
+            num_empresas=("emp", "count")
+        )
+        .reset_index()
     )
-    .reset_index()
-)
 
-# Adicionar uma coluna para status da rentabilidade
-df_grouped["Status"] = df_grouped["Rentabilidade_medio"].apply(
-    lambda x: "Rentabilidade Positiva" if x >= 0 else "Rentabilidade Negativa"
-)
+    # Totais somados em centavos, de volta para reais
+    df_grouped["Lucros_total"] = para_reais(df_grouped["Lucros_total"])
+    df_grouped["PL_total"] = para_reais(df_grouped["PL_total"])
 
-# Criar coluna com lista de empresas para exibição no hover
-df_grouped["empresas_list"] = df_grouped["empresas"].apply(lambda x: ", ".join(x))
-
-# Ordenar o dataframe pela rentabilidade média
-df_grouped.sort_values(by="Rentabilidade_medio", ascending=True, inplace=True)
-
-# Criação do gráfico de barras por setor
-fig = px.bar(
-    df_grouped,
-    x="Rentabilidade_medio",
-    y="setor",
-    orientation="h",
-    color="Status",
-    color_discrete_map={
-        "Rentabilidade Positiva": "#007acc", 
-        "Rentabilidade Negativa": "#F45046"
-    },
-    hover_data={
-        "Rentabilidade_medio": ":.2f",
-        "Lucros_total": ":,.2f",
-        "PL_total": ":,.2f",
-        "empresas_list": True,
-        "num_empresas": True,
-        "Status": False
-    },
-    labels={
-        "setor": "Setor",
-        "Rentabilidade_medio": "Rentabilidade Média (%)",
-        "Lucros_total": "Lucros Totais (R$)",
-        "PL_total": "Patrimônio Líquido Total (R$)",
-        "empresas_list": "Empresas",
-        "num_empresas": "Número de Empresas"
-    },
-    text="Rentabilidade_medio"  # Adicionar valor na barra
-)
+    # Adicionar uma coluna para status da rentabilidade
+    df_grouped["Status"] = status_rentabilidade(df_grouped["Rentabilidade_medio"])
 
-# Personalizar o texto nas barras
-fig.update_traces(
-    texttemplate="%{x:.1f}%",
-    textposition="outside",
-    textfont=dict(size=12, color="black"),
-    cliponaxis=False,  # Permitir que o texto seja exibido fora do eixo
-)
+    # Criar coluna com lista de empresas para exibição no hover
+    df_grouped["empresas_list"] = df_grouped["empresas"].apply(lambda x: ", ".join(x))
 
-# Formatando o hovertemplate para exibir valores de forma mais amigável
-fig.update_traces(
-    hovertemplate=(
-        "<b>%{y}</b><br>"
-        "Rentabilidade Média: %{x:.2f}%<br>"
-        "Lucros Totais: R$ %{customdata[0]:,.2f}<br>"
-        "Patrimônio Líquido Total: R$ %{customdata[1]:,.2f}<br>"
-        "Empresas (%{customdata[3]}): %{customdata[2]}<extra></extra>"
-    )
-)
-
-# Linha de referência em 0%
-fig.add_vline(
-    x=0, 
-    line_dash="dash", 
-    line_color="gray",
-    annotation_text="Rentabilidade Zero",
-    annotation_position="top"
-)
+    # Ordenar o dataframe pela rentabilidade média
+    df_grouped.sort_values(by="Rentabilidade_medio", ascending=True, inplace=True)
 
-# Melhorar o layout do gráfico
-fig.update_layout(
-    height=500,
-    plot_bgcolor="white",
-    paper_bgcolor="white",
-    title={
-        "text": "<b>Rentabilidade Média por Setor das Empresas Estatais do DF em 2023</b>",
-        "y": 0.98,
-        "x": 0.5,
-        "xanchor": "center",
-        "yanchor": "top",
-        "font": {"size": 20, "color": "black"}
-    },
-    xaxis=dict(
-        title=dict(
-            text="Rentabilidade Média (%)", 
-            font=dict(size=14, color="black"),
-            standoff=25  # Aumentar a distância entre o título do eixo e os números
-        ),
-        tickfont=dict(size=12, color="black"),
-        gridcolor="lightgray",
-        zerolinecolor="black",
-        zerolinewidth=1.5
-    ),
-    yaxis=dict(
-        title=dict(text="Setor", font=dict(size=14, color="black")),
-        tickfont=dict(size=12, color="black"),
-        gridcolor="white"
-    ),
-    legend=dict(
+    # Criação do gráfico de barras por setor
+    fig = px.bar(
+        df_grouped,
+        x="Rentabilidade_medio",
+        y="setor",
         orientation="h",
-        yanchor="bottom",
-        y=-0.30,  # Aumentar significativamente a distância da legenda
-        xanchor="center",
-        x=0.5,
-        font=dict(size=12, color="black"),
-        borderwidth=1,
-        bordercolor="lightgray",
-        bgcolor="rgba(255, 255, 255, 0.9)"  # Adicionar um fundo semi-transparente
-    ),
-    margin=dict(l=50, r=80, t=80, b=150)  # Aumentar significativamente a margem inferior
-)
+        color="Status",
+        color_discrete_map={
+            "Rentabilidade Positiva": "#007acc", 
+            "Rentabilidade Negativa": "#F45046"
+        },
+        hover_data={
+            "Rentabilidade_medio": ":.2f",
+            "Lucros_total": ":,.2f",
+            "PL_total": ":,.2f",
+            "empresas_list": True,
+            "num_empresas": True,
+            "Status": False
+        },
+        labels={
+            "setor": "Setor",
+            "Rentabilidade_medio": "Rentabilidade Média (%)",
+            "Lucros_total": "Lucros Totais (R$)",
+            "PL_total": "Patrimônio Líquido Total (R$)",
+            "empresas_list": "Empresas",
+            "num_empresas": "Número de Empresas"
+        },
+        text="Rentabilidade_medio"  # Adicionar valor na barra
+    )
 
-# Exibir o gráfico no Streamlit
-st.plotly_chart(fig, use_container_width=True)
+    # Personalizar o texto nas barras
+    fig.update_traces(
+        texttemplate="%{x:.1f}%",
+        textposition="outside",
+        textfont=dict(size=12, color="black"),
+        cliponaxis=False,  # Permitir que o texto seja exibido fora do eixo
+    )
 
-# Adicionar informações complementares
-with st.expander("📊 Ver detalhes da rentabilidade por setor"):
-    # Calcular estatísticas
-    setores_positivos = df_grouped[df_grouped["Rentabilidade_medio"] > 0]
-    setores_negativos = df_grouped[df_grouped["Rentabilidade_medio"] < 0]
-    
-    # Métricas gerais
-    st.markdown("### Estatísticas de rentabilidade por setor")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric(
-            "Total de setores analisados", 
-            f"{len(df_grouped)}",
-            delta=None
-        )
-    
-    with col2:
-        st.metric(
-            "Setores com rentabilidade positiva", 
-            f"{len(setores_positivos)}",
-            delta=f"{len(setores_positivos)/len(df_grouped)*100:.1f}%", 
-            delta_color="normal"
-        )
-    
-    with col3:
-        st.metric(
-            "Setores com rentabilidade negativa", 
-            f"{len(setores_negativos)}",
-            delta=f"{len(setores_negativos)/len(df_grouped)*100:.1f}%", 
-            delta_color="inverse"
+    # Formatando o hovertemplate para exibir valores de forma mais amigável
+    fig.update_traces(
+        hovertemplate=(
+            "<b>%{y}</b><br>"
+            "Rentabilidade Média: %{x:.2f}%<br>"
+            "Lucros Totais: R$ %{customdata[0]:,.2f}<br>"
+            "Patrimônio Líquido Total: R$ %{customdata[1]:,.2f}<br>"
+            "Empresas (%{customdata[3]}): %{customdata[2]}<extra></extra>"
         )
-    
-    # Tabela detalhada
-    st.markdown("### Detalhamento por setor")
-    
-    # Preparar dados para a tabela
-    tabela_setores = df_grouped.copy()
-    tabela_setores["Empresas"] = tabela_setores["empresas_list"]
-    tabela_setores = tabela_setores[["setor", "Rentabilidade_medio", "Lucros_total", "PL_total", "num_empresas", "Empresas"]]
-    tabela_setores.columns = ["Setor", "Rentabilidade Média (%)", "Lucros Totais (R$)", "Patrimônio Líquido Total (R$)", "Número de Empresas", "Empresas"]
-    
-    # Ordenar por rentabilidade (maior para menor)
-    tabela_setores = tabela_setores.sort_values(by="Rentabilidade Média (%)", ascending=False)
-    
-    # Exibir tabela formatada
-    st.dataframe(
-        tabela_setores,
-        column_config={
-            "Rentabilidade Média (%)": st.column_config.NumberColumn(
-                "Rentabilidade Média (%)", 
-                format="%.2f%%"
-            ),
-            "Lucros Totais (R$)": st.column_config.NumberColumn(
-                "Lucros Totais (R$)",
-                format="R$ %.2f"
-            ),
-            "Patrimônio Líquido Total (R$)": st.column_config.NumberColumn(
-                "Patrimônio Líquido Total (R$)",
-                format="R$ %.2f"
-            ),
-            "Número de Empresas": st.column_config.NumberColumn(
-                "Número de Empresas"
-            ),
-            "Empresas": st.column_config.TextColumn(
-                "Empresas", 
-                width="large"
-            )
+    )
+
+    # Linha de referência em 0%
+    fig.add_vline(
+        x=0, 
+        line_dash="dash", 
+        line_color="gray",
+        annotation_text="Rentabilidade Zero",
+        annotation_position="top"
+    )
+
+    # Melhorar o layout do gráfico
+    fig.update_layout(
+        height=500,
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        title={
+            "text": "<b>Rentabilidade Média por Setor das Empresas Estatais do DF em 2023</b>",
+            "y": 0.98,
+            "x": 0.5,
+            "xanchor": "center",
+            "yanchor": "top",
+            "font": {"size": 20, "color": "black"}
         },
-        hide_index=True,
-        use_container_width=True
+        xaxis=dict(
+            title=dict(
+                text="Rentabilidade Média (%)", 
+                font=dict(size=14, color="black"),
+                standoff=25  # Aumentar a distância entre o título do eixo e os números
+            ),
+            tickfont=dict(size=12, color="black"),
+            gridcolor="lightgray",
+            zerolinecolor="black",
+            zerolinewidth=1.5
+        ),
+        yaxis=dict(
+            title=dict(text="Setor", font=dict(size=14, color="black")),
+            tickfont=dict(size=12, color="black"),
+            gridcolor="white"
+        ),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.30,  # Aumentar significativamente a distância da legenda
+            xanchor="center",
+            x=0.5,
+            font=dict(size=12, color="black"),
+            borderwidth=1,
+            bordercolor="lightgray",
+            bgcolor="rgba(255, 255, 255, 0.9)"  # Adicionar um fundo semi-transparente
+        ),
+        margin=dict(l=50, r=80, t=80, b=150)  # Aumentar significativamente a margem inferior
     )
-    
-    # Mostrar informações adicionais sobre o setor mais e menos rentável
-    st.markdown("### Destaques")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        setor_mais_rentavel = tabela_setores.iloc[0]
-        st.success(f"**Setor mais rentável: {setor_mais_rentavel['Setor']}**")
-        st.write(f"Rentabilidade média: **{setor_mais_rentavel['Rentabilidade Média (%)']:.2f}%**")
-        st.write(f"Empresas: {setor_mais_rentavel['Empresas']}")
-    
-    with col2:
-        setor_menos_rentavel = tabela_setores.iloc[-1]
-        st.error(f"**Setor menos rentável: {setor_menos_rentavel['Setor']}**")
-        st.write(f"Rentabilidade média: **{setor_menos_rentavel['Rentabilidade Média (%)']:.2f}%**")
-        st.write(f"Empresas: {setor_menos_rentavel['Empresas']}")
 
+    # Exibir o gráfico no Streamlit
+    st.plotly_chart(fig, width="stretch")
+
+    registrar(linhas=len(df_filteorange), figura=fig)
+
+    # Adicionar informações complementares
+    with st.expander("📊 Ver detalhes da rentabilidade por setor"):
+        # Calcular estatísticas
+        setores_positivos = df_grouped[df_grouped["Rentabilidade_medio"] > 0]
+        setores_negativos = df_grouped[df_grouped["Rentabilidade_medio"] < 0]
+
+        # Métricas gerais
+        st.markdown("### Estatísticas de rentabilidade por setor")
+        col1, col2, col3 = st.columns(3)
+
+        with col1:
+            st.metric(
+                "Total de setores analisados", 
+                f"{len(df_grouped)}",
+                delta=None
+            )
+
+        with col2:
+            st.metric(
+                "Setores com rentabilidade positiva", 
+                f"{len(setores_positivos)}",
+                delta=f"{len(setores_positivos)/len(df_grouped)*100:.1f}%", 
+                delta_color="normal"
+            )
+
+        with col3:
+            st.metric(
+                "Setores com rentabilidade negativa", 
+                f"{len(setores_negativos)}",
+                delta=f"{len(setores_negativos)/len(df_grouped)*100:.1f}%", 
+                delta_color="inverse"
+            )
+
+        # Tabela detalhada
+        st.markdown("### Detalhamento por setor")
+
+        # Preparar dados para a tabela
+        tabela_setores = df_grouped.copy()
+        tabela_setores["Empresas"] = tabela_setores["empresas_list"]
+        tabela_setores = tabela_setores[["setor", "Rentabilidade_medio", "Lucros_total", "PL_total", "num_empresas", "Empresas"]]
+        tabela_setores.columns = ["Setor", "Rentabilidade Média (%)", "Lucros Totais (R$)", "Patrimônio Líquido Total (R$)", "Número de Empresas", "Empresas"]
+
+        # Ordenar por rentabilidade (maior para menor)
+        tabela_setores = tabela_setores.sort_values(by="Rentabilidade Média (%)", ascending=False)
+
+        # Exibir tabela formatada
+        st.dataframe(
+            tabela_setores,
+            column_config={
+                "Rentabilidade Média (%)": st.column_config.NumberColumn(
+                    "Rentabilidade Média (%)", 
+                    format="%.2f%%"
+                ),
+                "Lucros Totais (R$)": st.column_config.NumberColumn(
+                    "Lucros Totais (R$)",
+                    format="R$ %.2f"
+                ),
+                "Patrimônio Líquido Total (R$)": st.column_config.NumberColumn(
+                    "Patrimônio Líquido Total (R$)",
+                    format="R$ %.2f"
+                ),
+                "Número de Empresas": st.column_config.NumberColumn(
+                    "Número de Empresas"
+                ),
+                "Empresas": st.column_config.TextColumn(
+                    "Empresas", 
+                    width="large"
+                )
+            },
+            hide_index=True,
+            width="stretch"
+        )
+
+        # Mostrar informações adicionais sobre o setor mais e menos rentável
+        st.markdown("### Destaques")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            setor_mais_rentavel = tabela_setores.iloc[0]
+            st.success(f"**Setor mais rentável: {setor_mais_rentavel['Setor']}**")
+            st.write(f"Rentabilidade média: **{setor_mais_rentavel['Rentabilidade Média (%)']:.2f}%**")
+            st.write(f"Empresas: {setor_mais_rentavel['Empresas']}")
+
+        with col2:
+            setor_menos_rentavel = tabela_setores.iloc[-1]
+            st.error(f"**Setor menos rentável: {setor_menos_rentavel['Setor']}**")
+            st.write(f"Rentabilidade média: **{setor_menos_rentavel['Rentabilidade Média (%)']:.2f}%**")
+            st.write(f"Empresas: {setor_menos_rentavel['Empresas']}")
+
+
+# Cada seção em uma aba; só a aberta é calculada e desenhada
+exibir_secoes(
+    [
+        ("Distribuição anual", secao_distribuicao_anual),
+        ("Evolução", secao_evolucao),
+        ("Lucro × Patrimônio Líquido", secao_lucro_patrimonio),
+        ("Rentabilidade", secao_rentabilidade),
+        ("Rentabilidade por setor", secao_rentabilidade_setor),
+    ],
+    key="secao_resultado_estatais",
+)
 
+# Painel de desempenho (só com ?desempenho=1 na URL)
+exibir_painel()
 
 # Botão para voltar à página inicial
 if st.button("Voltar à Página Inicial"):
@@ -5,15 +5,33 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objs as go
 import base64
-import matplotlib.pyplot as plt
 import seaborn as sns
 import io
 
-# Caminho relativo ao arquivo CSV
-file_path = 'BD_Completo_Nacional_Formatado.csv'
+from estatais.classificacao import cor_por_sinal
+from estatais.cubo import carregar_cubo
+from estatais.desempenho import exibir_painel, medidor, registrar
+from estatais.empresas import carregar_empresas
+from estatais.figuras import (
+    botoes_download,
+    cache_figuras,
+    chave_figura,
+    barras_empilhadas,
+    imagem_matplotlib,
+    nova_figura,
+)
+from estatais.pares import COLUNAS_PARES_NUMERICAS, carregar_pares
+
+# Cubo de agregação (Estado × Ano × setor × dep × REGIAO) pré-calculado a
+# partir da base nacional: os filtros desta página consultam as células do
+# cubo em vez de percorrer as linhas da base
+cubo = carregar_cubo()
+
+# Figuras já renderizadas, compartilhadas entre sessões (LRU por filtros)
+figuras = cache_figuras()
 
-# Carregando o arquivo CSV no Pandas DataFrame
-df = pd.read_csv(file_path)
+# Tempo de cada seção desta página (ver estatais.desempenho)
+medir = medidor(__file__)
 
 # Configurações da página
 st.set_page_config(
@@ -126,88 +144,103 @@ De forma geral, o gráfico destaca a importância de estratégias diferenciadas
 
 """)	
 
-# Filtrar os estados para garantir que todos estão sendo incluídos
-df_filtrado = df[df["Estado"].notna()]
+@medir("empresas_por_setor")
+def secao_empresas_por_setor():
+    # Células do cubo com Estado informado
+    df_filtrado = cubo.celulas()
+    df_filtrado = df_filtrado[df_filtrado["Estado"].notna()]
 
-# Verificar se há dados disponíveis
-if len(df_filtrado) == 0:
-    st.warning("Não há dados disponíveis com informação de Estado.")
-else:
-    # Interface de seleção para filtrar os dados (opcional, pode ser removido se quiser manter exatamente como o original)
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Filtrar anos disponíveis
-        anos_disponíveis = sorted(df_filtrado["Ano"].unique())
-        anos_selecionados = st.multiselect(
-            "Selecione os anos:",
-            options=anos_disponíveis,
-            default=anos_disponíveis  # Selecionar todos por padrão
-        )
+    # Filtro geral (seleção vazia = sem filtro), usado também pelos demais gráficos
+    filtro_geral = {"Ano": None, "Estado": None}
+
+    # Verificar se há dados disponíveis
+    if len(df_filtrado) == 0:
+        st.warning("Não há dados disponíveis com informação de Estado.")
+    else:
+        # Interface de seleção para filtrar os dados (opcional, pode ser removido se quiser manter exatamente como o original)
+        col1, col2 = st.columns(2)
     
-    with col2:
-        # Filtrar estados disponíveis
-        estados_disponíveis = sorted(df_filtrado["Estado"].unique())
-        estados_selecionados = st.multiselect(
-            "Selecione os estados:",
-            options=estados_disponíveis,
-            default=estados_disponíveis  # Selecionar todos por padrão
-        )
+        with col1:
+            # Filtrar anos disponíveis
+            anos_disponíveis = sorted(df_filtrado["Ano"].unique())
+            anos_selecionados = st.multiselect(
+                "Selecione os anos:",
+                options=anos_disponíveis,
+                default=anos_disponíveis  # Selecionar todos por padrão
+            )
     
-    # Aplicar filtros se selecionados
-    if anos_selecionados:
-        df_filtrado = df_filtrado[df_filtrado["Ano"].isin(anos_selecionados)]
+        with col2:
+            # Filtrar estados disponíveis
+            estados_disponíveis = sorted(df_filtrado["Estado"].unique())
+            estados_selecionados = st.multiselect(
+                "Selecione os estados:",
+                options=estados_disponíveis,
+                default=estados_disponíveis  # Selecionar todos por padrão
+            )
     
-    if estados_selecionados:
-        df_filtrado = df_filtrado[df_filtrado["Estado"].isin(estados_selecionados)]
+        # Aplicar filtros se selecionados
+        filtro_geral = {
+            "Ano": anos_selecionados or None,
+            "Estado": estados_selecionados or None,
+        }
+        df_filtrado = cubo.celulas(**filtro_geral)
     
-    # Verificar novamente após filtros
-    if len(df_filtrado) == 0:
-        st.warning("Nenhum dado disponível com os filtros selecionados.")
-    else:
-        # Agrupar por estado, ano e setor para contar as empresas - exatamente como no original
-        agrupado = df_filtrado.groupby(["Estado", "Ano", "setor"]).size().unstack(fill_value=0)
-        
-        # Ajustar os índices para adicionar mais espaçamento (concatenando Estado e Ano)
-        x_labels = ["{}, {}".format(estado, ano) for estado, ano in agrupado.index]
-        x = np.arange(len(x_labels))
-        
-        # Criar figura matplotlib
-        fig, ax = plt.subplots(figsize=(18, 10))  # Aumentando o tamanho da figura
-        width = 0.9  # Largura das barras, para aumentar o espaçamento entre elas
-        
-        # Plotar gráfico de barras empilhadas - mesmo gráfico do original
-        agrupado.plot(kind="bar", stacked=True, ax=ax, width=width)
+        # Verificar novamente após filtros
+        if len(df_filtrado) == 0:
+            st.warning("Nenhum dado disponível com os filtros selecionados.")
+        else:
+            # Figura desenhada só quando falta no cache (tela ou download)
+            def desenhar_empresas_por_setor():
+                # Contar as empresas por estado, ano e setor a partir do cubo
+                agrupado = (
+                    cubo.fatiar(["Estado", "Ano", "setor"], [], **filtro_geral)["registros"]
+                    .unstack(fill_value=0)
+                )
         
-        # Ajustar os rótulos do eixo X para que haja mais espaçamento e garantir que fiquem visíveis
-        ax.set_xticks(x)
-        ax.set_xticklabels(
-            x_labels, rotation=90, ha="center", fontsize=8
-        )  # Rotacionando os rótulos
+                # Ajustar os índices para adicionar mais espaçamento (concatenando Estado e Ano)
+                x_labels = ["{}, {}".format(estado, ano) for estado, ano in agrupado.index]
+                x = np.arange(len(x_labels))
         
-        # Definir título e rótulos
-        plt.title("Total de Empresas Estatais por Estado, Ano e Setor", fontsize=16)
-        plt.xlabel("Estado, Ano", fontsize=14)
-        plt.ylabel("Número de Empresas", fontsize=14)
+                # Criar figura matplotlib (fora do pyplot, segura entre sessões)
+                fig = nova_figura(figsize=(18, 10))  # Aumentando o tamanho da figura
+                ax = fig.subplots()
+                width = 0.9  # Largura das barras, para aumentar o espaçamento entre elas
         
-        # Ajustar a posição da legenda e o layout para evitar sobreposição
-        plt.legend(title="Setor", bbox_to_anchor=(1.05, 1), loc="upper left")
-        plt.tight_layout()
+                # Plotar gráfico de barras empilhadas - mesmo gráfico do original
+                barras_empilhadas(ax, agrupado, largura=width)
         
-        # Exibir no Streamlit - aqui está a principal diferença da versão original
-        st.pyplot(fig)
+                # Ajustar os rótulos do eixo X para que haja mais espaçamento e garantir que fiquem visíveis
+                ax.set_xticks(x)
+                ax.set_xticklabels(
+                    x_labels, rotation=90, ha="center", fontsize=8
+                )  # Rotacionando os rótulos
         
-        # Adicionar opção para download do gráfico (funcionalidade extra)
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-        buffer.seek(0)
+                # Definir título e rótulos
+                ax.set_title("Total de Empresas Estatais por Estado, Ano e Setor", fontsize=16)
+                ax.set_xlabel("Estado, Ano", fontsize=14)
+                ax.set_ylabel("Número de Empresas", fontsize=14)
         
-        btn = st.download_button(
-            label="Baixar Gráfico",
-            data=buffer,
-            file_name="total_empresas_estatais_por_estado_ano_setor.png",
-            mime="image/png"
-        )
+                # Ajustar a posição da legenda e o layout para evitar sobreposição
+                ax.legend(title="Setor", bbox_to_anchor=(1.05, 1), loc="upper left")
+                fig.tight_layout()
+
+                return fig
+
+            chave = chave_figura("empresas_por_setor", **filtro_geral)
+
+            # Exibir no Streamlit
+            imagem = imagem_matplotlib(chave, desenhar_empresas_por_setor, cache=figuras)
+            st.image(imagem, width="stretch")
+
+            registrar(linhas=len(df_filtrado), figura=imagem)
+
+            # Adicionar opção para download do gráfico (funcionalidade extra)
+            botoes_download(chave, desenhar_empresas_por_setor, "total_empresas_estatais_por_estado_ano_setor")
+
+    return df_filtrado, filtro_geral
+
+
+df_filtrado, filtro_geral = secao_empresas_por_setor()
 
 st.subheader("Resultado Líquido das Empresas para o Estado Acionista por Estado e por ano", divider="orange")
 
@@ -224,264 +257,278 @@ O gráfico também evidencia períodos de deterioração financeira generalizada
 
 """)	
 
-# Filtrar os dados novamente para garantir que estamos usando os dados filtrados pelos seletores
-if len(df_filtrado) == 0:
-    st.warning("Não há dados disponíveis para gerar o gráfico de resultado líquido.")
-else:
-    # Interface de filtros específica para este gráfico
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Filtrar anos disponíveis
-        anos_resultado = sorted(df_filtrado["Ano"].unique())
-        anos_selecionados_resultado = st.multiselect(
-            "Filtrar por anos:",
-            options=anos_resultado,
-            default=anos_resultado,
-            key="anos_resultado"
-        )
-    
-    with col2:
-        # Filtrar estados disponíveis
-        estados_resultado = sorted(df_filtrado["Estado"].unique())
-        estados_selecionados_resultado = st.multiselect(
-            "Filtrar por estados:",
-            options=estados_resultado,
-            default=estados_resultado,  # Selecionar todos por padrão
-            key="estados_resultado"
-        )
+@medir("resultado_estado_ano")
+def secao_resultado_estado_ano(df_filtrado, filtro_geral):
+    # Filtrar os dados novamente para garantir que estamos usando os dados filtrados pelos seletores
+    if len(df_filtrado) == 0:
+        st.warning("Não há dados disponíveis para gerar o gráfico de resultado líquido.")
+    else:
+        # Interface de filtros específica para este gráfico
+        col1, col2 = st.columns(2)
     
-    # Aplicar filtros se selecionados
-    df_resultado = df_filtrado.copy()
+        with col1:
+            # Filtrar anos disponíveis
+            anos_resultado = sorted(df_filtrado["Ano"].unique())
+            anos_selecionados_resultado = st.multiselect(
+                "Filtrar por anos:",
+                options=anos_resultado,
+                default=anos_resultado,
+                key="anos_resultado"
+            )
     
-    if anos_selecionados_resultado:
-        df_resultado = df_resultado[df_resultado["Ano"].isin(anos_selecionados_resultado)]
+        with col2:
+            # Filtrar estados disponíveis
+            estados_resultado = sorted(df_filtrado["Estado"].unique())
+            estados_selecionados_resultado = st.multiselect(
+                "Filtrar por estados:",
+                options=estados_resultado,
+                default=estados_resultado,  # Selecionar todos por padrão
+                key="estados_resultado"
+            )
     
-    if estados_selecionados_resultado:
-        df_resultado = df_resultado[df_resultado["Estado"].isin(estados_selecionados_resultado)]
+        # Aplicar filtros se selecionados (seleção vazia mantém o filtro geral)
+        filtro_resultado = {
+            "Ano": anos_selecionados_resultado or filtro_geral["Ano"],
+            "Estado": estados_selecionados_resultado or filtro_geral["Estado"],
+        }
     
-    # Verificar novamente após filtros
-    if len(df_resultado) == 0:
-        st.warning("Nenhum dado disponível com os filtros selecionados para o gráfico de resultado líquido.")
-    else:
-        # Certifique-se de que os valores de 'Resultado para o Estado Acionista' sejam numéricos
-        df_resultado["Resultado para o Estado Acionista"] = pd.to_numeric(
-            df_resultado["Resultado para o Estado Acionista"], errors="coerce"
-        )
-        
-        # Agrupar por Estado e Ano para somar o Resultado Líquido para o Estado Acionista
-        agrupado_resultado = (
-            df_resultado.groupby(["Estado", "Ano"])["Resultado para o Estado Acionista"]
-            .sum()
-            .reset_index()
-        )
+        # Verificar novamente após filtros
+        celulas = cubo.celulas(**filtro_resultado)
+        if len(celulas) == 0:
+            st.warning("Nenhum dado disponível com os filtros selecionados para o gráfico de resultado líquido.")
+        else:
+            # Somar o Resultado Líquido para o Estado Acionista por Estado e Ano
+            agrupado_resultado = (
+                cubo.fatiar(["Estado", "Ano"], ["Resultado para o Estado Acionista"], **filtro_resultado)
+                [["Resultado para o Estado Acionista"]]
+                .reset_index()
+            )
         
-        # Criar coluna combinada de Estado e Ano para o eixo X
-        agrupado_resultado["Estado_Ano"] = agrupado_resultado["Estado"] + ", " + agrupado_resultado["Ano"].astype(str)
+            # Criar coluna combinada de Estado e Ano para o eixo X
+            agrupado_resultado["Estado_Ano"] = agrupado_resultado["Estado"].astype(str) + ", " + agrupado_resultado["Ano"].astype(str)
         
-        # Ordenar por Estado e Ano para melhor visualização
-        agrupado_resultado = agrupado_resultado.sort_values(by=["Estado", "Ano"])
+            # Ordenar por Estado e Ano para melhor visualização
+            agrupado_resultado = agrupado_resultado.sort_values(by=["Estado", "Ano"])
         
-        # Determinar as cores com base se o valor é positivo ou negativo
-        agrupado_resultado["color"] = agrupado_resultado[
-            "Resultado para o Estado Acionista"
-        ].apply(lambda x: "#007acc" if x > 0 else "#F46045")
+            # Determinar as cores com base se o valor é positivo ou negativo
+            agrupado_resultado["color"] = cor_por_sinal(
+                agrupado_resultado["Resultado para o Estado Acionista"]
+            )
         
-        # Escolha entre gráfico de barras ou gráfico de linha
-        tipo_grafico = st.radio(
-            "Escolha o tipo de visualização:",
-            options=["Barras", "Linhas por Estado"],
-            horizontal=True,
-            key="tipo_grafico_resultado"
-        )
+            # Escolha entre gráfico de barras ou gráfico de linha
+            tipo_grafico = st.radio(
+                "Escolha o tipo de visualização:",
+                options=["Barras", "Linhas por Estado"],
+                horizontal=True,
+                key="tipo_grafico_resultado"
+            )
         
-        # Modificação para gráfico de barras
-
-        if tipo_grafico == "Barras":
-            # Criar gráfico de barras interativo com Plotly
-            fig = go.Figure()
-            
-            # Adicionar barras ao gráfico
-            for i, row in agrupado_resultado.iterrows():
-                fig.add_trace(
-                    go.Bar(
-                        x=[row["Estado_Ano"]],
-                        y=[row["Resultado para o Estado Acionista"]],
-                        name=row["Estado_Ano"],
-                        hoverinfo="text",
-                        textposition="none",
-                        hovertext=f"<b>Estado:</b> {row['Estado']}<br><b>Ano:</b> {row['Ano']}<br><b>Resultado:</b> R$ {row['Resultado para o Estado Acionista']:,.2f}",
-                        marker_color=row["color"],
+            # Gráfico guardado no cache de figuras pelos filtros e pelo tipo escolhido
+            def desenhar_resultado():
+                if tipo_grafico == "Barras":
+                    # Criar gráfico de barras interativo com Plotly: um único trace
+                    # com uma cor por barra e hover montado no navegador a partir
+                    # de customdata, em vez de um trace por Estado/Ano
+                    fig = go.Figure(
+                        go.Bar(
+                            x=agrupado_resultado["Estado_Ano"],
+                            y=agrupado_resultado["Resultado para o Estado Acionista"],
+                            customdata=agrupado_resultado[["Estado", "Ano"]],
+                            hovertemplate=(
+                                "<b>Estado:</b> %{customdata[0]}<br>"
+                                "<b>Ano:</b> %{customdata[1]}<br>"
+                                "<b>Resultado:</b> R$ %{y:,.2f}<extra></extra>"
+                            ),
+                            textposition="none",
+                            marker_color=agrupado_resultado["color"],
+                        )
                     )
-                )
             
-            # Adicionar linha de referência no zero
-            fig.add_shape(
-                type="line",
-                x0=0,
-                y0=0,
-                x1=1,
-                y1=0,
-                line=dict(color="gray", width=1, dash="dash"),
-                xref="paper",
-                yref="y"
-            )
-            
-            # Atualizar layout do gráfico
-            fig.update_layout(
-                title="Resultado Líquido das Empresas para o Estado Acionista",
-                xaxis_title="Estado, Ano",
-                yaxis_title="Resultado Líquido (R$)",
-                yaxis=dict(
-                    gridcolor="lightgray",
-                    title=dict(font=dict(color="black", size=14)),  # Cor preta para título do eixo Y
-                    tickfont=dict(color="black", size=12),  # Cor preta para valores do eixo Y
-                ),
-                xaxis=dict(
-                    tickangle=-90,
-                    tickfont=dict(size=10, color="black"),  # Cor preta para valores do eixo X
-                    title=dict(font=dict(color="black", size=14)),  # Cor preta para título do eixo X
-                ),
-                showlegend=False,
-                template="plotly_white",
-                height=600,
-                margin=dict(l=40, r=40, t=60, b=150),
-                plot_bgcolor="white",
-                paper_bgcolor="white",
-                title_font=dict(color="black"),  # Cor preta para título principal
-            )
+                    # Adicionar linha de referência no zero
+                    fig.add_shape(
+                        type="line",
+                        x0=0,
+                        y0=0,
+                        x1=1,
+                        y1=0,
+                        line=dict(color="gray", width=1, dash="dash"),
+                        xref="paper",
+                        yref="y"
+                    )
             
-            # Mostrar o gráfico
-            st.plotly_chart(fig, use_container_width=True)
-
-        else:  # Gráfico de linhas por Estado
-            # Criar gráfico de linhas com Plotly Express
-            fig = px.line(
-                agrupado_resultado,
-                x="Ano",
-                y="Resultado para o Estado Acionista",
-                color="Estado",
-                markers=True,
-                labels={
-                    "Resultado para o Estado Acionista": "Resultado Líquido (R$)",
-                    "Ano": "Ano",
-                    "Estado": "Estado"
-                },
-                title="Evolução do Resultado Líquido por Estado ao Longo dos Anos",
-                color_discrete_sequence=px.colors.qualitative.Bold
-            )
+                    # Atualizar layout do gráfico
+                    fig.update_layout(
+                        title="Resultado Líquido das Empresas para o Estado Acionista",
+                        xaxis_title="Estado, Ano",
+                        yaxis_title="Resultado Líquido (R$)",
+                        yaxis=dict(
+                            gridcolor="lightgray",
+                            title=dict(font=dict(color="black", size=14)),  # Cor preta para título do eixo Y
+                            tickfont=dict(color="black", size=12),  # Cor preta para valores do eixo Y
+                        ),
+                        xaxis=dict(
+                            tickangle=-90,
+                            tickfont=dict(size=10, color="black"),  # Cor preta para valores do eixo X
+                            title=dict(font=dict(color="black", size=14)),  # Cor preta para título do eixo X
+                        ),
+                        showlegend=False,
+                        template="plotly_white",
+                        height=600,
+                        margin=dict(l=40, r=40, t=60, b=150),
+                        plot_bgcolor="white",
+                        paper_bgcolor="white",
+                        title_font=dict(color="black"),  # Cor preta para título principal
+                    )
+
+                else:  # Gráfico de linhas por Estado
+                    # Criar gráfico de linhas com Plotly Express
+                    fig = px.line(
+                        agrupado_resultado,
+                        x="Ano",
+                        y="Resultado para o Estado Acionista",
+                        color="Estado",
+                        markers=True,
+                        labels={
+                            "Resultado para o Estado Acionista": "Resultado Líquido (R$)",
+                            "Ano": "Ano",
+                            "Estado": "Estado"
+                        },
+                        title="Evolução do Resultado Líquido por Estado ao Longo dos Anos",
+                        color_discrete_sequence=px.colors.qualitative.Bold
+                    )
             
-            # Adicionar linha de referência no zero
-            fig.add_hline(
-                y=0,
-                line_dash="dash",
-                line_color="gray",
-                annotation_text="Equilíbrio",
-                annotation_position="right"
-            )
+                    # Adicionar linha de referência no zero
+                    fig.add_hline(
+                        y=0,
+                        line_dash="dash",
+                        line_color="gray",
+                        annotation_text="Equilíbrio",
+                        annotation_position="right"
+                    )
             
-            # Atualizar formatação do hover
-            fig.update_traces(
-                hovertemplate="<b>%{customdata[0]}</b><br>Ano: %{x}<br>Resultado: R$ %{y:,.2f}<extra></extra>",
-                customdata=agrupado_resultado[["Estado"]],
-            )
+                    # Atualizar formatação do hover
+                    fig.update_traces(
+                        hovertemplate="<b>%{customdata[0]}</b><br>Ano: %{x}<br>Resultado: R$ %{y:,.2f}<extra></extra>",
+                        customdata=agrupado_resultado[["Estado"]],
+                    )
             
-            # Atualizar layout do gráfico
-            fig.update_layout(
-                xaxis_title="Ano",
-                yaxis_title="Resultado Líquido (R$)",
-                legend_title="Estado",
-                template="plotly_white",
-                height=500,
-                margin=dict(l=40, r=40, t=60, b=40),
-                legend=dict(
-                    orientation="h",
-                    yanchor="bottom",
-                    y=-0.3,
-                    xanchor="center",
-                    x=0.5,
-                    font=dict(color="black", size=12)  # Cor preta para legenda
-                ),
-                xaxis=dict(
-                    title=dict(font=dict(color="black", size=14)),  # Cor preta para título do eixo X
-                    tickfont=dict(color="black", size=12),  # Cor preta para valores do eixo X
-                    gridcolor="lightgray"
-                ),
-                yaxis=dict(
-                    title=dict(font=dict(color="black", size=14)),  # Cor preta para título do eixo Y
-                    tickfont=dict(color="black", size=12),  # Cor preta para valores do eixo Y
-                    gridcolor="lightgray"
-                ),
-                plot_bgcolor="white",
-                paper_bgcolor="white",
-                title_font=dict(color="black")  # Cor preta para título principal
+                    # Atualizar layout do gráfico
+                    fig.update_layout(
+                        xaxis_title="Ano",
+                        yaxis_title="Resultado Líquido (R$)",
+                        legend_title="Estado",
+                        template="plotly_white",
+                        height=500,
+                        margin=dict(l=40, r=40, t=60, b=40),
+                        legend=dict(
+                            orientation="h",
+                            yanchor="bottom",
+                            y=-0.3,
+                            xanchor="center",
+                            x=0.5,
+                            font=dict(color="black", size=12)  # Cor preta para legenda
+                        ),
+                        xaxis=dict(
+                            title=dict(font=dict(color="black", size=14)),  # Cor preta para título do eixo X
+                            tickfont=dict(color="black", size=12),  # Cor preta para valores do eixo X
+                            gridcolor="lightgray"
+                        ),
+                        yaxis=dict(
+                            title=dict(font=dict(color="black", size=14)),  # Cor preta para título do eixo Y
+                            tickfont=dict(color="black", size=12),  # Cor preta para valores do eixo Y
+                            gridcolor="lightgray"
+                        ),
+                        plot_bgcolor="white",
+                        paper_bgcolor="white",
+                        title_font=dict(color="black")  # Cor preta para título principal
+                    )
+
+                return fig
+
+            fig = figuras.obter(
+                chave_figura("resultado_estado_ano", visualizacao=tipo_grafico, **filtro_resultado),
+                desenhar_resultado,
             )
-            
+
             # Mostrar o gráfico
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(fig, width="stretch")
+
+            registrar(linhas=len(celulas), figura=fig)
         
-        # Adicionar seção expandível com detalhes
-        with st.expander("📊 Ver detalhes do resultado líquido"):
-            # Preparar dados para exibição
-            tabela = agrupado_resultado[["Estado", "Ano", "Resultado para o Estado Acionista"]].copy()
-            tabela = tabela.sort_values(by=["Estado", "Ano"])
+            # Adicionar seção expandível com detalhes
+            with st.expander("📊 Ver detalhes do resultado líquido"):
+                # Preparar dados para exibição
+                tabela = agrupado_resultado[["Estado", "Ano", "Resultado para o Estado Acionista"]].copy()
+                tabela = tabela.sort_values(by=["Estado", "Ano"])
             
-            # Mostrar tabela formatada
-            st.dataframe(
-                tabela,
-                column_config={
-                    "Resultado para o Estado Acionista": st.column_config.NumberColumn(
-                        "Resultado Líquido (R$)",
-                        format="R$ %.2f"
-                    )
-                },
-                hide_index=True,
-                use_container_width=True
-            )
+                # Mostrar tabela formatada
+                st.dataframe(
+                    tabela,
+                    column_config={
+                        "Resultado para o Estado Acionista": st.column_config.NumberColumn(
+                            "Resultado Líquido (R$)",
+                            format="R$ %.2f"
+                        )
+                    },
+                    hide_index=True,
+                    width="stretch"
+                )
             
-            # Análise adicional
-            col1, col2 = st.columns(2)
+                # Análise adicional
+                col1, col2 = st.columns(2)
             
-            with col1:
-                # Estado com melhor resultado
-                melhor_estado = agrupado_resultado.loc[agrupado_resultado["Resultado para o Estado Acionista"].idxmax()]
-                st.success(f"**Maior resultado positivo**")
-                st.write(f"**Estado**: {melhor_estado['Estado']}")
-                st.write(f"**Ano**: {melhor_estado['Ano']}")
-                st.write(f"**Valor**: R$ {melhor_estado['Resultado para o Estado Acionista']:,.2f}")
+                with col1:
+                    # Estado com melhor resultado
+                    melhor_estado = agrupado_resultado.loc[agrupado_resultado["Resultado para o Estado Acionista"].idxmax()]
+                    st.success(f"**Maior resultado positivo**")
+                    st.write(f"**Estado**: {melhor_estado['Estado']}")
+                    st.write(f"**Ano**: {melhor_estado['Ano']}")
+                    st.write(f"**Valor**: R$ {melhor_estado['Resultado para o Estado Acionista']:,.2f}")
             
-            with col2:
-                # Estado com pior resultado
-                pior_estado = agrupado_resultado.loc[agrupado_resultado["Resultado para o Estado Acionista"].idxmin()]
-                st.error(f"**Maior resultado negativo**")
-                st.write(f"**Estado**: {pior_estado['Estado']}")
-                st.write(f"**Ano**: {pior_estado['Ano']}")
-                st.write(f"**Valor**: R$ {pior_estado['Resultado para o Estado Acionista']:,.2f}")
+                with col2:
+                    # Estado com pior resultado
+                    pior_estado = agrupado_resultado.loc[agrupado_resultado["Resultado para o Estado Acionista"].idxmin()]
+                    st.error(f"**Maior resultado negativo**")
+                    st.write(f"**Estado**: {pior_estado['Estado']}")
+                    st.write(f"**Ano**: {pior_estado['Ano']}")
+                    st.write(f"**Valor**: R$ {pior_estado['Resultado para o Estado Acionista']:,.2f}")
             
-            # Estatísticas adicionais
-            st.markdown("### Estatísticas por Estado")
+                # Estatísticas adicionais
+                st.markdown("### Estatísticas por Estado")
             
-            # Agrupar por estado para análise
-            por_estado = agrupado_resultado.groupby("Estado")["Resultado para o Estado Acionista"].agg(
-                ["sum", "mean", "min", "max", "count"]
-            ).reset_index()
-            por_estado.columns = ["Estado", "Total", "Média", "Mínimo", "Máximo", "Anos com Dados"]
+                # Agrupar por estado para análise; o total vem do cubo, somado em centavos
+                por_ano = agrupado_resultado.groupby("Estado", observed=True)["Resultado para o Estado Acionista"]
+                por_estado = pd.DataFrame({
+                    "Total": cubo.fatiar("Estado", ["Resultado para o Estado Acionista"], **filtro_resultado)[
+                        "Resultado para o Estado Acionista"
+                    ],
+                    "Mínimo": por_ano.min(),
+                    "Máximo": por_ano.max(),
+                    "Anos com Dados": por_ano.count(),
+                })
+                por_estado["Média"] = por_estado["Total"] / por_estado["Anos com Dados"].where(por_estado["Anos com Dados"] > 0)
+                por_estado = por_estado.rename_axis("Estado").reset_index()[
+                    ["Estado", "Total", "Média", "Mínimo", "Máximo", "Anos com Dados"]
+                ]
             
-            # Ordenar por total
-            por_estado = por_estado.sort_values(by="Total", ascending=False)
+                # Ordenar por total
+                por_estado = por_estado.sort_values(by="Total", ascending=False)
             
-            # Mostrar tabela formatada
-            st.dataframe(
-                por_estado,
-                column_config={
-                    "Total": st.column_config.NumberColumn("Total (R$)", format="R$ %.2f"),
-                    "Média": st.column_config.NumberColumn("Média Anual (R$)", format="R$ %.2f"),
-                    "Mínimo": st.column_config.NumberColumn("Mínimo (R$)", format="R$ %.2f"),
-                    "Máximo": st.column_config.NumberColumn("Máximo (R$)", format="R$ %.2f"),
-                },
-                hide_index=True,
-                use_container_width=True
-            )
+                # Mostrar tabela formatada
+                st.dataframe(
+                    por_estado,
+                    column_config={
+                        "Total": st.column_config.NumberColumn("Total (R$)", format="R$ %.2f"),
+                        "Média": st.column_config.NumberColumn("Média Anual (R$)", format="R$ %.2f"),
+                        "Mínimo": st.column_config.NumberColumn("Mínimo (R$)", format="R$ %.2f"),
+                        "Máximo": st.column_config.NumberColumn("Máximo (R$)", format="R$ %.2f"),
+                    },
+                    hide_index=True,
+                    width="stretch"
+                )
+
+
+secao_resultado_estado_ano(df_filtrado, filtro_geral)
 
 
 
@@ -503,157 +550,156 @@ Por fim, a análise segmentada por setor ao longo dos anos destaca a importânci
 
 """)	
 
-# Filtrar os dados para este gráfico
-if len(df_filtrado) == 0:
-    st.warning("Não há dados disponíveis para gerar o gráfico de resultado líquido por setor.")
-else:
-    # Interface de filtros específica para este gráfico
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Filtrar anos disponíveis
-        anos_resultado_setor = sorted(df_filtrado["Ano"].unique())
-        anos_selecionados_resultado_setor = st.multiselect(
-            "Filtrar por anos:",
-            options=anos_resultado_setor,
-            default=anos_resultado_setor,
-            key="anos_resultado_setor"
-        )
-    
-    with col2:
-        # Filtrar estados disponíveis - todos selecionados por padrão
-        estados_resultado_setor = sorted(df_filtrado["Estado"].unique())
-        estados_selecionados_resultado_setor = st.multiselect(
-            "Filtrar por estados:",
-            options=estados_resultado_setor,
-            default=estados_resultado_setor,  # Todos os estados selecionados por padrão
-            key="estados_resultado_setor"
-        )
+@medir("resultado_setor")
+def secao_resultado_setor(df_filtrado, filtro_geral):
+    # Filtrar os dados para este gráfico
+    if len(df_filtrado) == 0:
+        st.warning("Não há dados disponíveis para gerar o gráfico de resultado líquido por setor.")
+    else:
+        # Interface de filtros específica para este gráfico
+        col1, col2 = st.columns(2)
     
-    # Aplicar filtros se selecionados
-    df_resultado_setor = df_filtrado.copy()
+        with col1:
+            # Filtrar anos disponíveis
+            anos_resultado_setor = sorted(df_filtrado["Ano"].unique())
+            anos_selecionados_resultado_setor = st.multiselect(
+                "Filtrar por anos:",
+                options=anos_resultado_setor,
+                default=anos_resultado_setor,
+                key="anos_resultado_setor"
+            )
     
-    if anos_selecionados_resultado_setor:
-        df_resultado_setor = df_resultado_setor[df_resultado_setor["Ano"].isin(anos_selecionados_resultado_setor)]
+        with col2:
+            # Filtrar estados disponíveis - todos selecionados por padrão
+            estados_resultado_setor = sorted(df_filtrado["Estado"].unique())
+            estados_selecionados_resultado_setor = st.multiselect(
+                "Filtrar por estados:",
+                options=estados_resultado_setor,
+                default=estados_resultado_setor,  # Todos os estados selecionados por padrão
+                key="estados_resultado_setor"
+            )
     
-    if estados_selecionados_resultado_setor:
-        df_resultado_setor = df_resultado_setor[df_resultado_setor["Estado"].isin(estados_selecionados_resultado_setor)]
+        # Aplicar filtros se selecionados (seleção vazia mantém o filtro geral)
+        filtro_resultado_setor = {
+            "Ano": anos_selecionados_resultado_setor or filtro_geral["Ano"],
+            "Estado": estados_selecionados_resultado_setor or filtro_geral["Estado"],
+        }
     
-    # Verificar novamente após filtros
-    if len(df_resultado_setor) == 0:
-        st.warning("Nenhum dado disponível com os filtros selecionados para o gráfico de resultado líquido por setor.")
-    else:
-        # Verificar se a coluna 'setor' existe
-        if 'setor' not in df_resultado_setor.columns:
-            st.error("A coluna 'setor' não foi encontrada nos dados. Não é possível gerar o gráfico.")
+        # Verificar novamente após filtros
+        celulas = cubo.celulas(**filtro_resultado_setor)
+        if len(celulas) == 0:
+            st.warning("Nenhum dado disponível com os filtros selecionados para o gráfico de resultado líquido por setor.")
         else:
-            # Certifique-se de que os valores sejam numéricos
-            df_resultado_setor["Resultado para o Estado Acionista"] = pd.to_numeric(
-                df_resultado_setor["Resultado para o Estado Acionista"], errors="coerce"
-            )
-            
-            # Agrupar por Estado, Ano e Setor para somar o Resultado Líquido
-            agrupado_resultado = (
-                df_resultado_setor.groupby(["Estado", "Ano", "setor"])["Resultado para o Estado Acionista"]
-                .sum()
-                .unstack(fill_value=0)
-            )
-            
-            # Preparando os dados para o matplotlib
-            fig, ax = plt.subplots(figsize=(18, 10))
-            width = 0.9  # Largura das barras para maior espaçamento
-            
-            # Plotar gráfico de barras empilhadas
-            agrupado_resultado.plot(kind="bar", stacked=True, ax=ax, width=width)
-            
-            # Ajustar os índices e rótulos
-            x_labels = ["{}, {}".format(estado, ano) for estado, ano in agrupado_resultado.index]
-            x = np.arange(len(x_labels))
-            
-            # Configurar os rótulos do eixo X
-            ax.set_xticks(x)
-            ax.set_xticklabels(x_labels, rotation=90, ha="center", fontsize=8)
+            # Verificar se a coluna 'setor' existe
+            if 'setor' not in cubo.dimensoes:
+                st.error("A coluna 'setor' não foi encontrada nos dados. Não é possível gerar o gráfico.")
+            else:
+                # Figura desenhada só quando falta no cache (tela ou download)
+                def desenhar_resultado_setor():
+                    # Somar o Resultado Líquido por Estado, Ano e Setor a partir do cubo
+                    agrupado_resultado = (
+                        cubo.fatiar(["Estado", "Ano", "setor"], ["Resultado para o Estado Acionista"], **filtro_resultado_setor)
+                        ["Resultado para o Estado Acionista"]
+                        .unstack(fill_value=0)
+                    )
             
-            # Adicionar linha no zero para facilitar visualização
-            ax.axhline(y=0, color='gray', linestyle='-', alpha=0.7, linewidth=0.8)
+                    # Preparando os dados para o matplotlib (figura fora do pyplot)
+                    fig = nova_figura(figsize=(18, 10))
+                    ax = fig.subplots()
+                    width = 0.9  # Largura das barras para maior espaçamento
             
-            # Ajustar limites do eixo Y para melhor visualização
-            min_value = agrupado_resultado.sum(axis=1).min()
-            max_value = agrupado_resultado.sum(axis=1).max()
-            y_range_min = min(min_value * 1.1, -500000000) if min_value < 0 else -500000000
-            y_range_max = max(max_value * 1.1, 500000000)
-            ax.set_ylim(bottom=y_range_min, top=y_range_max)
+                    # Plotar gráfico de barras empilhadas
+                    barras_empilhadas(ax, agrupado_resultado, largura=width)
             
-            # Definir título e rótulos
-            plt.title("Resultado Líquido das Empresas para o Estado Acionista por Estado, Ano e Setor", fontsize=16)
-            plt.xlabel("Estado, Ano", fontsize=14)
-            plt.ylabel("Resultado Líquido para o Estado (R$)", fontsize=14)
+                    # Ajustar os índices e rótulos
+                    x_labels = ["{}, {}".format(estado, ano) for estado, ano in agrupado_resultado.index]
+                    x = np.arange(len(x_labels))
             
-            # Ajustar a posição da legenda
-            plt.legend(title="Setor", bbox_to_anchor=(1.05, 1), loc="upper left")
+                    # Configurar os rótulos do eixo X
+                    ax.set_xticks(x)
+                    ax.set_xticklabels(x_labels, rotation=90, ha="center", fontsize=8)
             
-            # Ajustar o layout para evitar sobreposição
-            plt.tight_layout()
+                    # Adicionar linha no zero para facilitar visualização
+                    ax.axhline(y=0, color='gray', linestyle='-', alpha=0.7, linewidth=0.8)
             
-            # Exibir gráfico no Streamlit
-            st.pyplot(fig)
+                    # Ajustar limites do eixo Y para melhor visualização
+                    min_value = agrupado_resultado.sum(axis=1).min()
+                    max_value = agrupado_resultado.sum(axis=1).max()
+                    y_range_min = min(min_value * 1.1, -500000000) if min_value < 0 else -500000000
+                    y_range_max = max(max_value * 1.1, 500000000)
+                    ax.set_ylim(bottom=y_range_min, top=y_range_max)
             
-            # Adicionar botão para download
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-            buffer.seek(0)
+                    # Definir título e rótulos
+                    ax.set_title("Resultado Líquido das Empresas para o Estado Acionista por Estado, Ano e Setor", fontsize=16)
+                    ax.set_xlabel("Estado, Ano", fontsize=14)
+                    ax.set_ylabel("Resultado Líquido para o Estado (R$)", fontsize=14)
             
-            st.download_button(
-                label="Baixar Gráfico",
-                data=buffer,
-                file_name="resultado_liquido_por_setor.png",
-                mime="image/png"
-            )
+                    # Ajustar a posição da legenda
+                    ax.legend(title="Setor", bbox_to_anchor=(1.05, 1), loc="upper left")
             
-            # Adicionar seção de análise expandível
-            with st.expander("📊 Ver análise detalhada por setor"):
-                # Agrupar por setor para análise global
-                setor_analysis = df_resultado_setor.groupby("setor")["Resultado para o Estado Acionista"].agg(
-                    ["sum", "mean", "count"]
-                ).reset_index()
-                setor_analysis.columns = ["Setor", "Total", "Média", "Quantidade de Registros"]
+                    # Ajustar o layout para evitar sobreposição
+                    fig.tight_layout()
+
+                    return fig
+
+                chave = chave_figura("resultado_setor", **filtro_resultado_setor)
+
+                # Exibir gráfico no Streamlit
+                imagem = imagem_matplotlib(chave, desenhar_resultado_setor, cache=figuras)
+                st.image(imagem, width="stretch")
+
+                registrar(linhas=len(celulas), figura=imagem)
+
+                # Adicionar botão para download
+                botoes_download(chave, desenhar_resultado_setor, "resultado_liquido_por_setor")
+
+                # Adicionar seção de análise expandível
+                with st.expander("📊 Ver análise detalhada por setor"):
+                    # Agrupar por setor para análise global
+                    setor_analysis = cubo.resumir(
+                        "setor", "Resultado para o Estado Acionista", **filtro_resultado_setor
+                    ).reset_index()
+                    setor_analysis.columns = ["Setor", "Total", "Média", "Quantidade de Registros"]
                 
-                # Ordenar do mais positivo ao mais negativo
-                setor_analysis = setor_analysis.sort_values(by="Total", ascending=False)
+                    # Ordenar do mais positivo ao mais negativo
+                    setor_analysis = setor_analysis.sort_values(by="Total", ascending=False)
                 
-                # Mostrar tabela formatada
-                st.dataframe(
-                    setor_analysis,
-                    column_config={
-                        "Total": st.column_config.NumberColumn("Total (R$)", format="R$ %.2f"),
-                        "Média": st.column_config.NumberColumn("Média (R$)", format="R$ %.2f")
-                    },
-                    hide_index=True,
-                    use_container_width=True
-                )
+                    # Mostrar tabela formatada
+                    st.dataframe(
+                        setor_analysis,
+                        column_config={
+                            "Total": st.column_config.NumberColumn("Total (R$)", format="R$ %.2f"),
+                            "Média": st.column_config.NumberColumn("Média (R$)", format="R$ %.2f")
+                        },
+                        hide_index=True,
+                        width="stretch"
+                    )
                 
-                # Análise de melhores e piores setores
-                col1, col2 = st.columns(2)
+                    # Análise de melhores e piores setores
+                    col1, col2 = st.columns(2)
                 
-                with col1:
-                    st.markdown("### Setores com melhor desempenho")
-                    top_setores = setor_analysis.nlargest(3, "Total")
+                    with col1:
+                        st.markdown("### Setores com melhor desempenho")
+                        top_setores = setor_analysis.nlargest(3, "Total")
                     
-                    for i, row in enumerate(top_setores.itertuples(), 1):
-                        st.success(f"**{i}. {row.Setor}**")
-                        st.write(f"Total: **R$ {row.Total:,.2f}**")
-                        st.write(f"Média: R$ {row.Média:,.2f}")
-                        st.write("---")
+                        for i, row in enumerate(top_setores.itertuples(), 1):
+                            st.success(f"**{i}. {row.Setor}**")
+                            st.write(f"Total: **R$ {row.Total:,.2f}**")
+                            st.write(f"Média: R$ {row.Média:,.2f}")
+                            st.write("---")
                 
-                with col2:
-                    st.markdown("### Setores com pior desempenho")
-                    bottom_setores = setor_analysis.nsmallest(3, "Total")
+                    with col2:
+                        st.markdown("### Setores com pior desempenho")
+                        bottom_setores = setor_analysis.nsmallest(3, "Total")
                     
-                    for i, row in enumerate(bottom_setores.itertuples(), 1):
-                        st.error(f"**{i}. {row.Setor}**")
-                        st.write(f"Total: **R$ {row.Total:,.2f}**")
-                        st.write(f"Média: R$ {row.Média:,.2f}")
-                        st.write("---")
+                        for i, row in enumerate(bottom_setores.itertuples(), 1):
+                            st.error(f"**{i}. {row.Setor}**")
+                            st.write(f"Total: **R$ {row.Total:,.2f}**")
+                            st.write(f"Média: R$ {row.Média:,.2f}")
+                            st.write("---")
+
+
+secao_resultado_setor(df_filtrado, filtro_geral)
 
 
 
@@ -681,254 +727,385 @@ st.write("""
 O gráfico analisa o resultado líquido das empresas estatais por estado, ano e classificação de dependência (dependente, não dependente ou não informado), evidenciando as disparidades de desempenho financeiro das empresas em relação ao suporte recebido de seus respectivos estados acionistas. A segmentação entre empresas dependentes e não dependentes fornece uma visão clara sobre a influência da autonomia financeira na sustentabilidade das estatais.
 """)
 
-# Verificar se há dados disponíveis
-if len(df_filtrado) == 0:
-    st.warning("Não há dados disponíveis para gerar o gráfico de resultado por dependência.")
-else:
-    # Verificar se a coluna 'dep' existe no DataFrame
-    if 'dep' not in df_filtrado.columns:
-        st.error("A coluna 'dep' (dependência) não foi encontrada nos dados. Não é possível gerar o gráfico.")
+@medir("resultado_dependencia")
+def secao_resultado_dependencia(df_filtrado, filtro_geral):
+    # Verificar se há dados disponíveis
+    if len(df_filtrado) == 0:
+        st.warning("Não há dados disponíveis para gerar o gráfico de resultado por dependência.")
     else:
-        # Interface de filtros específica para este gráfico
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Filtrar anos disponíveis
-            anos_dep = sorted(df_filtrado["Ano"].unique())
-            anos_selecionados_dep = st.multiselect(
-                "Filtrar por anos:",
-                options=anos_dep,
-                default=anos_dep,
-                key="anos_dep"
-            )
-        
-        with col2:
-            # Filtrar estados disponíveis - todos selecionados por padrão
-            estados_dep = sorted(df_filtrado["Estado"].unique())
-            estados_selecionados_dep = st.multiselect(
-                "Filtrar por estados:",
-                options=estados_dep,
-                default=estados_dep,  # Todos os estados selecionados por padrão
-                key="estados_dep"
-            )
+        # Verificar se a coluna 'dep' existe no DataFrame
+        if 'dep' not in cubo.dimensoes:
+            st.error("A coluna 'dep' (dependência) não foi encontrada nos dados. Não é possível gerar o gráfico.")
+        else:
+            # Interface de filtros específica para este gráfico
+            col1, col2 = st.columns(2)
         
-        # Aplicar filtros se selecionados
-        df_resultado_dep = df_filtrado.copy()
+            with col1:
+                # Filtrar anos disponíveis
+                anos_dep = sorted(df_filtrado["Ano"].unique())
+                anos_selecionados_dep = st.multiselect(
+                    "Filtrar por anos:",
+                    options=anos_dep,
+                    default=anos_dep,
+                    key="anos_dep"
+                )
         
-        if anos_selecionados_dep:
-            df_resultado_dep = df_resultado_dep[df_resultado_dep["Ano"].isin(anos_selecionados_dep)]
+            with col2:
+                # Filtrar estados disponíveis - todos selecionados por padrão
+                estados_dep = sorted(df_filtrado["Estado"].unique())
+                estados_selecionados_dep = st.multiselect(
+                    "Filtrar por estados:",
+                    options=estados_dep,
+                    default=estados_dep,  # Todos os estados selecionados por padrão
+                    key="estados_dep"
+                )
         
-        if estados_selecionados_dep:
-            df_resultado_dep = df_resultado_dep[df_resultado_dep["Estado"].isin(estados_selecionados_dep)]
+            # Aplicar filtros se selecionados (seleção vazia mantém o filtro geral)
+            filtro_dep = {
+                "Ano": anos_selecionados_dep or filtro_geral["Ano"],
+                "Estado": estados_selecionados_dep or filtro_geral["Estado"],
+            }
         
-        # Verificar novamente após filtros
-        if len(df_resultado_dep) == 0:
-            st.warning("Nenhum dado disponível com os filtros selecionados para o gráfico de resultado por dependência.")
-        else:
-            # Certifique-se de que os valores sejam numéricos
-            df_resultado_dep["Resultado para o Estado Acionista"] = pd.to_numeric(
-                df_resultado_dep["Resultado para o Estado Acionista"], errors="coerce"
-            )
+            # Verificar novamente após filtros
+            celulas = cubo.celulas(**filtro_dep)
+            if len(celulas) == 0:
+                st.warning("Nenhum dado disponível com os filtros selecionados para o gráfico de resultado por dependência.")
+            else:
+                # Gráfico guardado no cache de figuras pelos filtros
+                def desenhar_resultado_dependencia():
+                    # Somar o Resultado Líquido por Estado, Ano e 'dep' a partir do cubo
+                    # (a base já traz 'dep' padronizada: Dependente, Não Dependente ou Não Informado)
+                    agrupado_resultado = (
+                        cubo.fatiar(["Estado", "Ano", "dep"], ["Resultado para o Estado Acionista"], **filtro_dep)
+                        [["Resultado para o Estado Acionista"]]
+                        .reset_index()
+                    )
             
-            # Padronizar valores na coluna 'dep' para garantir consistência
-            df_resultado_dep['dep'] = df_resultado_dep['dep'].fillna("Não Informado")
-            df_resultado_dep['dep'] = df_resultado_dep['dep'].replace({
-                'Dependente': 'Dependente',
-                'Não Dependente': 'Não Dependente',
-                'Não dependente': 'Não Dependente',
-                'não dependente': 'Não Dependente',
-                'dependente': 'Dependente'
-            })
+                    # Juntar Estado e Ano para usar como rótulo
+                    agrupado_resultado["label"] = (
+                        agrupado_resultado["Estado"].astype(str) + ", " + agrupado_resultado["Ano"].astype(str)
+                    )
             
-            # Agrupar por Estado, Ano e 'dep' para somar o Resultado Líquido para o Estado Acionista
-            agrupado_resultado = (
-                df_resultado_dep.groupby(["Estado", "Ano", "dep"])["Resultado para o Estado Acionista"]
-                .sum()
-                .reset_index()
-            )
+                    # Ordenar o DataFrame com base nos rótulos alfabéticos
+                    agrupado_resultado.sort_values("label", inplace=True)
             
-            # Juntar Estado e Ano para usar como rótulo
-            agrupado_resultado["label"] = (
-                agrupado_resultado["Estado"] + ", " + agrupado_resultado["Ano"].astype(str)
-            )
+                    # Definir as cores específicas para cada categoria
+                    color_map = {
+                        "Não Dependente": "#007acc",
+                        "Dependente": "#F46045",
+                        "Não Informado": "rgba(150, 150, 150, 0.8)",
+                    }
             
-            # Ordenar o DataFrame com base nos rótulos alfabéticos
-            agrupado_resultado.sort_values("label", inplace=True)
+                    # Criar gráfico de barras interativo com Plotly
+                    fig = go.Figure()
             
-            # Definir as cores específicas para cada categoria
-            color_map = {
-                "Não Dependente": "#007acc",
-                "Dependente": "#F46045",
-                "Não Informado": "rgba(150, 150, 150, 0.8)",
-            }
+                    # Loop sobre cada 'dep' distinto e adicionar como uma série no gráfico
+                    for categoria in agrupado_resultado['dep'].unique():
+                        color = color_map.get(categoria, "gray")  # Usar gray como cor padrão se a categoria não estiver no mapa
+                        df_categoria = agrupado_resultado[agrupado_resultado["dep"] == categoria]
+                
+                        fig.add_trace(
+                            go.Bar(
+                                x=df_categoria["label"],
+                                y=df_categoria["Resultado para o Estado Acionista"],
+                                name=categoria,
+                                hoverinfo="text",
+                                textposition="none",
+                                hovertext=df_categoria.apply(
+                                    lambda row: f"<b>Estado:</b> {row['Estado']}<br><b>Ano:</b> {row['Ano']}<br><b>Dependência:</b> {row['dep']}<br><b>Resultado:</b> R$ {row['Resultado para o Estado Acionista']:,.2f}",
+                                    axis=1,
+                                ),
+                                marker_color=color,
+                            )
+                        )
             
-            # Criar gráfico de barras interativo com Plotly
-            fig = go.Figure()
+                    # Linha zero para referência
+                    fig.add_shape(
+                        type="line",
+                        x0=0,
+                        y0=0,
+                        x1=1,
+                        y1=0,
+                        line=dict(color="gray", width=1, dash="dash"),
+                        xref="paper",
+                        yref="y"
+                    )
             
-            # Loop sobre cada 'dep' distinto e adicionar como uma série no gráfico
-            for categoria in agrupado_resultado['dep'].unique():
-                color = color_map.get(categoria, "gray")  # Usar gray como cor padrão se a categoria não estiver no mapa
-                df_categoria = agrupado_resultado[agrupado_resultado["dep"] == categoria]
-                
-                fig.add_trace(
-                    go.Bar(
-                        x=df_categoria["label"],
-                        y=df_categoria["Resultado para o Estado Acionista"],
-                        name=categoria,
-                        hoverinfo="text",
-                        textposition="none",
-                        hovertext=df_categoria.apply(
-                            lambda row: f"<b>Estado:</b> {row['Estado']}<br><b>Ano:</b> {row['Ano']}<br><b>Dependência:</b> {row['dep']}<br><b>Resultado:</b> R$ {row['Resultado para o Estado Acionista']:,.2f}",
-                            axis=1,
+                    # Atualizar layout do gráfico
+                    fig.update_layout(
+                        title="Resultado Líquido das Empresas para o Estado Acionista por Dependência",
+                        xaxis_title="Estado, Ano",
+                        yaxis_title="Resultado Líquido para o Estado (R$)",
+                        barmode="stack",
+                        xaxis=dict(
+                            categoryorder="array",
+                            categoryarray=sorted(agrupado_resultado["label"].unique()),
+                            tickangle=-90,
+                            tickfont=dict(size=10, color="black"),
+                            title=dict(font=dict(color="black", size=14)),
+                        ),
+                        yaxis=dict(
+                            tickfont=dict(color="black", size=12),
+                            title=dict(font=dict(color="black", size=14)),
+                            gridcolor="lightgray",
                         ),
-                        marker_color=color,
+                        legend=dict(
+                            title=dict(text="Dependência", font=dict(color="black", size=12)),
+                            font=dict(color="black"),
+                            orientation="h",
+                            yanchor="bottom",
+                            y=-0.30,  # Aumentado para mover a legenda mais para baixo
+                            xanchor="center",
+                            x=0.5
+                        ),
+                        showlegend=True,
+                        template="plotly_white",
+                        height=600,
+                        margin=dict(l=40, r=40, t=80, b=180),  # Aumentado o valor de b (margem inferior)
+                        plot_bgcolor="white",
+                        paper_bgcolor="white",
+                        title_font=dict(color="black", size=16)
                     )
+                    return fig
+
+                fig = figuras.obter(
+                    chave_figura("resultado_dependencia", **filtro_dep),
+                    desenhar_resultado_dependencia,
                 )
+
+                # Mostrar o gráfico
+                st.plotly_chart(fig, width="stretch")
+
+                registrar(linhas=len(celulas), figura=fig)
             
-            # Linha zero para referência
-            fig.add_shape(
-                type="line",
-                x0=0,
-                y0=0,
-                x1=1,
-                y1=0,
-                line=dict(color="gray", width=1, dash="dash"),
-                xref="paper",
-                yref="y"
-            )
-            
-            # Atualizar layout do gráfico
-            fig.update_layout(
-                title="Resultado Líquido das Empresas para o Estado Acionista por Dependência",
-                xaxis_title="Estado, Ano",
-                yaxis_title="Resultado Líquido para o Estado (R$)",
-                barmode="stack",
-                xaxis=dict(
-                    categoryorder="array",
-                    categoryarray=sorted(agrupado_resultado["label"].unique()),
-                    tickangle=-90,
-                    tickfont=dict(size=10, color="black"),
-                    title=dict(font=dict(color="black", size=14)),
-                ),
-                yaxis=dict(
-                    tickfont=dict(color="black", size=12),
-                    title=dict(font=dict(color="black", size=14)),
-                    gridcolor="lightgray",
-                ),
-                legend=dict(
-                    title=dict(text="Dependência", font=dict(color="black", size=12)),
-                    font=dict(color="black"),
-                    orientation="h",
-                    yanchor="bottom",
-                    y=-0.30,  # Aumentado para mover a legenda mais para baixo
-                    xanchor="center",
-                    x=0.5
-                ),
-                showlegend=True,
-                template="plotly_white",
-                height=600,
-                margin=dict(l=40, r=40, t=80, b=180),  # Aumentado o valor de b (margem inferior)
-                plot_bgcolor="white",
-                paper_bgcolor="white",
-                title_font=dict(color="black", size=16)
-            )
-            
-            # Mostrar o gráfico
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Adicionar seção expandível com análise detalhada
-            with st.expander("📊 Ver análise detalhada por dependência"):
-                # Agrupar por tipo de dependência para análise global
-                dep_analysis = df_resultado_dep.groupby("dep")["Resultado para o Estado Acionista"].agg(
-                    ["sum", "mean", "count"]
-                ).reset_index()
-                dep_analysis.columns = ["Dependência", "Total", "Média", "Quantidade de Registros"]
-                
-                # Ordenar do mais positivo ao mais negativo
-                dep_analysis = dep_analysis.sort_values(by="Total", ascending=False)
+                # Adicionar seção expandível com análise detalhada
+                with st.expander("📊 Ver análise detalhada por dependência"):
+                    # Agrupar por tipo de dependência para análise global
+                    dep_analysis = cubo.resumir(
+                        "dep", "Resultado para o Estado Acionista", **filtro_dep
+                    ).reset_index()
+                    dep_analysis.columns = ["Dependência", "Total", "Média", "Quantidade de Registros"]
                 
-                # Mostrar tabela formatada
-                st.dataframe(
-                    dep_analysis,
-                    column_config={
-                        "Total": st.column_config.NumberColumn("Total (R$)", format="R$ %.2f"),
-                        "Média": st.column_config.NumberColumn("Média (R$)", format="R$ %.2f")
-                    },
-                    hide_index=True,
-                    use_container_width=True
-                )
+                    # Ordenar do mais positivo ao mais negativo
+                    dep_analysis = dep_analysis.sort_values(by="Total", ascending=False)
                 
-                # Comparação direta entre categorias de dependência
-                st.markdown("### Comparação entre categorias de dependência")
+                    # Mostrar tabela formatada
+                    st.dataframe(
+                        dep_analysis,
+                        column_config={
+                            "Total": st.column_config.NumberColumn("Total (R$)", format="R$ %.2f"),
+                            "Média": st.column_config.NumberColumn("Média (R$)", format="R$ %.2f")
+                        },
+                        hide_index=True,
+                        width="stretch"
+                    )
                 
-                fig_comp = px.bar(
-                    dep_analysis,
-                    x="Dependência",
-                    y="Total",
-                    color="Dependência",
-                    color_discrete_map={
-                        "Não Dependente": "#007acc",
-                        "Dependente": "#F46045",
-                        "Não Informado": "rgba(150, 150, 150, 0.8)",
-                    },
-                    text="Total",
-                    labels={"Total": "Resultado Total (R$)"},
-                    height=400
-                )
+                    # Comparação direta entre categorias de dependência
+                    st.markdown("### Comparação entre categorias de dependência")
                 
-                # Configurações adicionais
-                fig_comp.update_traces(
-                    texttemplate="R$ %{y:,.2f}",
-                    textposition="outside"
-                )
+                    # Gráfico de comparação guardado no cache de figuras pelos filtros
+                    def desenhar_comparacao_dependencia():
+                        fig_comp = px.bar(
+                            dep_analysis,
+                            x="Dependência",
+                            y="Total",
+                            color="Dependência",
+                            color_discrete_map={
+                                "Não Dependente": "#007acc",
+                                "Dependente": "#F46045",
+                                "Não Informado": "rgba(150, 150, 150, 0.8)",
+                            },
+                            text="Total",
+                            labels={"Total": "Resultado Total (R$)"},
+                            height=400
+                        )
                 
-                fig_comp.update_layout(
-                    xaxis_title=dict(text="Categoria de Dependência", font=dict(color="black", size=14)),
-                    yaxis_title=dict(text="Resultado Total (R$)", font=dict(color="black", size=14)),
-                    xaxis=dict(tickfont=dict(color="black")),
-                    yaxis=dict(tickfont=dict(color="black")),
-                    showlegend=False,
-                    plot_bgcolor="white",
-                    paper_bgcolor="white"
-                )
+                        # Configurações adicionais
+                        fig_comp.update_traces(
+                            texttemplate="R$ %{y:,.2f}",
+                            textposition="outside"
+                        )
                 
-                # Adicionar linha no zero
-                fig_comp.add_hline(y=0, line_dash="dash", line_color="gray")
+                        fig_comp.update_layout(
+                            xaxis_title=dict(text="Categoria de Dependência", font=dict(color="black", size=14)),
+                            yaxis_title=dict(text="Resultado Total (R$)", font=dict(color="black", size=14)),
+                            xaxis=dict(tickfont=dict(color="black")),
+                            yaxis=dict(tickfont=dict(color="black")),
+                            showlegend=False,
+                            plot_bgcolor="white",
+                            paper_bgcolor="white"
+                        )
                 
-                # Mostrar o gráfico de comparação
-                st.plotly_chart(fig_comp, use_container_width=True)
+                        # Adicionar linha no zero
+                        fig_comp.add_hline(y=0, line_dash="dash", line_color="gray")
+                        return fig_comp
+
+                    fig_comp = figuras.obter(
+                        chave_figura("comparacao_dependencia", **filtro_dep),
+                        desenhar_comparacao_dependencia,
+                    )
+
+                    # Mostrar o gráfico de comparação
+                    st.plotly_chart(fig_comp, width="stretch")
+
+                    registrar(figura=fig_comp)
                 
-                # Análise por estado e dependência
-                st.markdown("### Resultado por Estado e Dependência")
+                    # Análise por estado e dependência
+                    st.markdown("### Resultado por Estado e Dependência")
                 
-                # Agrupar por estado e dependência
-                estado_dep = df_resultado_dep.groupby(["Estado", "dep"])["Resultado para o Estado Acionista"].sum().reset_index()
+                    # Agrupar por estado e dependência
+                    estado_dep = (
+                        cubo.fatiar(["Estado", "dep"], ["Resultado para o Estado Acionista"], **filtro_dep)
+                        [["Resultado para o Estado Acionista"]]
+                        .reset_index()
+                    )
                 
-                # Criar tabela dinâmica para visualização
-                pivot_estado_dep = estado_dep.pivot_table(
-                    index="Estado",
-                    columns="dep",
-                    values="Resultado para o Estado Acionista",
-                    fill_value=0
-                ).reset_index()
+                    # Criar tabela dinâmica para visualização
+                    pivot_estado_dep = estado_dep.pivot_table(
+                        index="Estado",
+                        columns="dep",
+                        values="Resultado para o Estado Acionista",
+                        fill_value=0,
+                        observed=True,
+                        dropna=False
+                    ).reset_index()
                 
-                # Adicionar coluna de total
-                pivot_estado_dep["Total"] = pivot_estado_dep.iloc[:, 1:].sum(axis=1)
+                    # Adicionar coluna de total, somada em centavos pelo cubo
+                    totais_estado = cubo.fatiar("Estado", ["Resultado para o Estado Acionista"], **filtro_dep)[
+                        "Resultado para o Estado Acionista"
+                    ]
+                    pivot_estado_dep["Total"] = totais_estado.reindex(pivot_estado_dep["Estado"]).to_numpy()
                 
-                # Ordenar por total
-                pivot_estado_dep = pivot_estado_dep.sort_values("Total", ascending=False)
+                    # Ordenar por total
+                    pivot_estado_dep = pivot_estado_dep.sort_values("Total", ascending=False)
                 
-                # Formatar para exibição
-                st.dataframe(
-                    pivot_estado_dep,
-                    column_config={
-                        col: st.column_config.NumberColumn(
-                            col, format="R$ %.2f"
-                        ) for col in pivot_estado_dep.columns if col != "Estado"
-                    },
-                    hide_index=True,
-                    use_container_width=True
-                )
+                    # Formatar para exibição
+                    st.dataframe(
+                        pivot_estado_dep,
+                        column_config={
+                            col: st.column_config.NumberColumn(
+                                col, format="R$ %.2f"
+                            ) for col in pivot_estado_dep.columns if col != "Estado"
+                        },
+                        hide_index=True,
+                        width="stretch"
+                    )
+
+
+secao_resultado_dependencia(df_filtrado, filtro_geral)
+
+st.subheader("Empresas semelhantes às estatais do DF em outros Estados", divider="orange")
+
+# Conteúdo específico desta página
+st.write("""
+Os gráficos anteriores comparam os Estados de forma agregada. Nesta seção é possível escolher uma empresa estatal do Distrito Federal e encontrar, na base nacional, as empresas mais parecidas com ela no mesmo ano, considerando setor, espécie, patrimônio líquido, quantidade de empregados, despesa com pessoal e capital social. Os resultados das empresas semelhantes são apresentados lado a lado com os da empresa escolhida.
+""")
+
+@medir("pares")
+def secao_pares():
+    # Índice de pares (matriz de atributos normalizada, pré-calculada por versão da base)
+    pares = carregar_pares()
+    empresas = carregar_empresas()
+    empresas_df = empresas[empresas["Estado"] == "DF"].sort_values("nome", key=lambda nomes: nomes.str.casefold())
+
+    col1, col2, col3 = st.columns([3, 1, 1])
+
+    with col1:
+        emp_id_pares = st.selectbox(
+            "Empresa do DF:",
+            options=empresas_df.index.tolist(),
+            format_func=lambda i: empresas.at[i, "nome"],
+            key="pares_empresa",
+        )
+
+    with col2:
+        # Só os anos em que a empresa tem dados, do mais recente ao mais antigo
+        anos_pares = pares.anos_da_empresa(emp_id_pares)
+        ano_pares = st.selectbox("Ano:", options=anos_pares, key="pares_ano")
+
+    with col3:
+        k_pares = st.slider("Quantidade de empresas:", min_value=3, max_value=10, value=5, key="pares_k")
+
+    somente_outros_estados = st.checkbox("Somente empresas de outros Estados", value=True, key="pares_outros_estados")
+
+    semelhantes = pares.pares(emp_id_pares, ano_pares, k=k_pares, excluir_estado=somente_outros_estados)
+
+    if len(semelhantes) == 0:
+        st.warning("Não há dados da empresa selecionada para o ano escolhido.")
+    else:
+        tabela_pares = semelhantes[
+            ["emp", "Estado", "setor", "esp"]
+            + COLUNAS_PARES_NUMERICAS
+            + ["lucros", "Resultado para o Estado Acionista", "distancia"]
+        ].rename(columns={
+            "emp": "Empresa",
+            "setor": "Setor",
+            "esp": "Espécie",
+            "qde_empregados": "Empregados",
+            "desp_pessoal": "Despesa com Pessoal",
+            "capital": "Capital Social",
+            "lucros": "Lucro Líquido",
+            "distancia": "Distância",
+        })
+
+        def desenhar_pares():
+            cores = ["#fb8c00"] + ["#007acc"] * (len(tabela_pares) - 1)
+            fig = go.Figure(go.Bar(
+                x=tabela_pares["Resultado para o Estado Acionista"],
+                y=tabela_pares["Empresa"] + " (" + tabela_pares["Estado"].astype(str) + ")",
+                orientation="h",
+                marker_color=cores,
+                hovertemplate="%{y}<br>R$ %{x:,.2f}<extra></extra>",
+            ))
+            fig.update_layout(
+                title=dict(text=f"Resultado para o Estado Acionista em {ano_pares}", font=dict(color="black")),
+                xaxis=dict(
+                    tickfont=dict(color="black", size=12),
+                    tickprefix="R$ ",
+                    gridcolor="lightgray"
+                ),
+                yaxis=dict(tickfont=dict(color="black", size=12), autorange="reversed"),
+                height=120 + 40 * len(tabela_pares),
+                margin=dict(l=40, r=40, t=60, b=40),
+                plot_bgcolor="white",
+                paper_bgcolor="white",
+            )
+            return fig
+
+        fig = figuras.obter(
+            chave_figura(
+                "pares",
+                emp_id=int(emp_id_pares),
+                Ano=int(ano_pares),
+                k=k_pares,
+                outros_estados=somente_outros_estados,
+            ),
+            desenhar_pares,
+        )
+        st.plotly_chart(fig, width="stretch")
+
+        registrar(linhas=len(tabela_pares), figura=fig)
+
+        st.dataframe(
+            tabela_pares,
+            column_config={
+                **{
+                    col: st.column_config.NumberColumn(col, format="R$ %.2f")
+                    for col in ["PL", "Despesa com Pessoal", "Capital Social", "Lucro Líquido", "Resultado para o Estado Acionista"]
+                },
+                "Empregados": st.column_config.NumberColumn("Empregados", format="%d"),
+                "Distância": st.column_config.NumberColumn("Distância", format="%.2f"),
+            },
+            hide_index=True,
+            width="stretch"
+        )
+        st.caption("A primeira linha é a empresa escolhida; quanto menor a distância, mais parecida é a empresa.")
+
+
+secao_pares()
+
+# Painel de desempenho (só com ?desempenho=1 na URL)
+exibir_painel()
 
 # Botão para voltar à página inicial
 if st.button("Voltar à Página Inicial"):
@@ -1,6 +1,12 @@
 import streamlit as st
 import os
 
+from estatais.dados import ler_arquivo
+from estatais.desempenho import exibir_painel, medidor
+
+# Tempo de cada seção desta página (ver estatais.desempenho)
+medir = medidor(__file__)
+
 # 1. Configuração da página
 st.set_page_config(page_title="Download do Boletim", layout="wide")
 
@@ -88,25 +94,37 @@ sobre o desempenho das empresas públicas do DF.
 """)
 
 # 3. Verificação e Interface de Download
-if os.path.exists(pdf_path):
-    # Criando um layout centralizado para o botão
-    col1, col2, col3 = st.columns([1, 2, 1])
+@medir("boletim_pdf")
+def secao_boletim_pdf(pdf_path):
+    if os.path.exists(pdf_path):
+        # Criando um layout centralizado para o botão
+        col1, col2, col3 = st.columns([1, 2, 1])
     
-    with col2:
-        st.info("O arquivo está pronto para download.")
+        with col2:
+            st.info("O arquivo está pronto para download.")
         
-        with open(pdf_path, "rb") as f:
-            pdf_bytes = f.read()
-            
-        st.download_button(
-            label="📥 CLIQUE AQUI PARA BAIXAR O BOLETIM (PDF)",
-            data=pdf_bytes,
-            file_name="Boletim_das_Estatais_Distritais.pdf",
-            mime="application/pdf",
-            width='stretch' # Atualizado conforme os logs do seu servidor
-        )
+            # Bytes lidos uma única vez e compartilhados entre as sessões
+            pdf_bytes = ler_arquivo(pdf_path)
+            # Tamanho com vírgula decimal (ex.: "1,1")
+            tamanho_mb = f"{os.stat(pdf_path).st_size / (1024 * 1024):.1f}".replace(".", ",")
+
+            st.download_button(
+                label="📥 CLIQUE AQUI PARA BAIXAR O BOLETIM (PDF)",
+                data=pdf_bytes,
+                file_name="Boletim_das_Estatais_Distritais.pdf",
+                mime="application/pdf",
+                width='stretch' # Atualizado conforme os logs do seu servidor
+            )
         
-        st.caption("Tamanho do arquivo: Aproximadamente 2MB. Recomendamos o uso de um leitor de PDF atualizado.")
-else:
-    st.error("⚠️ Documento não encontrado no servidor.")
-    st.info("O arquivo 'Boletim_das_Estatais_Distritais.pdf' não foi localizado na pasta raiz do projeto.")
+            st.caption(
+                f"Tamanho do arquivo: {tamanho_mb} MB. Recomendamos o uso de um leitor de PDF atualizado."
+            )
+    else:
+        st.error("⚠️ Documento não encontrado no servidor.")
+        st.info("O arquivo 'Boletim_das_Estatais_Distritais.pdf' não foi localizado na pasta raiz do projeto.")
+
+
+secao_boletim_pdf(pdf_path)
+
+# Painel de desempenho (só com ?desempenho=1 na URL)
+exibir_painel()
@@ -0,0 +1,301 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from estatais.desempenho import exibir_painel, medidor, registrar
+from estatais.empresas import carregar_empresas, carregar_historicos
+from estatais.metricas import COLUNAS_METRICAS
+from estatais.moeda import COLUNAS_MONETARIAS
+from estatais.snapshot import COLUNAS_GOVERNANCA
+from estatais.variacoes import carregar_variacoes
+
+# Tabela de empresas (nome canônico de cada emp_id) e índice com o histórico
+# de cada empresa em um trecho contíguo da base
+empresas = carregar_empresas()
+historicos = carregar_historicos()
+
+# Variações anuais pré-calculadas de cada empresa
+variacoes = carregar_variacoes("empresa")
+
+# Tempo de cada seção desta página (ver estatais.desempenho)
+medir = medidor(__file__)
+
+# Configurações da página
+st.set_page_config(
+    page_title="Histórico por Empresa",
+    page_icon="📈",
+    layout="wide"
+)
+
+st.markdown("""
+<style>
+    /* 1. FUNDO BRANCO */
+    [data-testid="stAppViewContainer"] {
+        background-color: #FFFFFF !important;
+    }
+
+    /* 2. TÍTULOS EM LARANJA */
+    h1, h2, h3, h4, h5, h6, [data-testid="stHeader"], .stHeader {
+        color: #fb8c00 !important;
+    }
+    
+    /* Linha divisória laranja */
+    hr {
+        border-top-color: #fb8c00 !important;
+    }
+
+     /* 3. BARRA LATERAL (IDÊNTICA AO INÍCIO) */
+    [data-testid="stSidebar"] {
+        background-color: #f5f5f5 !important; /* Cinza robusto */
+        border-right: 2px solid #fb8c00;
+    }
+
+    /* Cor do texto dos itens do menu lateral */
+    [data-testid="stSidebarNav"] span {
+        color: #363434 !important;
+        font-weight: 500 !important;
+        font-size: 1.05rem !important;
+    }
+
+    /* Cor do ícone ao lado do texto no menu */
+    [data-testid="stSidebarNav"] svg {
+        fill: #FFFFFF !important;
+    }
+
+    /* Destaque para a página selecionada */
+    [data-testid="stSidebarNav"] a[aria-current="page"] {
+        background-color: rgba(251, 140, 0, 0.2) !important;
+        border-radius: 5px;
+    }
+    
+    [data-testid="stSidebarNav"] a[aria-current="page"] span {
+        color: #fb8c00 !important;
+        font-weight: bold !important;
+    }
+
+    /* 4. BOTÕES LARANJAS */
+    div.stButton > button {
+        background-color: #fb8c00 !important;
+        color: #FFFFFF !important;
+        border: none;
+        font-weight: bold;
+    }
+
+    /* 5. TEXTOS LONGOS (CORRIGINDO ILEGIBILIDADE) */
+    .stMarkdown p, .stMarkdown li, .stWrite {
+        color: #2F2F2F !important; /* Cinza escuro legível */
+        text-align: justify;
+    }
+
+    /* Garante que os números/bullets (1, 2, 3...) também fiquem escuros */
+    .stMarkdown li::marker {
+        color: #2F2F2F !important;
+        font-weight: bold;
+    }
+
+
+</style>
+""", unsafe_allow_html=True)
+
+# Rótulos das medidas exibidas no histórico
+ROTULOS_MEDIDAS = {
+    "Resultado para o Estado Acionista": "Resultado para o Estado Acionista",
+    "lucros": "Lucro Líquido",
+    "PL": "Patrimônio Líquido",
+    "capital": "Capital Social",
+    "Dividendos": "Dividendos",
+    "Subvenção": "Subvenção",
+    "Reforço de Capital": "Reforço de Capital",
+    "desp_pessoal": "Despesa com Pessoal",
+    "desp_investimento": "Despesa com Investimento",
+    "maior_rem": "Maior Remuneração",
+    "qde_empregados": "Quantidade de Empregados",
+}
+
+# Indicadores pré-calculados (ver estatais.metricas)
+ROTULOS_INDICADORES = {
+    "rentabilidade": "Rentabilidade (Lucro / PL, %)",
+    "payout": "Payout (Dividendos / Lucro, %)",
+    "subvencao_por_empregado": "Subvenção por Empregado",
+    "custo_por_empregado": "Despesa com Pessoal por Empregado",
+}
+
+ROTULOS_GOVERNANCA = {
+    "gov_ca": "Conselho de Administração",
+    "gov_cf": "Conselho Fiscal",
+    "gov_aud": "Comitê de Auditoria",
+}
+
+ROTULOS_CADASTRO = {
+    "setor": "Setor",
+    "dep": "Dependência",
+    "sit": "Situação",
+    "esp": "Espécie",
+}
+
+st.title("🏢 Histórico por Empresa")
+st.header("Evolução de cada estatal entre 2020 e 2023", divider="orange")
+
+st.markdown("""
+Escolha uma empresa estatal de qualquer estado para ver a evolução de todas as suas
+informações no período analisado: resultado, patrimônio, repasses do acionista,
+despesas, estruturas de governança e dados cadastrais, ano a ano.
+""")
+
+# Seleção da empresa: estado e nome (a caixa de seleção aceita busca por texto)
+col1, col2 = st.columns([1, 3])
+
+with col1:
+    # O estado e a empresa podem vir preenchidos pela busca da página inicial
+    st.session_state.setdefault("historico_estado", "DF")
+    estado = st.selectbox(
+        "Estado",
+        ["Todos"] + sorted(empresas["Estado"].unique()),
+        key="historico_estado",
+    )
+
+with col2:
+    opcoes = empresas if estado == "Todos" else empresas[empresas["Estado"] == estado]
+    opcoes = opcoes.sort_values("nome", key=lambda nomes: nomes.str.casefold())
+    emp_id = st.selectbox(
+        "Empresa (digite para buscar)",
+        opcoes.index.tolist(),
+        format_func=lambda i: f"{empresas.at[i, 'nome']} ({empresas.at[i, 'Estado']})",
+        key="historico_empresa",
+    )
+
+# Resumo da empresa: cadastro, últimos valores e gráfico das medidas escolhidas
+@medir("resumo_empresa")
+def secao_resumo_empresa(emp_id, empresa, historico):
+    ultimo = historico.iloc[-1]
+
+    # Dados cadastrais do ano mais recente
+    colunas = st.columns(len(ROTULOS_CADASTRO))
+    for coluna, (campo, rotulo) in zip(colunas, ROTULOS_CADASTRO.items()):
+        with coluna:
+            valor = ultimo.get(campo)
+            st.metric(rotulo, "N/A" if pd.isna(valor) else str(valor))
+
+    anos = historico["Ano"].astype(int).tolist()
+    st.caption(
+        f"Estado: {empresa['Estado']} · Anos com informação: {', '.join(map(str, anos))}"
+        + (
+            f" · Nomes usados nos relatórios: {', '.join(sorted(historico['emp'].unique()))}"
+            if empresa["grafias"] > 1
+            else ""
+        )
+    )
+
+    # Último valor de cada medida principal, com a variação anual e a série completa
+    colunas = st.columns(3)
+    for coluna, medida in zip(colunas, ["Resultado para o Estado Acionista", "lucros", "PL"]):
+        serie = variacoes.serie(medida, emp_id).dropna(subset=["valor"])
+        with coluna:
+            if serie.empty:
+                st.metric(ROTULOS_MEDIDAS[medida], "N/A", border=True)
+                continue
+            atual = serie.iloc[-1]
+            st.metric(
+                f"{ROTULOS_MEDIDAS[medida]} ({int(atual['Ano'])})",
+                f"R$ {atual['valor']:,.2f}",
+                None if pd.isna(atual["variacao_pct"]) else f"{atual['variacao_pct']:.1f}% sobre {int(atual['Ano']) - 1}",
+                border=True,
+                chart_data=serie["valor"].tolist(),
+                chart_type="area",
+            )
+
+    # Gráfico das medidas monetárias escolhidas
+    medidas_monetarias = [coluna for coluna in COLUNAS_MONETARIAS if coluna in historico.columns]
+    medidas_escolhidas = st.multiselect(
+        "Medidas no gráfico",
+        medidas_monetarias,
+        default=[m for m in ["Resultado para o Estado Acionista", "lucros"] if m in medidas_monetarias],
+        format_func=lambda coluna: ROTULOS_MEDIDAS.get(coluna, coluna),
+        key="historico_medidas",
+    )
+
+    registrar(linhas=len(historico))
+
+    if medidas_escolhidas:
+        dados_grafico = historico.melt(
+            id_vars="Ano", value_vars=medidas_escolhidas, var_name="Medida", value_name="Valor"
+        )
+        dados_grafico["Medida"] = dados_grafico["Medida"].map(lambda coluna: ROTULOS_MEDIDAS.get(coluna, coluna))
+        dados_grafico["Ano"] = dados_grafico["Ano"].astype(str)
+
+        fig = px.bar(
+            dados_grafico,
+            x="Ano",
+            y="Valor",
+            color="Medida",
+            barmode="group",
+            labels={"Valor": "Valor (R$)", "Ano": "Ano"},
+            color_discrete_sequence=["#fb8c00", "#007acc", "#F46045", "#2ca02c", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#17becf"],
+        )
+        fig.update_layout(
+            plot_bgcolor="white",
+            legend_title_text="",
+            yaxis_tickprefix="R$ ",
+            yaxis_tickformat=",.0f",
+            height=450,
+        )
+        fig.add_hline(y=0, line_color="gray", line_width=0.8)
+        st.plotly_chart(fig, width="stretch")
+
+        registrar(figura=fig)
+
+
+def formatar(coluna, valor):
+    if pd.isna(valor):
+        return "—"
+    if coluna in ("rentabilidade", "payout"):
+        return f"{valor:.2f}%"
+    if coluna in COLUNAS_MONETARIAS or coluna in COLUNAS_METRICAS or coluna == "maior_rem":
+        return f"R$ {valor:,.2f}"
+    if coluna == "qde_empregados":
+        return f"{valor:,.0f}"
+    if coluna in COLUNAS_GOVERNANCA:
+        return "Sim" if valor else "Não"
+    return str(valor)
+
+
+# Tabela com todas as informações, uma coluna por ano
+@medir("tabela_anual")
+def secao_tabela_anual(historico):
+    st.subheader("Todas as informações por ano", divider="orange")
+
+    anos = historico["Ano"].astype(int).tolist()
+    linhas = {}
+    for rotulos in (ROTULOS_MEDIDAS, ROTULOS_INDICADORES, ROTULOS_GOVERNANCA, ROTULOS_CADASTRO):
+        for coluna, rotulo in rotulos.items():
+            if coluna in historico.columns:
+                linhas[rotulo] = [formatar(coluna, valor) for valor in historico[coluna]]
+
+    tabela = pd.DataFrame.from_dict(linhas, orient="index", columns=[str(ano) for ano in anos])
+    st.dataframe(tabela, width="stretch", height=(len(tabela) + 1) * 35 + 3)
+
+    registrar(linhas=len(tabela))
+
+    ultimo = historico.iloc[-1]
+    if isinstance(ultimo.get("link"), str) and ultimo["link"].startswith("http"):
+        st.markdown(f"[Fonte dos dados de {anos[-1]}]({ultimo['link']})")
+
+
+historico = historicos.historico(emp_id) if emp_id is not None else None
+
+if historico is None or len(historico) == 0:
+    st.warning("Nenhum dado disponível para a empresa selecionada.")
+else:
+    empresa = empresas.loc[emp_id]
+
+    st.subheader(empresa["nome"], divider="orange")
+
+    secao_resumo_empresa(emp_id, empresa, historico)
+    secao_tabela_anual(historico)
+
+# Painel de desempenho (só com ?desempenho=1 na URL)
+exibir_painel()
+
+# Botão para voltar à página inicial
+if st.button("Voltar à Página Inicial"):
+    st.switch_page("Início.py")
@@ -0,0 +1,21 @@
+"""Base nacional tipada compartilhada pelos testes (``python -m pytest`` a partir de Painel.ST)."""
+
+import os
+import sys
+
+import pytest
+
+# Permite importar ``estatais`` qualquer que seja o diretório de trabalho
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from estatais.dados import localizar_arquivo  # noqa: E402
+from estatais.snapshot import ler_origem, tipar_base  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def base():
+    """Base do CSV com os tipos do snapshot, sem passar pelos caches do Streamlit.
+
+    Compartilhada entre os testes: quem precisar alterá-la usa ``.copy()``.
+    """
+    return tipar_base(ler_origem(localizar_arquivo()))
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estatais.bitmap import DIMENSOES_BITMAP, IndiceBitmap
+from estatais.snapshot import DEPENDENTE
+
+FILTROS = [
+    {},
+    {"Estado": "DF"},
+    {"Estado": "DF", "Ano": 2023},
+    {"Estado": ["DF", "SP"], "dep": DEPENDENTE, "gov_ca": True},
+    {"Ano": range(2021, 2023), "setor": None},
+    {"Estado": "XX"},
+    {"Estado": [], "Ano": 2023},
+]
+
+
+@pytest.fixture(scope="module")
+def indice(base):
+    return IndiceBitmap(base, DIMENSOES_BITMAP)
+
+
+def _mascara(df, filtros):
+    mascara = pd.Series(True, index=df.index)
+    for coluna, valor in filtros.items():
+        if valor is None:
+            continue
+        valores = list(valor) if isinstance(valor, (list, range)) else [valor]
+        mascara &= df[coluna].isin(valores)
+    return mascara
+
+
+@pytest.mark.parametrize("filtros", FILTROS)
+def test_filtrar_e_contar_iguais_a_mascara(base, indice, filtros):
+    mascara = _mascara(base, filtros)
+
+    pd.testing.assert_frame_equal(indice.filtrar(**filtros), base[mascara])
+    assert indice.contar(**filtros) == mascara.sum()
+    np.testing.assert_array_equal(indice.posicoes(**filtros), np.flatnonzero(mascara))
+
+
+@pytest.mark.parametrize("por", ["Estado", ["Ano", "dep"], ["setor", "gov_cf"]])
+@pytest.mark.parametrize("filtros", FILTROS[:4])
+def test_contar_por_igual_ao_groupby(base, indice, por, filtros):
+    esperado = base[_mascara(base, filtros)].groupby(por, observed=True).size()
+
+    resultado = indice.contar_por(por, **filtros)
+
+    assert resultado.to_dict() == esperado.to_dict()
+    assert list(resultado.index) == list(esperado.index)
+
+
+def test_dimensao_nao_indexada(indice):
+    with pytest.raises(KeyError):
+        indice.contar(emp="BRB")
@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from estatais.busca import IndiceTrigramas, dobrar, trigramas
+from estatais.empresas import tabela_empresas
+
+
+@pytest.fixture(scope="module")
+def empresas(base):
+    return tabela_empresas(base)
+
+
+@pytest.fixture(scope="module")
+def indice(empresas):
+    return IndiceTrigramas(empresas)
+
+
+def test_dobrar_remove_acentos_pontuacao_e_caixa():
+    assert dobrar("Gás de Alagoas S/A - ALGÁS") == "GAS DE ALAGOAS S A ALGAS"
+    assert dobrar("  Cia.  Energética\tde Brasília ") == "CIA ENERGETICA DE BRASILIA"
+
+
+def test_trigramas_das_palavras():
+    assert trigramas("DF SA") == {"  D", " DF", "DF ", "  S", " SA", "SA "}
+
+
+@pytest.mark.parametrize("consulta", ["brb", "Saneamento", "metrô", "companhia de", "desenvolvimento"])
+def test_palavras_inteiras_encontradas_primeiro(empresas, indice, consulta):
+    # Nomes com todas as palavras da consulta, em qualquer posição (busca linha a linha)
+    palavras = set(dobrar(consulta).split())
+    contem = empresas["nome"].map(lambda nome: palavras <= set(dobrar(nome).split()))
+    esperados = set(empresas.index[contem])
+    assert esperados
+
+    resultado = indice.buscar(consulta, limite=len(empresas))
+
+    assert set(resultado.index[:len(esperados)]) == esperados
+    assert resultado["pontuacao"].between(0, 1).all()
+
+
+def test_filtro_de_estado_igual_a_mascara(indice):
+    todos = indice.buscar("companhia", limite=10_000)
+
+    resultado = indice.buscar("companhia", limite=10_000, estado="DF")
+
+    pd.testing.assert_frame_equal(resultado, todos[todos["Estado"] == "DF"])
+
+
+def test_nome_exato_vem_primeiro(empresas, indice):
+    for emp_id, empresa in empresas[empresas["Estado"] == "DF"].iterrows():
+        assert indice.buscar(empresa["nome"], estado="DF").index[0] == emp_id
+
+
+@pytest.mark.parametrize("consulta", ["", "   ", "§§"])
+def test_consulta_sem_trigramas(indice, consulta):
+    resultado = indice.buscar(consulta)
+
+    assert resultado.empty
+    assert "pontuacao" in resultado.columns
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estatais.cubo import REGISTROS, Cubo
+from estatais.metricas import COLUNAS_METRICAS
+from estatais.moeda import SUFIXO_CENTAVOS
+from estatais.snapshot import COLUNA_CODIGO_GOVERNANCA, COLUNA_ID_EMPRESA
+
+MEDIDAS = ["lucros", "PL", "Resultado para o Estado Acionista", "qde_empregados"]
+
+
+@pytest.fixture(scope="module")
+def cubo(base):
+    return Cubo.a_partir_de(base)
+
+
+def _mascara(df, **filtros):
+    mascara = np.ones(len(df), dtype=bool)
+    for coluna, valor in filtros.items():
+        valores = valor if isinstance(valor, list) else [valor]
+        mascara &= df[coluna].isin(valores).to_numpy()
+    return df[mascara]
+
+
+def test_medidas_excluem_dimensoes_e_metricas(cubo):
+    assert not set(cubo.medidas) & set(cubo.dimensoes)
+    assert not set(cubo.medidas) & set(COLUNAS_METRICAS)
+    assert not [medida for medida in cubo.medidas if medida.endswith(SUFIXO_CENTAVOS)]
+    # Identificadores não são somados (emp_id é um hash de 63 bits e estouraria o int64)
+    assert COLUNA_ID_EMPRESA not in cubo.medidas
+    assert COLUNA_CODIGO_GOVERNANCA not in cubo.medidas
+    assert COLUNA_ID_EMPRESA not in cubo.fatiar("Estado").columns
+
+
+def test_registros_somam_as_linhas(base, cubo):
+    assert cubo.somas[REGISTROS].sum() == len(base)
+
+
+@pytest.mark.parametrize(
+    "por, filtros",
+    [
+        (["Estado", "Ano"], {}),
+        (["setor"], {"Estado": "DF"}),
+        (["Ano", "dep"], {"Estado": ["DF", "SP", "RJ"], "Ano": [2022, 2023]}),
+        ("REGIAO", {"Ano": 2021}),
+    ],
+)
+def test_fatiar_igual_ao_groupby(base, cubo, por, filtros):
+    resultado = cubo.fatiar(por, MEDIDAS, **filtros)
+    esperado = _mascara(base, **filtros).groupby(por, observed=True, dropna=False)
+    esperado = pd.concat([esperado.size().rename(REGISTROS), esperado[MEDIDAS].sum(min_count=1)], axis=1)
+
+    pd.testing.assert_frame_equal(
+        resultado, esperado, check_dtype=False, check_names=False, check_index_type=False, rtol=1e-12
+    )
+
+
+def test_fatiar_monetarias_exatas_em_centavos(base, cubo):
+    resultado = cubo.fatiar("Estado", ["lucros"])["lucros"]
+    centavos = np.rint(base["lucros"] * 100).groupby(base["Estado"], observed=True).sum()
+    np.testing.assert_array_equal(resultado.to_numpy(), (centavos / 100).to_numpy())
+
+
+def test_celula_sem_valores_fica_ausente():
+    df = pd.DataFrame({
+        "Estado": ["DF", "DF", "SP"],
+        "Ano": [2022, 2023, 2023],
+        "lucros": [np.nan, 10.0, 5.0],
+    })
+
+    resultado = Cubo.a_partir_de(df, dimensoes=["Estado", "Ano"]).fatiar(["Estado", "Ano"], ["lucros"])["lucros"]
+
+    assert pd.isna(resultado.loc[("DF", 2022)])
+    assert resultado.loc[("DF", 2023)] == 10.0
+
+
+def test_resumir_igual_a_media_do_pandas(base, cubo):
+    resultado = cubo.resumir("Ano", "qde_empregados", Estado="DF")
+    esperado = _mascara(base, Estado="DF").groupby("Ano")["qde_empregados"].agg(["sum", "mean", "count"])
+
+    pd.testing.assert_frame_equal(resultado, esperado, check_dtype=False, check_names=False, rtol=1e-12)
+
+
+def test_filtro_vazio_e_none(cubo):
+    assert cubo.celulas(Estado="XX").empty
+    pd.testing.assert_frame_equal(cubo.celulas(Estado=None, Ano=None), cubo.somas)
+
+
+def test_valores_da_dimensao(base, cubo):
+    assert cubo.valores("Ano", Estado="DF") == sorted(_mascara(base, Estado="DF")["Ano"].unique())
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estatais.indice import IndiceEstadoAno
+
+
+@pytest.fixture(scope="module")
+def indice(base):
+    return IndiceEstadoAno(base)
+
+
+@pytest.mark.parametrize(
+    "estado, ano",
+    [
+        ("DF", 2023),
+        ("DF", range(2020, 2024)),
+        ("SP", [2020, 2022]),
+        (["DF", "RJ", "MG"], [2023, 2021, 2022]),
+        (None, 2021),
+        ("DF", None),
+        (None, None),
+        ("XX", 2023),
+        ("DF", 1999),
+        ("DF", range(2023, 2020, -1)),
+    ],
+)
+def test_fatia_igual_a_mascara(base, indice, estado, ano):
+    mascara = base["Estado"].notna()
+    if estado is not None:
+        mascara &= base["Estado"].isin([estado] if isinstance(estado, str) else estado)
+    if ano is not None:
+        mascara &= base["Ano"].isin([ano] if isinstance(ano, int) else list(ano))
+
+    resultado = indice.fatia(estado, ano)
+
+    pd.testing.assert_frame_equal(resultado.sort_index(), base[mascara].sort_index())
+
+
+def test_fatia_ordenada_por_estado_e_ano_decrescente(indice):
+    resultado = indice.fatia(["DF", "SP"], range(2020, 2024))
+    chaves = list(zip(resultado["Estado"].astype(str), -resultado["Ano"]))
+    assert chaves == sorted(chaves)
+
+
+def test_intervalo_de_um_estado_e_fatia_sem_copia(indice):
+    resultado = indice.fatia("DF", range(2020, 2024))
+    assert np.shares_memory(resultado["Ano"].to_numpy(), indice.base["Ano"].to_numpy())
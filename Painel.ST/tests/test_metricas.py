@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estatais.metricas import METRICAS, adicionar_metricas, razao
+
+
+def test_razao_ausente_sem_denominador_positivo():
+    resultado = razao([10.0, 10.0, 10.0, 10.0, np.nan], [4.0, 0.0, -5.0, np.nan, 2.0], fator=100)
+
+    np.testing.assert_array_equal(resultado.to_numpy(), [250.0, np.nan, np.nan, np.nan, np.nan])
+
+
+@pytest.mark.parametrize("metrica", list(METRICAS))
+def test_metricas_da_base_iguais_ao_calculo_linha_a_linha(base, metrica):
+    numerador, denominador, fator = METRICAS[metrica]
+
+    esperado = [
+        n / d * fator if d > 0 else np.nan
+        for n, d in zip(base[numerador], base[denominador])
+    ]
+
+    assert base[metrica].dtype == np.float64
+    np.testing.assert_allclose(base[metrica].to_numpy(), esperado, rtol=1e-12)
+
+
+def test_rentabilidade_como_nas_paginas(base):
+    # Filtro original das páginas: só PL positivo entra na rentabilidade
+    positivos = base[base["PL"] > 0]
+
+    pd.testing.assert_series_equal(
+        base.loc[positivos.index, "rentabilidade"],
+        positivos["lucros"] / positivos["PL"] * 100,
+        check_names=False,
+    )
+    assert base.loc[~(base["PL"] > 0), "rentabilidade"].isna().all()
+
+
+def test_adicionar_metricas_so_com_colunas_de_origem():
+    df = adicionar_metricas(pd.DataFrame({"lucros": [5.0], "PL": [50.0], "Dividendos": [1.0]}))
+
+    assert df["rentabilidade"].tolist() == [10.0]
+    assert df["payout"].tolist() == [20.0]
+    assert "custo_por_empregado" not in df.columns
@@ -0,0 +1,75 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from estatais.moeda import (
+    COLUNAS_MONETARIAS,
+    adicionar_centavos,
+    coluna_centavos,
+    em_centavos,
+    em_reais,
+    para_centavos,
+    para_reais,
+)
+
+
+def test_para_centavos_arredonda_e_preserva_ausentes():
+    centavos = para_centavos([0.1, 0.2, 1234567.89, -0.015, np.nan, 0.07])
+
+    assert str(centavos.dtype) == "Int64"
+    assert centavos.tolist() == [10, 20, 123456789, -2, pd.NA, 7]
+
+
+def test_para_reais_escalar_e_serie():
+    assert para_reais(np.int64(12345)) == 123.45
+    reais = para_reais(pd.Series([150, None, -7], dtype="Int64"))
+
+    assert reais.dtype == np.float64
+    np.testing.assert_array_equal(reais.to_numpy(), [1.5, np.nan, -0.07])
+
+
+def test_soma_em_centavos_exata():
+    # Em float a soma acumula erro e depende da ordem das parcelas; em centavos não
+    valores = [0.1] * 10 + [1e9, 0.3, -1e9]
+    centavos = para_centavos(valores)
+
+    assert sum(valores) != 1.3
+    assert para_reais(centavos.sum()) == 1.3
+    assert centavos.sum() == centavos[::-1].sum()
+
+
+@pytest.mark.parametrize("coluna", ["lucros", "PL", "Resultado para o Estado Acionista"])
+def test_colunas_centavos_da_base(base, coluna):
+    centavos = base[coluna_centavos(coluna)]
+
+    pd.testing.assert_series_equal(centavos, para_centavos(base[coluna]), check_names=False)
+    # Total exato: igual à soma correta (fsum) dos valores em reais, arredondada ao centavo
+    assert centavos.sum() == round(math.fsum(base[coluna].dropna()) * 100)
+    assert para_reais(centavos.sum()) == pytest.approx(base[coluna].sum(), rel=1e-12)
+
+
+def test_em_centavos_reaproveita_colunas_gravadas(base):
+    resultado = em_centavos(base)
+
+    assert not [coluna for coluna in resultado.columns if coluna.endswith(" (centavos)")]
+    for coluna in COLUNAS_MONETARIAS:
+        if coluna in base.columns:
+            pd.testing.assert_series_equal(resultado[coluna], base[coluna_centavos(coluna)], check_names=False)
+    pd.testing.assert_series_equal(resultado["qde_empregados"], base["qde_empregados"])
+
+
+def test_em_centavos_sem_colunas_gravadas_e_volta_para_reais():
+    df = pd.DataFrame({"lucros": [1.25, np.nan, -3.1], "qde_empregados": [10.0, 2.0, np.nan]})
+
+    centavos = em_centavos(df)
+    assert centavos["lucros"].tolist() == [125, pd.NA, -310]
+    pd.testing.assert_frame_equal(em_reais(centavos), df)
+
+
+def test_adicionar_centavos_so_nas_colunas_presentes():
+    df = adicionar_centavos(pd.DataFrame({"lucros": [0.5], "Ano": [2023]}))
+
+    assert list(df.columns) == ["lucros", "Ano", coluna_centavos("lucros")]
+    assert df[coluna_centavos("lucros")].tolist() == [50]
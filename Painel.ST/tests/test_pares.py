@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from estatais.pares import IndicePares
+from estatais.snapshot import COLUNA_ID_EMPRESA
+
+
+@pytest.fixture(scope="module")
+def indice(base):
+    return IndicePares(base)
+
+
+def _forca_bruta(indice, emp_id, ano, k, excluir_estado=False):
+    # Distância de todas as linhas do ano à empresa, sem o truque das normas
+    mesmo_ano = (indice.base["Ano"] == ano).to_numpy()
+    alvo = np.flatnonzero(mesmo_ano & (indice.base[COLUNA_ID_EMPRESA] == emp_id).to_numpy())[0]
+    candidatos = mesmo_ano.copy()
+    candidatos[alvo] = False
+    if excluir_estado:
+        candidatos &= (indice.base["Estado"] != indice.base["Estado"].iloc[alvo]).to_numpy()
+    posicoes = np.flatnonzero(candidatos)
+    distancias = np.linalg.norm(
+        indice.matriz[posicoes].astype(np.float64) - indice.matriz[alvo].astype(np.float64), axis=1
+    )
+    return np.sort(distancias)[:k]
+
+
+@pytest.mark.parametrize("excluir_estado", [False, True])
+@pytest.mark.parametrize("k", [1, 5, 20])
+def test_pares_iguais_a_forca_bruta(base, indice, k, excluir_estado):
+    for emp_id, ano in base[base["Estado"] == "DF"][[COLUNA_ID_EMPRESA, "Ano"]].head(10).itertuples(index=False):
+        resultado = indice.pares(emp_id, ano, k=k, excluir_estado=excluir_estado)
+
+        assert resultado[COLUNA_ID_EMPRESA].iloc[0] == emp_id
+        assert (resultado["Ano"] == ano).all()
+        if excluir_estado:
+            assert (resultado["Estado"].iloc[1:] != resultado["Estado"].iloc[0]).all()
+        np.testing.assert_allclose(
+            resultado["distancia"].iloc[1:].to_numpy(),
+            _forca_bruta(indice, emp_id, ano, k, excluir_estado),
+            rtol=1e-4,
+            atol=1e-4,
+        )
+
+
+def test_empresa_sem_dados_no_ano(indice, base):
+    emp_id = base[COLUNA_ID_EMPRESA].iloc[0]
+
+    resultado = indice.pares(emp_id, 1999)
+
+    assert resultado.empty
+    assert "distancia" in resultado.columns
+
+
+def test_anos_da_empresa_iguais_ao_groupby(base, indice):
+    esperado = base.groupby(COLUNA_ID_EMPRESA)["Ano"].unique()
+
+    for emp_id, anos in esperado.items():
+        assert indice.anos_da_empresa(emp_id) == sorted(anos.tolist(), reverse=True)
+    assert indice.anos_da_empresa(-1) == []
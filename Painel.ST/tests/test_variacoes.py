@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from estatais.cubo import Cubo
+from estatais.moeda import em_centavos
+from estatais.snapshot import COLUNA_ID_EMPRESA
+from estatais.variacoes import NIVEIS, TabelaVariacoes, _somas_cubo, _somas_empresas
+
+MEDIDAS = ["Resultado para o Estado Acionista", "lucros", "PL", "qde_empregados"]
+
+
+@pytest.fixture(scope="module")
+def tabelas(base):
+    cubo = Cubo.a_partir_de(base)
+    return {
+        nivel: TabelaVariacoes(
+            chaves,
+            _somas_empresas(base, MEDIDAS) if nivel == "empresa" else _somas_cubo(cubo, chaves, MEDIDAS),
+            MEDIDAS,
+        )
+        for nivel, chaves in NIVEIS.items()
+    }
+
+
+def _esperado(base, chaves, medida):
+    # Séries anuais por entidade com groupby/shift do pandas, em reais
+    if chaves == [COLUNA_ID_EMPRESA]:
+        valor = base.set_index(chaves + ["Ano"])[medida].sort_index()
+    else:
+        valor = base.dropna(subset=chaves).groupby(chaves + ["Ano"], observed=True)[medida].sum(min_count=1)
+    entidade = valor.index.droplevel("Ano")
+    grupos = valor.groupby(entidade)
+    anos = pd.Series(valor.index.get_level_values("Ano"), index=valor.index)
+
+    seguido = anos.groupby(entidade).diff() == 1
+    anterior = grupos.shift(1).where(seguido)
+    variacao = valor - anterior
+    periodos = anos - anos.groupby(entidade).transform("first")
+    primeiro = grupos.transform(lambda serie: serie.iloc[0])
+    return pd.DataFrame({
+        "valor": valor,
+        "variacao": variacao,
+        "variacao_pct": (variacao / anterior.abs() * 100).where(anterior != 0),
+        "acumulado": valor.fillna(0).groupby(entidade).cumsum(),
+        "cagr": ((valor / primeiro) ** (1 / periodos) - 1).where((periodos > 0) & (primeiro > 0) & (valor > 0)) * 100,
+    })
+
+
+@pytest.mark.parametrize("nivel", list(NIVEIS))
+@pytest.mark.parametrize("medida", MEDIDAS)
+def test_variacoes_iguais_ao_groupby_shift(base, tabelas, nivel, medida):
+    tabela = tabelas[nivel]
+    esperado = _esperado(base, NIVEIS[nivel], medida)
+
+    for nome, partes in [
+        ("valor", tabela.valores),
+        ("variacao", tabela.variacao),
+        ("variacao_pct", tabela.variacao_pct),
+        ("acumulado", tabela.acumulado),
+        ("cagr", tabela.cagr),
+    ]:
+        # A tabela trabalha em centavos; a referência em float erra frações de centavo
+        np.testing.assert_allclose(
+            partes[medida].to_numpy(), esperado[nome].to_numpy(dtype=np.float64), rtol=1e-9, atol=1e-6, err_msg=nome
+        )
+
+
+def test_anos_com_lacuna_nao_tem_variacao():
+    somas = pd.DataFrame({
+        "Estado": ["DF", "DF", "DF", "SP", "SP"],
+        "Ano": [2020, 2021, 2023, 2022, 2023],
+        "lucros": em_centavos(pd.DataFrame({"lucros": [100.0, -50.0, 25.0, 10.0, 40.0]}))["lucros"],
+    })
+
+    tabela = TabelaVariacoes(["Estado"], somas, ["lucros"])
+
+    serie = tabela.serie("lucros", "DF")
+    assert serie["Ano"].tolist() == [2020, 2021, 2023]
+    np.testing.assert_array_equal(serie["variacao"], [np.nan, -150.0, np.nan])
+    np.testing.assert_array_equal(serie["variacao_pct"], [np.nan, -150.0, np.nan])
+    np.testing.assert_array_equal(serie["acumulado"], [100.0, 50.0, 75.0])
+    np.testing.assert_allclose(serie["cagr"], [np.nan, np.nan, (0.25 ** (1 / 3) - 1) * 100])
+
+    serie = tabela.serie("lucros", "SP")
+    np.testing.assert_array_equal(serie["variacao_pct"], [np.nan, 300.0])
+    np.testing.assert_allclose(serie["cagr"], [np.nan, 300.0])
+
+
+def test_ano_sem_valores_nao_vira_queda():
+    cubo = Cubo.a_partir_de(
+        pd.DataFrame({"Estado": ["DF", "DF", "DF"], "Ano": [2021, 2022, 2023], "lucros": [100.0, np.nan, 80.0]}),
+        dimensoes=["Estado", "Ano"],
+    )
+
+    serie = TabelaVariacoes(["Estado"], _somas_cubo(cubo, ["Estado"], ["lucros"]), ["lucros"]).serie("lucros", "DF")
+
+    assert pd.isna(serie["valor"].iloc[1])
+    assert serie["variacao_pct"].isna().all()
+
+
+def test_serie_de_entidade_inexistente(tabelas):
+    serie = tabelas["estado"].serie("lucros", "XX")
+
+    assert serie.empty
+    assert list(serie.columns) == ["Ano", "valor", "variacao", "variacao_pct", "acumulado", "cagr"]